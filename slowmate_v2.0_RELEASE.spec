@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('data', 'data')],
-    hiddenimports=['slowmate.engine', 'slowmate.uci.protocol', 'slowmate.core.board', 'slowmate.core.moves', 'slowmate.core.evaluate', 'slowmate.core.time_manager', 'slowmate.core.opening_book', 'slowmate.core.tablebase', 'slowmate.search.enhanced', 'chess'],
+    hiddenimports=['slowmate.engine', 'slowmate.uci.protocol', 'slowmate.core.board', 'slowmate.core.moves', 'slowmate.core.evaluate', 'slowmate.core.time_manager', 'slowmate.core.opening_book', 'slowmate.core.tablebase', 'slowmate.search.enhanced', 'slowmate.uci.worker', 'chess'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
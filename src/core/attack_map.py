@@ -0,0 +1,63 @@
+"""
+SlowMate Chess Engine - Attack Map Module
+Per-evaluation attack information shared by the evaluation terms
+Version: 1.0.0-BETA
+"""
+
+import chess
+
+# King zone per square: the king square plus every square a king there attacks
+from .table_cache import KING_ZONE_MASKS
+
+CENTER_MASK = chess.BB_D4 | chess.BB_E4 | chess.BB_D5 | chess.BB_E5
+EXTENDED_CENTER_MASK = (chess.BB_C3 | chess.BB_C4 | chess.BB_C5 | chess.BB_C6 |
+                        chess.BB_D3 | chess.BB_D6 | chess.BB_E3 | chess.BB_E6 |
+                        chess.BB_F3 | chess.BB_F4 | chess.BB_F5 | chess.BB_F6)
+
+KING_ATTACKER_TYPES = (chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN)
+
+
+class AttackMap:
+    """Attack information for one position, computed in a single pass.
+
+    All per-side lists are indexed by colour (``chess.WHITE``/``chess.BLACK``):
+
+    - ``piece_attacks[color]``: ``(square, piece_type, attack_mask)`` per piece
+    - ``attacks[color]``: union of every attack of that side
+    - ``king_zone_attacks[color]``: attacked squares in ``color``'s king zone,
+      summed over enemy pieces
+    - ``king_attackers[color]``: enemy knights/bishops/rooks/queens attacking
+      ``color``'s king square
+    """
+
+    __slots__ = ('piece_attacks', 'attacks', 'king_zone_attacks', 'king_attackers')
+
+    def __init__(self, board: chess.Board):
+        """Build the attack map for ``board``."""
+        self.piece_attacks = [[], []]
+        self.attacks = [0, 0]
+        self.king_zone_attacks = [0, 0]
+        self.king_attackers = [0, 0]
+
+        for color in chess.COLORS:
+            enemy_king = board.king(not color)
+            enemy_king_mask = chess.BB_SQUARES[enemy_king] if enemy_king is not None else 0
+            enemy_zone = KING_ZONE_MASKS[enemy_king] if enemy_king is not None else 0
+            pieces = self.piece_attacks[color]
+            side_attacks = 0
+            zone_attacks = 0
+            king_attackers = 0
+
+            for piece_type in chess.PIECE_TYPES:
+                for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    mask = board.attacks_mask(square)
+                    pieces.append((square, piece_type, mask))
+                    side_attacks |= mask
+                    if mask & enemy_zone:
+                        zone_attacks += chess.popcount(mask & enemy_zone)
+                        if mask & enemy_king_mask and piece_type in KING_ATTACKER_TYPES:
+                            king_attackers += 1
+
+            self.attacks[color] = side_attacks
+            self.king_zone_attacks[not color] = zone_attacks
+            self.king_attackers[not color] = king_attackers
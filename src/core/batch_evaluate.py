@@ -0,0 +1,143 @@
+"""
+SlowMate Chess Engine - Batch Evaluation Module
+Vectorized material, piece-square and pawn-structure evaluation for offline
+analysis and tuning jobs (requires NumPy)
+Version: 1.0.0-BETA
+"""
+
+import chess
+import numpy as np
+from typing import Iterable, Optional
+
+from . import eval_tables
+from .table_cache import PASSED_PAWN_MASKS, PST_EG, PST_MG
+
+
+# Plane order of the (N, 12, 64) encoding: white P N B R Q K, then black p n b r q k
+NUM_PLANES = 12
+
+
+def plane_index(piece_type: chess.PieceType, color: chess.Color) -> int:
+    """Return the plane holding pieces of ``piece_type`` and ``color``."""
+    return piece_type - 1 + (0 if color == chess.WHITE else 6)
+
+
+def encode_boards(boards: Iterable[chess.Board]) -> np.ndarray:
+    """Encode positions as a (N, 12, 64) uint8 occupancy array."""
+    boards = list(boards)
+    planes = np.zeros((len(boards), NUM_PLANES, 64), dtype=np.uint8)
+    for i, board in enumerate(boards):
+        for square, piece in board.piece_map().items():
+            planes[i, plane_index(piece.piece_type, piece.color), square] = 1
+    return planes
+
+
+def encode_bitboards(boards: Iterable[chess.Board]) -> np.ndarray:
+    """Encode positions as a (N, 12) uint64 array of piece bitboards."""
+    boards = list(boards)
+    bitboards = np.zeros((len(boards), NUM_PLANES), dtype='<u8')
+    for i, board in enumerate(boards):
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                bitboards[i, plane_index(piece_type, color)] = board.pieces_mask(piece_type, color)
+    return bitboards
+
+
+def bitboards_to_planes(bitboards: np.ndarray) -> np.ndarray:
+    """Unpack a (N, 12) uint64 bitboard array into (N, 12, 64) planes."""
+    bitboards = np.ascontiguousarray(bitboards, dtype='<u8')
+    bits = np.unpackbits(bitboards.view(np.uint8), bitorder='little')
+    return bits.reshape(bitboards.shape[0], NUM_PLANES, 64)
+
+
+class BatchEvaluator:
+    """NumPy evaluator for the material, PST and pawn-structure terms.
+
+    Scores match ``EnhancedEvaluator`` restricted to those terms (see
+    ``scalar_terms``), from White's perspective unless ``turn`` is given.
+    """
+
+    def __init__(self, weights: Optional[dict] = None):
+        """Precompute the per-plane weight matrices."""
+        self.weights = weights or {'piece_square': 0.8, 'pawn_structure': 0.6}
+
+        # Columns: material, phase, PST with middlegame king, PST with endgame king
+        term_matrix = np.zeros((NUM_PLANES, 64, 4))
+        for color in chess.COLORS:
+            sign = 1 if color == chess.WHITE else -1
+            for piece_type in chess.PIECE_TYPES:
+                plane = plane_index(piece_type, color)
+                term_matrix[plane, :, 0] = sign * eval_tables.PIECE_VALUES[piece_type]
+                term_matrix[plane, :, 1] = eval_tables.PHASE_MATERIAL[piece_type]
+                term_matrix[plane, :, 2] = sign * np.array(PST_MG[color][piece_type])
+                term_matrix[plane, :, 3] = sign * np.array(PST_EG[color][piece_type])
+        self.term_matrix = term_matrix.reshape(NUM_PLANES * 64, 4)
+
+        # front_span[color][pawn_square, square] = 1 when an enemy pawn on
+        # ``square`` stops a ``color`` pawn on ``pawn_square`` from being passed
+        self.front_span = [np.zeros((64, 64)) for _ in range(2)]
+        for color in chess.COLORS:
+            for square in chess.SQUARES:
+                for blocker in chess.scan_forward(PASSED_PAWN_MASKS[color][square]):
+                    self.front_span[color][square, blocker] = 1
+
+        ranks = np.arange(64) // 8
+        self.passed_bonus = [(6 - ranks) * 10, (ranks - 1) * 10]  # indexed by color
+
+    def evaluate(self, positions: np.ndarray, turn: Optional[np.ndarray] = None) -> np.ndarray:
+        """Score a batch of (N, 12, 64) planes or (N, 12) uint64 bitboards.
+
+        Args:
+            positions: Encoded positions
+            turn: Optional bool array (True = white to move); scores are then
+                returned from the side to move's perspective like ``evaluate``
+        """
+        if positions.ndim == 2:
+            positions = bitboards_to_planes(positions)
+        planes = positions.reshape(positions.shape[0], NUM_PLANES * 64).astype(np.float64)
+        material, phase, pst_mg, pst_eg = (planes @ self.term_matrix).T
+
+        # Same king table selection as EnhancedEvaluator (phase < 8 -> middlegame table)
+        phase = np.minimum(phase, 24)
+        pst = np.where(phase < 8, pst_mg, pst_eg) * self.weights['piece_square']
+
+        pawns = self._pawn_structure(positions) * self.weights['pawn_structure']
+
+        scores = material + pst + pawns
+        if turn is not None:
+            scores = np.where(turn, scores, -scores)
+        return scores
+
+    def _pawn_structure(self, positions: np.ndarray) -> np.ndarray:
+        """Doubled, isolated and passed pawn terms (White minus Black)."""
+        pawns = [positions[:, plane_index(chess.PAWN, color)].astype(np.float64)
+                 for color in (chess.BLACK, chess.WHITE)]  # indexed by color
+        score = np.zeros(positions.shape[0])
+
+        for color in chess.COLORS:
+            sign = 1 if color == chess.WHITE else -1
+            own = pawns[color]
+            file_counts = own.reshape(-1, 8, 8).sum(axis=1)  # (N, file)
+
+            doubled = np.maximum(file_counts - 1, 0).sum(axis=1)
+            occupied = file_counts > 0
+            neighbours = np.zeros_like(occupied)
+            neighbours[:, 1:] |= occupied[:, :-1]
+            neighbours[:, :-1] |= occupied[:, 1:]
+            isolated = (occupied & ~neighbours).sum(axis=1)
+
+            blockers = pawns[not color] @ self.front_span[color].T
+            passed = own * (blockers == 0)
+            passed_score = passed @ self.passed_bonus[color]
+
+            score += sign * (doubled * -20 + isolated * -15 + passed_score)
+
+        return score
+
+
+def scalar_terms(evaluator, board) -> float:
+    """Reference value of the batched terms using the scalar ``EnhancedEvaluator``."""
+    chess_board = board.board if hasattr(board, 'board') else board
+    _, material, pst = evaluator._material_and_pst(board)
+    pawns = evaluator._evaluate_pawn_structure(chess_board) * evaluator.weights['pawn_structure']
+    return material + pst + pawns
@@ -7,15 +7,68 @@ Version: 1.0.0-BETA
 import chess
 import chess.polyglot
 
+from .eval_tables import PIECE_VALUES, PHASE_MATERIAL
+from .table_cache import PST_MG, PST_EG
+
+
+# Zobrist keys in the polyglot layout, so ``Board.zobrist`` equals
+# ``chess.polyglot.zobrist_hash``; pieces indexed [color][piece_type][square]
+_POLYGLOT = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+ZOBRIST_PIECES = [[[_POLYGLOT[64 * ((piece_type - 1) * 2 + color) + square] if piece_type else 0
+                    for square in chess.SQUARES] for piece_type in range(7)]
+                  for color in (chess.BLACK, chess.WHITE)]
+ZOBRIST_CASTLING = ((chess.BB_H1, _POLYGLOT[768]), (chess.BB_A1, _POLYGLOT[769]),
+                    (chess.BB_H8, _POLYGLOT[770]), (chess.BB_A8, _POLYGLOT[771]))
+ZOBRIST_EP_FILE = _POLYGLOT[772:780]
+ZOBRIST_WHITE_TO_MOVE = _POLYGLOT[780]
+
+
+def zobrist_state_key(board: chess.Board) -> int:
+    """Zobrist key of everything but the pieces: castling, en passant file
+    (only when a pawn could capture there) and side to move."""
+    key = ZOBRIST_WHITE_TO_MOVE if board.turn else 0
+    if board.castling_rights:
+        rights = board.clean_castling_rights()
+        for square_bb, square_key in ZOBRIST_CASTLING:
+            if rights & square_bb:
+                key ^= square_key
+    ep_square = board.ep_square
+    if ep_square and chess.BB_PAWN_ATTACKS[not board.turn][ep_square] & board.pawns & board.occupied_co[board.turn]:
+        key ^= ZOBRIST_EP_FILE[ep_square & 7]
+    return key
+
 
 class Board:
-    """Chess board representation with enhanced functionality."""
+    """Chess board representation with enhanced functionality.
+
+    Besides wrapping ``chess.Board`` the wrapper keeps incrementally updated
+    evaluation accumulators, indexed by colour (``chess.WHITE``/``chess.BLACK``):
+
+    - ``material``: piece values (kings included) per side
+    - ``pst_mg`` / ``pst_eg``: raw piece-square sums using the middlegame or
+      endgame king table
+    - ``phase``: game-phase counter (24 = all minor/major pieces present)
+    - ``zobrist``: polyglot Zobrist key of the position (``piece_key`` holds
+      the piece part)
+
+    They are updated in ``make_move``/``unmake_move``. Moves pushed directly on
+    ``self.board`` (null moves excepted) bypass them; call ``refresh_accumulators``
+    afterwards. With ``debug_accumulators`` enabled every update is checked
+    against a from-scratch computation.
+
+    ``nnue`` optionally holds an NNUE ``Accumulator`` (see ``core.nnue``),
+    attached by ``NNUEEvaluator`` and updated alongside the other accumulators.
+    """
     
-    def __init__(self):
+    def __init__(self, debug_accumulators: bool = False):
         """Initialize a new chess board with starting position."""
         self.board = chess.Board()
         self._position_cache = {}  # Cache for evaluated positions
         self._phase = None  # Current game phase
+        self.debug_accumulators = debug_accumulators
+        self._accumulator_stack = []  # Saved accumulator states for unmake_move
+        self.nnue = None  # Optional NNUE accumulator
+        self.refresh_accumulators()
         
     def get_legal_moves(self):
         """Return list of legal moves in current position."""
@@ -23,15 +76,34 @@ class Board:
     
     def make_move(self, move):
         """Make a move on the board."""
+        self._accumulator_stack.append(
+            (self.material[:], self.pst_mg[:], self.pst_eg[:], self.phase, self.piece_key, self.zobrist)
+        )
+        if move:  # Null moves leave the accumulators untouched
+            self._update_accumulators(move)
+        if self.nnue is not None:
+            self.nnue.push(self.board, move)
         self.board.push(move)
+        self.zobrist = self.piece_key ^ zobrist_state_key(self.board)
         self._phase = None  # Reset phase cache
         self._position_cache = {}  # Reset evaluation cache
+        if self.debug_accumulators:
+            self.verify_accumulators()
         
     def unmake_move(self):
         """Take back the last move."""
         self.board.pop()
+        if self.nnue is not None:
+            self.nnue.pop()
+        if self._accumulator_stack:
+            (self.material, self.pst_mg, self.pst_eg, self.phase,
+             self.piece_key, self.zobrist) = self._accumulator_stack.pop()
+        else:
+            self.refresh_accumulators()
         self._phase = None  # Reset phase cache
         self._position_cache = {}  # Reset evaluation cache
+        if self.debug_accumulators:
+            self.verify_accumulators()
         
     def is_game_over(self):
         """Check if the game is over."""
@@ -52,6 +124,108 @@ class Board:
         self.board.set_fen(fen)
         self._phase = None  # Reset phase cache
         self._position_cache = {}  # Reset evaluation cache
+        self._accumulator_stack = []
+        self.refresh_accumulators()
+    
+    def refresh_accumulators(self):
+        """Recompute the evaluation accumulators from scratch."""
+        self.material, self.pst_mg, self.pst_eg, self.phase = self._compute_accumulators()
+        self.piece_key = self._compute_piece_key()
+        self.zobrist = self.piece_key ^ zobrist_state_key(self.board)
+        if self.nnue is not None:
+            self.nnue.refresh(self.board)
+    
+    def verify_accumulators(self):
+        """Assert that the incremental accumulators match a full recomputation."""
+        expected = self._compute_accumulators()
+        actual = (self.material, self.pst_mg, self.pst_eg, self.phase)
+        assert actual == expected, (
+            f"Accumulator mismatch in {self.board.fen()}: "
+            f"incremental={actual} scratch={expected}"
+        )
+        assert self.zobrist == chess.polyglot.zobrist_hash(self.board), (
+            f"Zobrist key mismatch in {self.board.fen()}"
+        )
+    
+    def _compute_accumulators(self):
+        """Compute (material, pst_mg, pst_eg, phase) by scanning the board."""
+        material = [0, 0]
+        pst_mg = [0, 0]
+        pst_eg = [0, 0]
+        phase = 0
+        for square, piece in self.board.piece_map().items():
+            color, piece_type = piece.color, piece.piece_type
+            material[color] += PIECE_VALUES[piece_type]
+            pst_mg[color] += PST_MG[color][piece_type][square]
+            pst_eg[color] += PST_EG[color][piece_type][square]
+            phase += PHASE_MATERIAL[piece_type]
+        return material, pst_mg, pst_eg, phase
+    
+    def _compute_piece_key(self):
+        """Zobrist key of the pieces, by scanning the board."""
+        key = 0
+        for square, piece in self.board.piece_map().items():
+            key ^= ZOBRIST_PIECES[piece.color][piece.piece_type][square]
+        return key
+    
+    def _update_accumulators(self, move):
+        """Apply the material/PST/phase deltas of ``move`` before it is pushed."""
+        board = self.board
+        us = board.turn
+        them = not us
+        from_square = move.from_square
+        to_square = move.to_square
+        piece_type = board.piece_type_at(from_square)
+        material = self.material
+        pst_mg = self.pst_mg
+        pst_eg = self.pst_eg
+        
+        if piece_type == chess.KING and board.is_castling(move):
+            # Castling moves the rook as well; python-chess may encode the
+            # king move as "king takes own rook" (chess960 style)
+            back_rank = chess.square_rank(from_square)
+            if board.is_kingside_castling(move):
+                king_to = chess.square(6, back_rank)
+                rook_to = chess.square(5, back_rank)
+            else:
+                king_to = chess.square(2, back_rank)
+                rook_to = chess.square(3, back_rank)
+            if board.piece_type_at(to_square) == chess.ROOK:
+                rook_from = to_square
+            else:
+                rook_from = chess.square(7 if king_to > from_square else 0, back_rank)
+            for table, acc in ((PST_MG, pst_mg), (PST_EG, pst_eg)):
+                own = table[us]
+                acc[us] += (own[chess.KING][king_to] - own[chess.KING][from_square]
+                            + own[chess.ROOK][rook_to] - own[chess.ROOK][rook_from])
+            keys = ZOBRIST_PIECES[us]
+            self.piece_key ^= (keys[chess.KING][from_square] ^ keys[chess.KING][king_to] ^
+                               keys[chess.ROOK][rook_from] ^ keys[chess.ROOK][rook_to])
+            return
+        
+        # Captured piece (en passant captures the pawn beside the target square)
+        if board.is_en_passant(move):
+            captured_square = chess.square(chess.square_file(to_square),
+                                           chess.square_rank(from_square))
+            captured_type = chess.PAWN
+        else:
+            captured_square = to_square
+            captured_type = board.piece_type_at(to_square)
+        if captured_type:
+            material[them] -= PIECE_VALUES[captured_type]
+            pst_mg[them] -= PST_MG[them][captured_type][captured_square]
+            pst_eg[them] -= PST_EG[them][captured_type][captured_square]
+            self.phase -= PHASE_MATERIAL[captured_type]
+            self.piece_key ^= ZOBRIST_PIECES[them][captured_type][captured_square]
+        
+        # Moving piece (replaced by the promotion piece on arrival)
+        placed_type = move.promotion or piece_type
+        if placed_type != piece_type:
+            material[us] += PIECE_VALUES[placed_type] - PIECE_VALUES[piece_type]
+            self.phase += PHASE_MATERIAL[placed_type] - PHASE_MATERIAL[piece_type]
+        pst_mg[us] += PST_MG[us][placed_type][to_square] - PST_MG[us][piece_type][from_square]
+        pst_eg[us] += PST_EG[us][placed_type][to_square] - PST_EG[us][piece_type][from_square]
+        self.piece_key ^= ZOBRIST_PIECES[us][piece_type][from_square] ^ ZOBRIST_PIECES[us][placed_type][to_square]
     
     def get_phase(self):
         """Get the current game phase."""
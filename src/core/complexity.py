@@ -0,0 +1,193 @@
+"""
+SlowMate Chess Engine - Complexity Module
+Position complexity for time allocation, estimated from bitboard features
+(attack maps, checking-square masks, king-zone pressure) instead of a legal
+move generation pass, and cached by position key
+Version: 1.0.0-BETA
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+import chess
+import chess.polyglot
+
+from .movegen import (BISHOP_ATTACKS, BISHOP_MASKS, KING_ATTACKS, KNIGHT_ATTACKS, LINE,
+                      NOT_FILE_A, NOT_FILE_H, ROOK_ATTACKS, ROOK_MASKS, _scan, check_info)
+from .table_cache import KING_ZONE_MASKS
+
+BB_ALL = chess.BB_ALL
+
+
+class ComplexityFeatures:
+    """Bitboard features of one position, counted for the side to move.
+
+    ``mobility``, ``captures`` and ``checks`` count pseudo-legal moves
+    (castling and en passant left out); ``attacked_pieces`` counts pieces of
+    either side standing on an enemy-attacked square and ``king_pressure``
+    the attacked king-zone squares, summed over the attackers of both sides.
+    """
+    __slots__ = ('mobility', 'captures', 'checks', 'attacked_pieces', 'king_pressure',
+                 'pieces', 'in_check')
+
+    def __init__(self, mobility: int, captures: int, checks: int, attacked_pieces: int,
+                 king_pressure: int, pieces: int, in_check: bool):
+        self.mobility = mobility
+        self.captures = captures
+        self.checks = checks
+        self.attacked_pieces = attacked_pieces
+        self.king_pressure = king_pressure
+        self.pieces = pieces
+        self.in_check = in_check
+
+    @property
+    def score(self) -> float:
+        """Overall complexity from 0.0 (quiet, simplified) to 1.0 (sharp).
+
+        The engine's time allocation weighting: material 0.3, moves 0.4,
+        in check 0.2, any capture 0.1 (tuned against its >0.7 / <0.3 cut-offs).
+        """
+        complexity = min(self.pieces / 32.0, 1.0) * 0.3
+        complexity += min(self.mobility / 40.0, 1.0) * 0.4
+        if self.in_check:
+            complexity += 0.2
+        if self.captures:
+            complexity += 0.1
+        return min(complexity, 1.0)
+
+    def __repr__(self):
+        return ("ComplexityFeatures(" +
+                ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__) + ")")
+
+
+def _piece_attacks(board: chess.Board, color: chess.Color, occupied: int):
+    """Yield (piece type, square, attacks) for every non-pawn piece of ``color``."""
+    ours = board.occupied_co[color]
+    for square in _scan(board.knights & ours):
+        yield chess.KNIGHT, square, KNIGHT_ATTACKS[square]
+    for square in _scan(board.bishops & ours):
+        yield chess.BISHOP, square, BISHOP_ATTACKS[square][occupied & BISHOP_MASKS[square]]
+    for square in _scan(board.rooks & ours):
+        yield chess.ROOK, square, ROOK_ATTACKS[square][occupied & ROOK_MASKS[square]]
+    for square in _scan(board.queens & ours):
+        yield chess.QUEEN, square, (BISHOP_ATTACKS[square][occupied & BISHOP_MASKS[square]] |
+                                    ROOK_ATTACKS[square][occupied & ROOK_MASKS[square]])
+    for square in _scan(board.kings & ours):
+        yield chess.KING, square, KING_ATTACKS[square]
+
+
+def _pawn_captures(pawns: int, color: chess.Color):
+    """Left and right pawn capture targets of ``pawns``."""
+    if color == chess.WHITE:
+        return (pawns & NOT_FILE_A) << 7, ((pawns & NOT_FILE_H) << 9) & BB_ALL
+    return (pawns & NOT_FILE_A) >> 9, (pawns & NOT_FILE_H) >> 7
+
+
+def complexity_features(board: chess.Board) -> ComplexityFeatures:
+    """Count the features of ``board`` (uncached; see ``ComplexityEstimator``)."""
+    us = board.turn
+    them = not us
+    occupied = board.occupied
+    occ_us = board.occupied_co[us]
+    occ_them = board.occupied_co[them]
+    empty = ~occupied & BB_ALL
+    our_king = (board.kings & occ_us).bit_length() - 1
+    their_king = (board.kings & occ_them).bit_length() - 1
+    our_zone = KING_ZONE_MASKS[our_king] if our_king >= 0 else 0
+    their_zone = KING_ZONE_MASKS[their_king] if their_king >= 0 else 0
+
+    mobility = captures = checks = pressure = 0
+    our_attacks = 0
+    if their_king >= 0:
+        masks, discoverers, _ = check_info(board)
+    else:
+        masks, discoverers = (0,) * 7, 0
+    for piece_type, square, attacks in _piece_attacks(board, us, occupied):
+        our_attacks |= attacks
+        targets = attacks & ~occ_us
+        mobility += bin(targets).count('1')
+        captures += bin(attacks & occ_them).count('1')
+        if discoverers >> square & 1:
+            checks += bin(targets & (masks[piece_type] | ~LINE[their_king][square])).count('1')
+        else:
+            checks += bin(targets & masks[piece_type]).count('1')
+        pressure += bin(attacks & their_zone).count('1')
+
+    # Pawns set-wise: pushes and both capture directions
+    pawns = board.pawns & occ_us
+    if us == chess.WHITE:
+        single = (pawns << 8) & empty
+        double = ((single & chess.BB_RANK_3) << 8) & empty
+    else:
+        single = (pawns >> 8) & empty
+        double = ((single & chess.BB_RANK_6) >> 8) & empty
+    left, right = _pawn_captures(pawns, us)
+    our_attacks |= left | right
+    captures += bin(left & occ_them).count('1') + bin(right & occ_them).count('1')
+    mobility += (bin(single).count('1') + bin(double).count('1') +
+                 bin(left & occ_them).count('1') + bin(right & occ_them).count('1'))
+    # Each promotion is four moves
+    mobility += 3 * (bin(single & chess.BB_BACKRANKS).count('1') +
+                     bin(left & occ_them & chess.BB_BACKRANKS).count('1') +
+                     bin(right & occ_them & chess.BB_BACKRANKS).count('1'))
+    pawn_checks = masks[chess.PAWN]
+    checks += (bin(single & pawn_checks).count('1') + bin(double & pawn_checks).count('1') +
+               bin(left & occ_them & pawn_checks).count('1') + bin(right & occ_them & pawn_checks).count('1'))
+    pressure += bin(left & their_zone).count('1') + bin(right & their_zone).count('1')
+
+    their_attacks = 0
+    for _, _, attacks in _piece_attacks(board, them, occupied):
+        their_attacks |= attacks
+        pressure += bin(attacks & our_zone).count('1')
+    left, right = _pawn_captures(board.pawns & occ_them, them)
+    their_attacks |= left | right
+    pressure += bin(left & our_zone).count('1') + bin(right & our_zone).count('1')
+
+    attacked_pieces = bin(our_attacks & occ_them).count('1') + bin(their_attacks & occ_us).count('1')
+    in_check = our_king >= 0 and bool(their_attacks >> our_king & 1)
+    return ComplexityFeatures(mobility, captures, checks, attacked_pieces, pressure,
+                              bin(occupied).count('1'), in_check)
+
+
+class ComplexityEstimator:
+    """LRU cache of ``ComplexityFeatures`` keyed by the polyglot Zobrist key.
+
+    ``Board.zobrist`` is that key, so callers holding a ``Board`` pass it
+    and skip hashing; a bare ``chess.Board`` is hashed here.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[int, ComplexityFeatures]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def features(self, board: chess.Board, key: Optional[int] = None) -> ComplexityFeatures:
+        """Features of ``board``, computed on the first request for ``key``."""
+        if key is None:
+            key = chess.polyglot.zobrist_hash(board)
+        features = self.entries.get(key)
+        if features is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return features
+        self.misses += 1
+        features = complexity_features(board)
+        self.entries[key] = features
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return features
+
+    def score(self, board: chess.Board, key: Optional[int] = None) -> float:
+        """Overall complexity of ``board`` from 0.0 to 1.0."""
+        return self.features(board, key).score
+
+    def clear(self):
+        """Drop all entries and statistics."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by the engines and the time manager
+COMPLEXITY = ComplexityEstimator()
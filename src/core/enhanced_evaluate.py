@@ -4,9 +4,30 @@ Advanced positional evaluation to compete at 650-750 ELO level
 """
 
 import chess
+import json
 from typing import Dict, List, Tuple, Optional
 import math
 
+from . import eval_tables
+from .attack_map import AttackMap, CENTER_MASK, EXTENDED_CENTER_MASK
+from .table_cache import PASSED_PAWN_MASKS
+
+
+# Weights files (see load_weights)
+WEIGHTS_FORMAT = 'slowmate-eval-weights'
+WEIGHTS_VERSION = 1
+PIECE_NAMES = {name: piece_type for piece_type, name in zip(chess.PIECE_TYPES, chess.PIECE_NAMES[1:])}
+TABLE_ATTRIBUTES = {
+    'pawn': 'pawn_table',
+    'knight': 'knight_table',
+    'bishop': 'bishop_table',
+    'rook': 'rook_table',
+    'queen': 'queen_table',
+    'king_middle': 'king_middle_table',
+    'king_end': 'king_end_table',
+}
+TABLE_NAMES = {attribute: name.upper() + '_TABLE' for name, attribute in TABLE_ATTRIBUTES.items()}
+
 
 class EnhancedEvaluator:
     """Enhanced evaluation function for SlowMate v2.2."""
@@ -14,92 +35,16 @@ class EnhancedEvaluator:
     def __init__(self):
         """Initialize the enhanced evaluator."""
         # Piece values (centipawns)
-        self.piece_values = {
-            chess.PAWN: 100,
-            chess.KNIGHT: 320,
-            chess.BISHOP: 330,
-            chess.ROOK: 500,
-            chess.QUEEN: 900,
-            chess.KING: 20000
-        }
+        self.piece_values = eval_tables.PIECE_VALUES
         
         # v2.2 ENHANCEMENT: Piece-square tables (from white's perspective)
-        self.pawn_table = [
-             0,  0,  0,  0,  0,  0,  0,  0,
-            78, 83, 86, 73, 102, 82, 85, 90,
-             7, 29, 21, 44, 40, 31, 44, 7,
-           -17,  16, -2, 15, 14, 0, 15, -13,
-           -26, 3, 10, 9, 6, 1, 0, -23,
-           -22, 9, 5, -11, -10, -2, 3, -19,
-           -31, 8, -7, -37, -36, -14, 3, -31,
-             0,  0,  0,  0,  0,  0,  0,  0
-        ]
-        
-        self.knight_table = [
-            -66, -53, -75, -75, -10, -55, -58, -70,
-            -3, -6, 100, -36, 4, 62, -4, -14,
-            10, 67, 1, 74, 73, 27, 62, -2,
-            24, 24, 45, 37, 33, 41, 25, 17,
-            -1, 5, 31, 21, 22, 35, 2, 0,
-            -18, 10, 13, 22, 18, 15, 11, -14,
-            -23, -15, 2, 0, 2, 0, -23, -20,
-            -74, -23, -26, -24, -19, -35, -22, -69
-        ]
-        
-        self.bishop_table = [
-            -59, -78, -82, -76, -23,-107, -37, -50,
-            -11, 20, 35, -42, -39, 31, 2, -22,
-            -9, 39, -32, 41, 52, -10, 28, -14,
-            25, 17, 20, 34, 26, 25, 15, 10,
-            13, 10, 17, 23, 17, 16, 0, 7,
-            14, 25, 24, 15, 8, 25, 20, 15,
-            19, 20, 11, 6, 7, 6, 20, 16,
-            -7, 2, -15, -12, -14, -15, -10, -10
-        ]
-        
-        self.rook_table = [
-            35, 29, 33, 4, 37, 33, 56, 50,
-            55, 29, 56, 67, 55, 62, 34, 60,
-            19, 35, 28, 33, 45, 27, 25, 15,
-             0, 5, 16, 13, 18, -4, -9, -6,
-           -28, -35, -16, -21, -13, -29, -46, -30,
-           -42, -28, -42, -25, -25, -35, -26, -46,
-           -53, -38, -31, -26, -29, -43, -44, -53,
-           -30, -24, -18, 5, -2, -18, -31, -32
-        ]
-        
-        self.queen_table = [
-            6, 1, -8,-104, 69, 24, 88, 26,
-            14, 32, 60, -10, 20, 76, 57, 24,
-            -2, 43, 32, 60, 72, 63, 43, 2,
-            1, -16, 22, 17, 25, 20, -13, -6,
-            -14, -15, -2, -5, -1, -10, -20, -22,
-            -30, -6, -13, -11, -16, -11, -16, -27,
-            -36, -18, 0, -19, -15, -15, -21, -38,
-            -39, -30, -31, -13, -31, -36, -34, -42
-        ]
-        
-        self.king_middle_table = [
-            4, 54, 47, -99, -99, 60, 83, -62,
-           -32, 10, 55, 56, 56, 55, 10, 3,
-           -62, 12, -57, 44, -67, 28, 37, -31,
-           -55, 50, 11, -4, -19, 13, 0, -49,
-           -55, -43, -52, -28, -51, -47, -8, -50,
-           -47, -42, -43, -79, -64, -32, -29, -32,
-            -4, 3, -14, -50, -57, -18, 13, 4,
-            17, 30, -3, -14, 6, -1, 40, 18
-        ]
-        
-        self.king_end_table = [
-           -74, -35, -18, -18, -11, 15, 4, -17,
-           -12, 17, 14, 17, 17, 38, 23, 11,
-            10, 17, 23, 15, 20, 45, 44, 13,
-            -8, 22, 24, 27, 26, 33, 26, 3,
-           -18, -4, 21, 24, 27, 23, 9, -11,
-           -19, -3, 11, 21, 23, 16, 7, -9,
-           -27, -11, 4, 13, 14, 4, -5, -17,
-           -53, -34, -21, -11, -28, -14, -24, -43
-        ]
+        self.pawn_table = eval_tables.PAWN_TABLE
+        self.knight_table = eval_tables.KNIGHT_TABLE
+        self.bishop_table = eval_tables.BISHOP_TABLE
+        self.rook_table = eval_tables.ROOK_TABLE
+        self.queen_table = eval_tables.QUEEN_TABLE
+        self.king_middle_table = eval_tables.KING_MIDDLE_TABLE
+        self.king_end_table = eval_tables.KING_END_TABLE
         
         # v2.2 ENHANCEMENT: Evaluation weights
         self.weights = {
@@ -111,49 +56,124 @@ class EnhancedEvaluator:
             'endgame_factor': 0.4
         }
         
+        # Pawn structure terms (passed pawn bonus indexed by relative rank)
+        self.doubled_pawn_penalty = -20
+        self.isolated_pawn_penalty = -15
+        self.passed_pawn_bonus = [(rank - 1) * 10 for rank in range(8)]
+        
+        # Material and PSTs can be read from the Board accumulators as long
+        # as they are the shared defaults (see load_weights)
+        self.use_board_accumulators = True
+        
         # v2.2 ENHANCEMENT: Game phase detection
-        self.phase_material = {
-            chess.PAWN: 0,
-            chess.KNIGHT: 1,
-            chess.BISHOP: 1,
-            chess.ROOK: 2,
-            chess.QUEEN: 4
+        self.phase_material = eval_tables.PHASE_MATERIAL
+        self.total_phase = eval_tables.TOTAL_PHASE
+        
+        # Lazy evaluation: the skipped positional terms stayed within 125cp on
+        # ~6000 game positions, so 200cp outside the window is a safe bound
+        self.lazy_margin = 200
+        self.lazy_verify_interval = 32  # Full-eval check of every Nth lazy skip (0 = off)
+        self.reset_lazy_stats()
+        
+    def reset_lazy_stats(self):
+        """Reset lazy evaluation counters."""
+        self.lazy_stats = {
+            'calls': 0,        # Evaluations with an alpha/beta window
+            'skips': 0,        # Returned material + PST only
+            'checked': 0,      # Skips verified against the full evaluation
+            'agreed': 0,       # Verified skips whose full score was also outside the window
+            'max_error': 0.0   # Largest |full - lazy| among verified skips
         }
-        self.total_phase = 24  # 4*Q + 4*R + 4*B + 4*N = 24
         
-    def evaluate(self, board) -> float:
-        """Enhanced evaluation function for v2.2."""
+    def load_weights(self, path: str):
+        """Load evaluation parameters from a JSON weights file.
+        
+        The file (as written by ``slowmate.tuning.texel``) may hold any of
+        ``piece_values``, ``piece_square_tables``, ``pawn_structure`` and
+        ``weights``; missing sections keep their current values. Raises
+        ``ValueError`` for an unknown format or malformed tables.
+        """
+        with open(path) as f:
+            data = json.load(f)
+        if data.get('format') != WEIGHTS_FORMAT or data.get('version') != WEIGHTS_VERSION:
+            raise ValueError(f"Unsupported weights file: {path}")
+        
+        piece_values = dict(self.piece_values)
+        for name, value in data.get('piece_values', {}).items():
+            if name not in PIECE_NAMES:
+                raise ValueError(f"Unknown piece '{name}' in {path}")
+            piece_values[PIECE_NAMES[name]] = int(value)
+        
+        tables = {}
+        for name, table in data.get('piece_square_tables', {}).items():
+            if name not in TABLE_ATTRIBUTES or len(table) != 64:
+                raise ValueError(f"Malformed piece-square table '{name}' in {path}")
+            tables[TABLE_ATTRIBUTES[name]] = [int(value) for value in table]
+        
+        pawn_structure = data.get('pawn_structure', {})
+        passed = pawn_structure.get('passed', self.passed_pawn_bonus)
+        if len(passed) != 8:
+            raise ValueError(f"Malformed passed pawn bonus in {path}")
+        
+        self.piece_values = piece_values
+        for attribute, table in tables.items():
+            setattr(self, attribute, table)
+        self.doubled_pawn_penalty = pawn_structure.get('doubled', self.doubled_pawn_penalty)
+        self.isolated_pawn_penalty = pawn_structure.get('isolated', self.isolated_pawn_penalty)
+        self.passed_pawn_bonus = list(passed)
+        self.weights.update(data.get('weights', {}))
+        self.use_board_accumulators = (
+            self.piece_values == eval_tables.PIECE_VALUES and
+            all(getattr(self, attribute) == list(getattr(eval_tables, table_name))
+                for attribute, table_name in TABLE_NAMES.items())
+        )
+        
+    def lazy_summary(self) -> str:
+        """One-line summary of lazy evaluation skip rate and agreement."""
+        stats = self.lazy_stats
+        skip_rate = stats['skips'] / max(stats['calls'], 1)
+        agreement = stats['agreed'] / max(stats['checked'], 1)
+        return (f"lazy eval skipped {stats['skips']}/{stats['calls']} ({skip_rate:.1%}), "
+                f"agreement {stats['agreed']}/{stats['checked']} ({agreement:.1%}), "
+                f"max error {stats['max_error']:.0f}cp")
+        
+    def evaluate(self, board, alpha: Optional[float] = None, beta: Optional[float] = None) -> float:
+        """Enhanced evaluation function for v2.2.
+        
+        If an ``alpha``/``beta`` window (side to move's perspective) is given
+        and material + PST alone lies more than ``lazy_margin`` outside it,
+        that partial score is returned without the positional terms.
+        """
         try:
-            if board.board.is_checkmate():
-                return -20000 if board.board.turn else 20000
-            
-            if board.board.is_stalemate() or board.board.is_insufficient_material():
+            # Pure static scoring: checkmate and stalemate are detected by the
+            # search from its own move list, never by generating moves here
+            if board.board.is_insufficient_material():
                 return 0
             
-            # Calculate game phase
-            phase = self._calculate_game_phase(board.board)
-            mg_score = 0  # Middle game score
-            eg_score = 0  # Endgame score
+            # Material, piece-square and phase terms
+            phase, material_score, pst_score = self._material_and_pst(board)
             
-            # Material and piece-square evaluation
-            for square in chess.SQUARES:
-                piece = board.board.piece_at(square)
-                if piece:
-                    color_factor = 1 if piece.color == chess.WHITE else -1
-                    
-                    # Material
-                    material_value = self.piece_values[piece.piece_type]
-                    mg_score += material_value * color_factor
-                    eg_score += material_value * color_factor
-                    
-                    # Piece-square tables
-                    pst_value = self._get_piece_square_value(piece, square, phase < 8)
-                    mg_score += pst_value * color_factor * self.weights['piece_square']
-                    eg_score += pst_value * color_factor * self.weights['piece_square']
+            if alpha is not None and beta is not None:
+                partial = material_score + pst_score
+                if board.board.turn == chess.BLACK:
+                    partial = -partial
+                self.lazy_stats['calls'] += 1
+                if partial - self.lazy_margin >= beta or partial + self.lazy_margin <= alpha:
+                    self.lazy_stats['skips'] += 1
+                    if self.lazy_verify_interval and \
+                       self.lazy_stats['skips'] % self.lazy_verify_interval == 0:
+                        self._verify_lazy_skip(board, partial, alpha, beta)
+                    return partial
+            
+            mg_score = material_score + pst_score  # Middle game score
+            eg_score = material_score + pst_score  # Endgame score
             
-            # v2.2 ENHANCEMENT: Positional factors
-            positional_mg = self._evaluate_positional_factors(board.board, True)
-            positional_eg = self._evaluate_positional_factors(board.board, False)
+            # v2.2 ENHANCEMENT: Positional factors (one attack map shared by all terms;
+            # the middlegame score only adds king safety)
+            attack_map = AttackMap(board.board)
+            positional_eg = self._evaluate_positional_factors(board.board, False, attack_map)
+            positional_mg = positional_eg + \
+                self._evaluate_king_safety(board.board, attack_map) * self.weights['king_safety']
             
             mg_score += positional_mg
             eg_score += positional_eg
@@ -179,6 +199,45 @@ class EnhancedEvaluator:
             except:
                 return 0
     
+    def evaluate_fast(self, board) -> float:
+        """Material + PST only, from the side to move's perspective."""
+        _, material_score, pst_score = self._material_and_pst(board)
+        score = material_score + pst_score
+        return score if board.board.turn == chess.WHITE else -score
+    
+    def _verify_lazy_skip(self, board, partial: float, alpha: float, beta: float):
+        """Compare a lazy result with the full evaluation for the statistics."""
+        full = self.evaluate(board)
+        stats = self.lazy_stats
+        stats['checked'] += 1
+        if (partial >= beta and full >= beta) or (partial <= alpha and full <= alpha):
+            stats['agreed'] += 1
+        stats['max_error'] = max(stats['max_error'], abs(full - partial))
+    
+    def _material_and_pst(self, board) -> Tuple[int, float, float]:
+        """Return (phase, material, weighted PST) from White's perspective.
+        
+        Reads the incremental accumulators kept by our ``Board`` wrapper and
+        falls back to scanning the position for anything else (or when
+        loaded weights differ from the tables the accumulators use).
+        """
+        if self.use_board_accumulators and hasattr(board, 'pst_mg'):
+            phase = min(board.phase, 24)
+            material = board.material[chess.WHITE] - board.material[chess.BLACK]
+            # Same king table selection as _get_piece_square_value(..., phase < 8)
+            pst = board.pst_mg if phase < 8 else board.pst_eg
+            return phase, material, (pst[chess.WHITE] - pst[chess.BLACK]) * self.weights['piece_square']
+        
+        chess_board = board.board if hasattr(board, 'board') else board
+        phase = self._calculate_game_phase(chess_board)
+        material = 0
+        pst = 0
+        for square, piece in chess_board.piece_map().items():
+            color_factor = 1 if piece.color == chess.WHITE else -1
+            material += self.piece_values[piece.piece_type] * color_factor
+            pst += self._get_piece_square_value(piece, square, phase < 8) * color_factor
+        return phase, material, pst * self.weights['piece_square']
+    
     def _calculate_game_phase(self, board: chess.Board) -> int:
         """Calculate the current game phase (0 = endgame, 24 = opening)."""
         phase = 0
@@ -211,8 +270,11 @@ class EnhancedEvaluator:
         
         return 0
     
-    def _evaluate_positional_factors(self, board: chess.Board, is_middlegame: bool) -> float:
+    def _evaluate_positional_factors(self, board: chess.Board, is_middlegame: bool,
+                                     attack_map: Optional[AttackMap] = None) -> float:
         """v2.2 ENHANCEMENT: Evaluate positional factors."""
+        if attack_map is None:
+            attack_map = AttackMap(board)
         score = 0
         
         # Pawn structure evaluation
@@ -220,16 +282,16 @@ class EnhancedEvaluator:
         
         # King safety (more important in middlegame)
         if is_middlegame:
-            score += self._evaluate_king_safety(board) * self.weights['king_safety']
+            score += self._evaluate_king_safety(board, attack_map) * self.weights['king_safety']
         
         # Piece activity
         score += self._evaluate_piece_activity(board) * self.weights['piece_activity']
         
         # Center control
-        score += self._evaluate_center_control(board) * 0.3
+        score += self._evaluate_center_control(board, attack_map) * 0.3
         
         # Mobility
-        score += self._evaluate_mobility(board) * 0.2
+        score += self._evaluate_mobility(board, attack_map) * 0.2
         
         return score
     
@@ -252,59 +314,30 @@ class EnhancedEvaluator:
                 
                 # Doubled pawns penalty
                 if pawn_count > 1:
-                    score += (pawn_count - 1) * -20 * color_factor
+                    score += (pawn_count - 1) * self.doubled_pawn_penalty * color_factor
                 
                 # Isolated pawns penalty
                 if (file_idx == 0 or files[file_idx - 1] == 0) and \
                    (file_idx == 7 or files[file_idx + 1] == 0):
-                    score += -15 * color_factor
+                    score += self.isolated_pawn_penalty * color_factor
             
             # Passed pawns bonus
             for pawn in pawns:
                 if self._is_passed_pawn(board, pawn, color):
                     rank = chess.square_rank(pawn)
-                    if color == chess.WHITE:
-                        bonus = (rank - 1) * 10
-                    else:
-                        bonus = (6 - rank) * 10
-                    score += bonus * color_factor
+                    relative_rank = rank if color == chess.WHITE else 7 - rank
+                    score += self.passed_pawn_bonus[relative_rank] * color_factor
         
         return score
     
     def _is_passed_pawn(self, board: chess.Board, pawn_square: int, color: chess.Color) -> bool:
         """Check if a pawn is passed."""
-        file = chess.square_file(pawn_square)
-        rank = chess.square_rank(pawn_square)
-        
-        # Check files (current and adjacent)
-        files_to_check = [file]
-        if file > 0:
-            files_to_check.append(file - 1)
-        if file < 7:
-            files_to_check.append(file + 1)
-        
-        opponent_color = not color
-        
-        for check_file in files_to_check:
-            if color == chess.WHITE:
-                # Check ranks ahead for white
-                for check_rank in range(rank + 1, 8):
-                    square = chess.square(check_file, check_rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == opponent_color:
-                        return False
-            else:
-                # Check ranks ahead for black
-                for check_rank in range(rank):
-                    square = chess.square(check_file, check_rank)
-                    piece = board.piece_at(square)
-                    if piece and piece.piece_type == chess.PAWN and piece.color == opponent_color:
-                        return False
-        
-        return True
-    
-    def _evaluate_king_safety(self, board: chess.Board) -> float:
+        return not PASSED_PAWN_MASKS[color][pawn_square] & board.pieces_mask(chess.PAWN, not color)
+
+    def _evaluate_king_safety(self, board: chess.Board, attack_map: Optional[AttackMap] = None) -> float:
         """Evaluate king safety."""
+        if attack_map is None:
+            attack_map = AttackMap(board)
         score = 0
         
         for color in [chess.WHITE, chess.BLACK]:
@@ -319,11 +352,12 @@ class EnhancedEvaluator:
             score += shield_score * color_factor
             
             # King exposure (number of attacking pieces)
-            attackers = 0
-            for piece_type in [chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT]:
-                attackers += len(board.attackers(not color, king_square) & board.pieces(piece_type, not color))
+            attackers = attack_map.king_attackers[color]
             
             score += -attackers * 10 * color_factor
+            
+            # Pressure on the king zone (enemy attacks on the king and its neighbours)
+            score += -attack_map.king_zone_attacks[color] * 3 * color_factor
         
         return score
     
@@ -404,45 +438,42 @@ class EnhancedEvaluator:
         else:
             return 0   # Closed file
     
-    def _evaluate_center_control(self, board: chess.Board) -> float:
+    def _evaluate_center_control(self, board: chess.Board, attack_map: Optional[AttackMap] = None) -> float:
         """Evaluate control of central squares."""
+        if attack_map is None:
+            attack_map = AttackMap(board)
         score = 0
-        center_squares = [chess.E4, chess.E5, chess.D4, chess.D5]
-        extended_center = [chess.C3, chess.C4, chess.C5, chess.C6,
-                          chess.D3, chess.D6, chess.E3, chess.E6,
-                          chess.F3, chess.F4, chess.F5, chess.F6]
-        
-        for square in center_squares:
-            white_attackers = len(board.attackers(chess.WHITE, square))
-            black_attackers = len(board.attackers(chess.BLACK, square))
-            score += (white_attackers - black_attackers) * 5
-            
-            # Bonus for pieces actually on central squares
-            piece = board.piece_at(square)
-            if piece and piece.piece_type != chess.KING:
-                score += 10 if piece.color == chess.WHITE else -10
         
-        for square in extended_center:
-            white_attackers = len(board.attackers(chess.WHITE, square))
-            black_attackers = len(board.attackers(chess.BLACK, square))
-            score += (white_attackers - black_attackers) * 2
+        # Attackers per square (5 per central, 2 per extended-center square)
+        for color in [chess.WHITE, chess.BLACK]:
+            color_factor = 1 if color == chess.WHITE else -1
+            for _, _, attacks in attack_map.piece_attacks[color]:
+                if attacks & CENTER_MASK:
+                    score += chess.popcount(attacks & CENTER_MASK) * 5 * color_factor
+                if attacks & EXTENDED_CENTER_MASK:
+                    score += chess.popcount(attacks & EXTENDED_CENTER_MASK) * 2 * color_factor
+        
+        # Bonus for pieces actually on central squares
+        central_pieces = board.occupied & ~board.kings & CENTER_MASK
+        score += chess.popcount(central_pieces & board.occupied_co[chess.WHITE]) * 10
+        score -= chess.popcount(central_pieces & board.occupied_co[chess.BLACK]) * 10
         
         return score
     
-    def _evaluate_mobility(self, board: chess.Board) -> float:
+    def _evaluate_mobility(self, board: chess.Board, attack_map: Optional[AttackMap] = None) -> float:
         """Evaluate piece mobility."""
+        if attack_map is None:
+            attack_map = AttackMap(board)
         score = 0
         
         for color in [chess.WHITE, chess.BLACK]:
             color_factor = 1 if color == chess.WHITE else -1
             mobility = 0
             
-            # Count legal moves (excluding king moves for speed)
-            for piece_type in [chess.QUEEN, chess.ROOK, chess.BISHOP, chess.KNIGHT]:
-                pieces = board.pieces(piece_type, color)
-                for piece_square in pieces:
-                    attacks = board.attacks(piece_square)
-                    mobility += len(attacks)
+            # Count attacked squares (excluding pawns and king for speed)
+            for _, piece_type, attacks in attack_map.piece_attacks[color]:
+                if piece_type != chess.PAWN and piece_type != chess.KING:
+                    mobility += chess.popcount(attacks)
             
             score += mobility * 0.5 * color_factor
         
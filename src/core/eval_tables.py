@@ -0,0 +1,135 @@
+"""
+SlowMate Chess Engine - Evaluation Tables Module
+Shared piece values, piece-square tables and game-phase weights
+Version: 1.0.0-BETA
+"""
+
+import chess
+
+
+# Piece values (centipawns)
+PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 20000
+}
+
+# Game phase weights (0 = endgame, 24 = opening)
+PHASE_MATERIAL = {
+    chess.PAWN: 0,
+    chess.KNIGHT: 1,
+    chess.BISHOP: 1,
+    chess.ROOK: 2,
+    chess.QUEEN: 4,
+    chess.KING: 0
+}
+TOTAL_PHASE = 24  # 4*Q + 4*R + 4*B + 4*N = 24
+
+# Piece-square tables (from white's perspective, flip with ``square ^ 56`` for black)
+PAWN_TABLE = [
+     0,  0,  0,  0,  0,  0,  0,  0,
+    78, 83, 86, 73, 102, 82, 85, 90,
+     7, 29, 21, 44, 40, 31, 44, 7,
+   -17,  16, -2, 15, 14, 0, 15, -13,
+   -26, 3, 10, 9, 6, 1, 0, -23,
+   -22, 9, 5, -11, -10, -2, 3, -19,
+   -31, 8, -7, -37, -36, -14, 3, -31,
+     0,  0,  0,  0,  0,  0,  0,  0
+]
+
+KNIGHT_TABLE = [
+    -66, -53, -75, -75, -10, -55, -58, -70,
+    -3, -6, 100, -36, 4, 62, -4, -14,
+    10, 67, 1, 74, 73, 27, 62, -2,
+    24, 24, 45, 37, 33, 41, 25, 17,
+    -1, 5, 31, 21, 22, 35, 2, 0,
+    -18, 10, 13, 22, 18, 15, 11, -14,
+    -23, -15, 2, 0, 2, 0, -23, -20,
+    -74, -23, -26, -24, -19, -35, -22, -69
+]
+
+BISHOP_TABLE = [
+    -59, -78, -82, -76, -23,-107, -37, -50,
+    -11, 20, 35, -42, -39, 31, 2, -22,
+    -9, 39, -32, 41, 52, -10, 28, -14,
+    25, 17, 20, 34, 26, 25, 15, 10,
+    13, 10, 17, 23, 17, 16, 0, 7,
+    14, 25, 24, 15, 8, 25, 20, 15,
+    19, 20, 11, 6, 7, 6, 20, 16,
+    -7, 2, -15, -12, -14, -15, -10, -10
+]
+
+ROOK_TABLE = [
+    35, 29, 33, 4, 37, 33, 56, 50,
+    55, 29, 56, 67, 55, 62, 34, 60,
+    19, 35, 28, 33, 45, 27, 25, 15,
+     0, 5, 16, 13, 18, -4, -9, -6,
+   -28, -35, -16, -21, -13, -29, -46, -30,
+   -42, -28, -42, -25, -25, -35, -26, -46,
+   -53, -38, -31, -26, -29, -43, -44, -53,
+   -30, -24, -18, 5, -2, -18, -31, -32
+]
+
+QUEEN_TABLE = [
+    6, 1, -8,-104, 69, 24, 88, 26,
+    14, 32, 60, -10, 20, 76, 57, 24,
+    -2, 43, 32, 60, 72, 63, 43, 2,
+    1, -16, 22, 17, 25, 20, -13, -6,
+    -14, -15, -2, -5, -1, -10, -20, -22,
+    -30, -6, -13, -11, -16, -11, -16, -27,
+    -36, -18, 0, -19, -15, -15, -21, -38,
+    -39, -30, -31, -13, -31, -36, -34, -42
+]
+
+KING_MIDDLE_TABLE = [
+    4, 54, 47, -99, -99, 60, 83, -62,
+   -32, 10, 55, 56, 56, 55, 10, 3,
+   -62, 12, -57, 44, -67, 28, 37, -31,
+   -55, 50, 11, -4, -19, 13, 0, -49,
+   -55, -43, -52, -28, -51, -47, -8, -50,
+   -47, -42, -43, -79, -64, -32, -29, -32,
+    -4, 3, -14, -50, -57, -18, 13, 4,
+    17, 30, -3, -14, 6, -1, 40, 18
+]
+
+KING_END_TABLE = [
+   -74, -35, -18, -18, -11, 15, 4, -17,
+   -12, 17, 14, 17, 17, 38, 23, 11,
+    10, 17, 23, 15, 20, 45, 44, 13,
+    -8, 22, 24, 27, 26, 33, 26, 3,
+   -18, -4, 21, 24, 27, 23, 9, -11,
+   -19, -3, 11, 21, 23, 16, 7, -9,
+   -27, -11, 4, 13, 14, 4, -5, -17,
+   -53, -34, -21, -11, -28, -14, -24, -43
+]
+
+
+def build_square_tables(king_table):
+    """Expand the PSTs into per-colour, per-square lookups.
+
+    Returns ``tables[color][piece_type][square]`` holding the raw PST value
+    for a piece standing on ``square`` (black squares already mirrored), using
+    ``king_table`` for the king.
+    """
+    piece_tables = {
+        chess.PAWN: PAWN_TABLE,
+        chess.KNIGHT: KNIGHT_TABLE,
+        chess.BISHOP: BISHOP_TABLE,
+        chess.ROOK: ROOK_TABLE,
+        chess.QUEEN: QUEEN_TABLE,
+        chess.KING: king_table
+    }
+    tables = [None, None]
+    for color in chess.COLORS:
+        per_piece = [[0] * 64]  # index 0 unused so piece types index directly
+        for piece_type in chess.PIECE_TYPES:
+            table = piece_tables[piece_type]
+            if color == chess.WHITE:
+                per_piece.append(list(table))
+            else:
+                per_piece.append([table[square ^ 56] for square in chess.SQUARES])
+        tables[color] = per_piece
+    return tables
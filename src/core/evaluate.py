@@ -29,6 +29,8 @@ class Evaluator:
         self.STALEMATE_SCORE = 0          # Draw score
         self.MOBILITY_WEIGHT = 5          # Lower weight for mobility (was too high)
         self.CENTER_CONTROL_WEIGHT = 15   # Reduced from 30 to balance with material
+        self.CENTRAL_SQUARES = ((chess.BB_FILE_C | chess.BB_FILE_D | chess.BB_FILE_E | chess.BB_FILE_F) &
+                                (chess.BB_RANK_3 | chess.BB_RANK_4 | chess.BB_RANK_5 | chess.BB_RANK_6))
         
         # Evaluation hierarchy weights (higher = more important)
         self.MATERIAL_WEIGHT = 1.0        # Base material value
@@ -43,7 +45,10 @@ class Evaluator:
 
         Args:
             board: Either a python-chess Board or our wrapper Board
-            material_only: If True, skip all non-material terms and terminal checks
+            material_only: If True, skip all non-material terms
+
+        The score is purely static: checkmate and stalemate are left to the
+        search, which already has the move list.
         """
         # Normalize to python-chess board
         board_obj = board.board if hasattr(board, 'board') else board
@@ -56,12 +61,8 @@ class Evaluator:
                                  for pt in self.piece_values)
             return white_material - black_material
 
-        # Terminal detection
-        if board_obj.is_checkmate():
-            ply_to_mate = len(board_obj.move_stack) + 1
-            mate_score = self.CHECKMATE_SCORE - ply_to_mate
-            return -mate_score
-        if board_obj.is_stalemate() or board_obj.is_insufficient_material():
+        # Dead draws need no move generation to detect
+        if board_obj.is_insufficient_material():
             return self.STALEMATE_SCORE
 
         # Material
@@ -100,35 +101,48 @@ class Evaluator:
         return score
         
     def _evaluate_mobility(self, board_obj):
-        """Evaluate piece mobility and control of key squares."""
-        original_turn = board_obj.turn
-        score = 0
+        """Evaluate piece mobility and control of key squares.
+
+        Mobility is counted from pseudo-legal attack bitboards (plus pawn
+        pushes) rather than legal move lists, so neither side's move list is
+        generated and ``board_obj.turn`` is never touched. Squares occupied by
+        own pieces or attacked by enemy pawns do not count.
+        """
+        white_mobility, white_central = self._side_mobility(board_obj, chess.WHITE)
+        black_mobility, black_central = self._side_mobility(board_obj, chess.BLACK)
         
-        try:
-            # Count white moves and central control
-            board_obj.turn = chess.WHITE
-            white_moves = list(board_obj.legal_moves)
-            white_mobility = len(white_moves)
-            white_central = sum(1 for m in white_moves if 2 <= chess.square_rank(m.to_square) <= 5 
-                              and 2 <= chess.square_file(m.to_square) <= 5)
-            
-            # Count black moves and central control
-            board_obj.turn = chess.BLACK
-            black_moves = list(board_obj.legal_moves)
-            black_mobility = len(black_moves)
-            black_central = sum(1 for m in black_moves if 2 <= chess.square_rank(m.to_square) <= 5 
-                              and 2 <= chess.square_file(m.to_square) <= 5)
-            
-            # Combine mobility and central control with proper weights
-            score = (white_mobility - black_mobility) * self.MOBILITY_WEIGHT
-            score += (white_central - black_central) * self.CENTER_CONTROL_WEIGHT
-            
-        finally:
-            # Always restore the original turn
-            board_obj.turn = original_turn
-            
+        # Combine mobility and central control with proper weights
+        score = (white_mobility - black_mobility) * self.MOBILITY_WEIGHT
+        score += (white_central - black_central) * self.CENTER_CONTROL_WEIGHT
         return score
         
+    def _side_mobility(self, board_obj, color):
+        """Return (mobility, central) square counts for one side."""
+        own = board_obj.occupied_co[color]
+        own_pawns = board_obj.pawns & own
+        enemy_pawns = board_obj.pawns & board_obj.occupied_co[not color]
+        
+        if color == chess.WHITE:
+            enemy_pawn_attacks = (((enemy_pawns & ~chess.BB_FILE_A) >> 9) |
+                                  ((enemy_pawns & ~chess.BB_FILE_H) >> 7))
+            pawn_pushes = (own_pawns << 8) & ~board_obj.occupied & chess.BB_ALL
+        else:
+            enemy_pawn_attacks = (((enemy_pawns & ~chess.BB_FILE_A) << 7) |
+                                  ((enemy_pawns & ~chess.BB_FILE_H) << 9)) & chess.BB_ALL
+            pawn_pushes = (own_pawns >> 8) & ~board_obj.occupied
+        safe = ~own & ~enemy_pawn_attacks & chess.BB_ALL
+        
+        targets = [pawn_pushes & safe]
+        for square in chess.scan_forward(own & ~own_pawns):
+            targets.append(board_obj.attacks_mask(square) & safe)
+            
+        mobility = 0
+        central = 0
+        for target in targets:
+            mobility += chess.popcount(target)
+            central += chess.popcount(target & self.CENTRAL_SQUARES)
+        return mobility, central
+        
     def _evaluate_king_safety(self, board_obj):
         """Evaluate king safety and attack potential."""
         def analyze_king_safety(color):
@@ -0,0 +1,460 @@
+"""
+SlowMate Chess Engine - Bitboard Move Generator
+Engine-internal move generation on python-chess bitboards: precomputed
+leaper tables, occupancy-indexed slider lookups, pin/check masks for
+legality and 16-bit encoded moves written into preallocated buffers
+Version: 1.0.0-BETA
+"""
+
+import chess
+from typing import List, Optional
+
+from .table_cache import TABLES, occupancy_subsets
+
+
+# ---------------------------------------------------------------------------
+# 16-bit move encoding: bits 0-5 from square, 6-11 to square, 12-15 flags
+# ---------------------------------------------------------------------------
+
+FLAG_QUIET = 0
+FLAG_DOUBLE_PUSH = 1
+FLAG_KING_CASTLE = 2
+FLAG_QUEEN_CASTLE = 3
+FLAG_CAPTURE = 4
+FLAG_EN_PASSANT = 5
+FLAG_PROMOTION = 8          # | promotion piece index (0 = knight .. 3 = queen)
+FLAG_PROMOTION_CAPTURE = 12
+
+CAPTURE_BIT = 0x4000
+PROMOTION_BIT = 0x8000
+NULL_MOVE = 0
+
+MAX_MOVES = 256  # Buffer size; no legal position has more than 218 moves
+
+
+def encode_move(from_square: int, to_square: int, flags: int = FLAG_QUIET) -> int:
+    """Pack a move into 16 bits."""
+    return from_square | (to_square << 6) | (flags << 12)
+
+
+def move_from(move: int) -> int:
+    return move & 63
+
+
+def move_to(move: int) -> int:
+    return (move >> 6) & 63
+
+
+def move_flags(move: int) -> int:
+    return move >> 12
+
+
+def move_is_capture(move: int) -> bool:
+    return bool(move & CAPTURE_BIT)
+
+
+def move_promotion(move: int) -> Optional[chess.PieceType]:
+    """Promotion piece type, or None."""
+    return ((move >> 12) & 3) + chess.KNIGHT if move & PROMOTION_BIT else None
+
+
+_chess_moves = {}
+
+
+def to_chess_move(move: int) -> chess.Move:
+    """Decode to a ``chess.Move`` (cached; castling uses the king's target square)."""
+    chess_move = _chess_moves.get(move)
+    if chess_move is None:
+        if move == NULL_MOVE:
+            chess_move = chess.Move.null()
+        else:
+            chess_move = chess.Move(move & 63, (move >> 6) & 63,
+                                    ((move >> 12) & 3) + chess.KNIGHT if move & PROMOTION_BIT else None)
+        _chess_moves[move] = chess_move
+    return chess_move
+
+
+def encode_chess_move(board: chess.Board, move: chess.Move) -> int:
+    """Encode a ``chess.Move`` that is about to be played on ``board``."""
+    if not move:
+        return NULL_MOVE
+    from_square, to_square = move.from_square, move.to_square
+    flags = FLAG_QUIET
+    if board.is_castling(move):
+        kingside = board.is_kingside_castling(move)
+        to_square = chess.square(6 if kingside else 2, chess.square_rank(from_square))
+        flags = FLAG_KING_CASTLE if kingside else FLAG_QUEEN_CASTLE
+    elif board.is_en_passant(move):
+        flags = FLAG_EN_PASSANT
+    else:
+        if board.occupied_co[not board.turn] & chess.BB_SQUARES[to_square]:
+            flags = FLAG_CAPTURE
+        if move.promotion:
+            flags |= FLAG_PROMOTION | (move.promotion - chess.KNIGHT)
+        elif board.pawns & chess.BB_SQUARES[from_square] and abs(to_square - from_square) == 16:
+            flags = FLAG_DOUBLE_PUSH
+    return encode_move(from_square, to_square, flags)
+
+
+# ---------------------------------------------------------------------------
+# Attack tables
+# ---------------------------------------------------------------------------
+
+def _slider_dicts(masks, flat_attacks) -> List[dict]:
+    """Occupancy-indexed attack dicts: ``table[square][occupied & mask[square]]``."""
+    tables = []
+    offset = 0
+    for square in chess.SQUARES:
+        subsets = list(occupancy_subsets(masks[square]))
+        tables.append(dict(zip(subsets, flat_attacks[offset:offset + len(subsets)])))
+        offset += len(subsets)
+    return tables
+
+
+KNIGHT_ATTACKS = list(TABLES.knight_attacks)
+KING_ATTACKS = list(TABLES.king_attacks)
+PAWN_ATTACKS = [list(TABLES.pawn_attacks[chess.BLACK]), list(TABLES.pawn_attacks[chess.WHITE])]
+ROOK_MASKS = list(TABLES.rook_masks)
+BISHOP_MASKS = list(TABLES.bishop_masks)
+ROOK_ATTACKS = _slider_dicts(ROOK_MASKS, TABLES.rook_attacks)
+BISHOP_ATTACKS = _slider_dicts(BISHOP_MASKS, TABLES.bishop_attacks)
+ROOK_RAYS = [ROOK_ATTACKS[square][0] for square in chess.SQUARES]  # Empty-board attacks
+BISHOP_RAYS = [BISHOP_ATTACKS[square][0] for square in chess.SQUARES]
+BETWEEN = [list(row) for row in TABLES.between]
+LINE = [list(row) for row in TABLES.line]
+
+BB_SQUARES = chess.BB_SQUARES
+BB_RANK_3 = chess.BB_RANK_3
+BB_RANK_6 = chess.BB_RANK_6
+BB_BACKRANKS = chess.BB_BACKRANKS
+NOT_FILE_A = ~chess.BB_FILE_A & chess.BB_ALL
+NOT_FILE_H = ~chess.BB_FILE_H & chess.BB_ALL
+BB_ALL = chess.BB_ALL
+
+# Castling: (king from, king to, rook square, squares that must be empty,
+# squares the king crosses, flag) per colour and side
+CASTLING = {
+    chess.WHITE: ((chess.E1, chess.G1, chess.H1, chess.BB_F1 | chess.BB_G1, (chess.F1, chess.G1), FLAG_KING_CASTLE),
+                  (chess.E1, chess.C1, chess.A1, chess.BB_B1 | chess.BB_C1 | chess.BB_D1, (chess.D1, chess.C1),
+                   FLAG_QUEEN_CASTLE)),
+    chess.BLACK: ((chess.E8, chess.G8, chess.H8, chess.BB_F8 | chess.BB_G8, (chess.F8, chess.G8), FLAG_KING_CASTLE),
+                  (chess.E8, chess.C8, chess.A8, chess.BB_B8 | chess.BB_C8 | chess.BB_D8, (chess.D8, chess.C8),
+                   FLAG_QUEEN_CASTLE)),
+}
+
+
+def _scan(bb: int):
+    """Yield the squares of ``bb`` from low to high."""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+def attackers_mask(board: chess.Board, color: chess.Color, square: int, occupied: int) -> int:
+    """Pieces of ``color`` attacking ``square`` given ``occupied``."""
+    return (((KNIGHT_ATTACKS[square] & board.knights) |
+             (KING_ATTACKS[square] & board.kings) |
+             (PAWN_ATTACKS[not color][square] & board.pawns) |
+             (ROOK_ATTACKS[square][occupied & ROOK_MASKS[square]] & (board.rooks | board.queens)) |
+             (BISHOP_ATTACKS[square][occupied & BISHOP_MASKS[square]] & (board.bishops | board.queens)))
+            & board.occupied_co[color])
+
+
+# ---------------------------------------------------------------------------
+# Move info: per-node facts about a move, packed above its 16 bits
+# ---------------------------------------------------------------------------
+
+INFO_MOVE_MASK = 0xFFFF
+INFO_ATTACKER_SHIFT = 16   # Moving piece type (1-6)
+INFO_VICTIM_SHIFT = 19     # Captured piece type (0: none or en passant)
+INFO_CHECK_BIT = 1 << 22   # Move gives check (only with ``checks=True``)
+
+
+def check_info(board: chess.Board) -> tuple:
+    """Squares from which each piece type of the side to move checks the enemy
+    king, our pieces whose move can uncover a check, and that king's square."""
+    us = board.turn
+    occ_us = board.occupied_co[us]
+    occupied = board.occupied
+    king = (board.kings & board.occupied_co[not us]).bit_length() - 1
+    bishop = BISHOP_ATTACKS[king][occupied & BISHOP_MASKS[king]]
+    rook = ROOK_ATTACKS[king][occupied & ROOK_MASKS[king]]
+    masks = (0, PAWN_ATTACKS[not us][king], KNIGHT_ATTACKS[king], bishop, rook, bishop | rook, 0)
+    discoverers = 0
+    snipers = ((ROOK_RAYS[king] & (board.rooks | board.queens)) |
+               (BISHOP_RAYS[king] & (board.bishops | board.queens))) & occ_us
+    for sniper in _scan(snipers):
+        blockers = BETWEEN[king][sniper] & occupied
+        if blockers and not blockers & (blockers - 1) and blockers & occ_us:
+            discoverers |= blockers
+    return masks, discoverers, king
+
+
+def gives_check(board: chess.Board, move: int, info: tuple, piece_type: Optional[int] = None) -> bool:
+    """True if the pseudo-legal ``move`` checks the enemy king (``info`` from
+    ``check_info``); ``piece_type`` is the mover if already known."""
+    masks, discoverers, king = info
+    from_square = move & 63
+    to_square = (move >> 6) & 63
+    flags = move >> 12
+    if flags in (FLAG_KING_CASTLE, FLAG_QUEEN_CASTLE, FLAG_EN_PASSANT):
+        return board.gives_check(to_chess_move(move))  # Rare; let python-chess replay it
+    if discoverers & BB_SQUARES[from_square] and not LINE[king][from_square] & BB_SQUARES[to_square]:
+        return True
+    if move & PROMOTION_BIT:
+        # The vacated square can open the promoted piece's line, so look again
+        occupied = board.occupied ^ BB_SQUARES[from_square]
+        attacks = (KNIGHT_ATTACKS[to_square], BISHOP_ATTACKS[to_square][occupied & BISHOP_MASKS[to_square]],
+                   ROOK_ATTACKS[to_square][occupied & ROOK_MASKS[to_square]])
+        promotion = (flags & 3) + chess.KNIGHT
+        if promotion == chess.QUEEN:
+            return bool((attacks[1] | attacks[2]) & BB_SQUARES[king])
+        return bool(attacks[promotion - chess.KNIGHT] & BB_SQUARES[king])
+    if piece_type is None:
+        piece_type = board.piece_type_at(from_square)
+    return bool(masks[piece_type] & BB_SQUARES[to_square])
+
+
+def move_infos(board: chess.Board, moves: List[int], checks: bool = False) -> List[int]:
+    """Pack each move with its mover, victim and (optionally) check flag.
+
+    Computed once per node and shared by ordering, reductions and the
+    cutoff bookkeeping; ``info & INFO_MOVE_MASK`` recovers the move.
+    """
+    piece_type_at = board.piece_type_at
+    info = check_info(board) if checks else None
+    result = []
+    for move in moves:
+        attacker = piece_type_at(move & 63)
+        record = move | (attacker << INFO_ATTACKER_SHIFT)
+        if move & CAPTURE_BIT:
+            victim = piece_type_at((move >> 6) & 63)
+            if victim:
+                record |= victim << INFO_VICTIM_SHIFT
+        if checks and gives_check(board, move, info, attacker):
+            record |= INFO_CHECK_BIT
+        result.append(record)
+    return result
+
+
+class BitboardMoveGenerator:
+    """Move generator for ``chess.Board`` positions (standard chess castling).
+
+    ``generate`` writes encoded moves into a caller-provided buffer and
+    returns their count. After a call, ``checkers``, ``pinned`` and
+    ``king_square`` describe the position, and ``is_legal`` can validate the
+    pseudo-legal moves produced with ``legal=False`` (only pinned pieces,
+    king moves and en passant need the test; evasions from check are always
+    generated legal).
+    """
+
+    def __init__(self):
+        """Allocate per-ply move buffers for ``perft`` and the search."""
+        self.buffers = [[0] * MAX_MOVES for _ in range(128)]
+        self.checkers = 0
+        self.pinned = 0
+        self.pin_lines = {}
+        self.king_square = None
+
+    def generate(self, board: chess.Board, buffer: List[int], captures_only: bool = False,
+                 legal: bool = True) -> int:
+        """Fill ``buffer`` with the moves of ``board``; return how many."""
+        us = board.turn
+        them = not us
+        occ_us = board.occupied_co[us]
+        occ_them = board.occupied_co[them]
+        occupied = occ_us | occ_them
+        kings = board.kings & occ_us
+        king = kings.bit_length() - 1
+        their_rq = (board.rooks | board.queens) & occ_them
+        their_bq = (board.bishops | board.queens) & occ_them
+        n = 0
+
+        # Checkers and pinned pieces
+        checkers = ((KNIGHT_ATTACKS[king] & board.knights) |
+                    (PAWN_ATTACKS[us][king] & board.pawns) |
+                    (ROOK_ATTACKS[king][occupied & ROOK_MASKS[king]] & their_rq) |
+                    (BISHOP_ATTACKS[king][occupied & BISHOP_MASKS[king]] & their_bq)) & occ_them
+        pinned = 0
+        pin_lines = {}
+        for sniper in _scan((ROOK_RAYS[king] & their_rq) | (BISHOP_RAYS[king] & their_bq)):
+            blockers = BETWEEN[king][sniper] & occupied
+            if blockers and not blockers & (blockers - 1) and blockers & occ_us:
+                pinned |= blockers
+                pin_lines[blockers] = LINE[king][sniper]
+        self.checkers = checkers
+        self.pinned = pinned
+        self.pin_lines = pin_lines
+        self.king_square = king
+
+        if checkers:
+            legal = True  # Evasions are few; always generate them exactly
+        targets = occ_them if captures_only else ~occ_us & BB_ALL
+
+        # King moves (tested with the king lifted so it cannot hide behind itself)
+        king_targets = KING_ATTACKS[king] & targets
+        if king_targets:
+            without_king = occupied ^ kings
+            for to in _scan(king_targets):
+                if legal and attackers_mask(board, them, to, without_king):
+                    continue
+                buffer[n] = king | (to << 6) | (0x4000 if occ_them & BB_SQUARES[to] else 0)
+                n += 1
+
+        if checkers & (checkers - 1):
+            return n  # Double check: only the king may move
+
+        if checkers:
+            checker = checkers.bit_length() - 1
+            targets &= BETWEEN[king][checker] | checkers
+        elif not captures_only and board.castling_rights & BB_BACKRANKS:
+            n = self._castling(board, us, occupied, buffer, n)
+
+        # Knights (a pinned knight can never move)
+        knights = board.knights & occ_us
+        if legal:
+            knights &= ~pinned
+        for from_square in _scan(knights):
+            for to in _scan(KNIGHT_ATTACKS[from_square] & targets):
+                buffer[n] = from_square | (to << 6) | (0x4000 if occ_them & BB_SQUARES[to] else 0)
+                n += 1
+
+        # Sliders
+        for from_square in _scan((board.bishops | board.queens) & occ_us):
+            attacks = BISHOP_ATTACKS[from_square][occupied & BISHOP_MASKS[from_square]] & targets
+            if legal and pinned & BB_SQUARES[from_square]:
+                attacks &= pin_lines[BB_SQUARES[from_square]]
+            for to in _scan(attacks):
+                buffer[n] = from_square | (to << 6) | (0x4000 if occ_them & BB_SQUARES[to] else 0)
+                n += 1
+        for from_square in _scan((board.rooks | board.queens) & occ_us):
+            attacks = ROOK_ATTACKS[from_square][occupied & ROOK_MASKS[from_square]] & targets
+            if legal and pinned & BB_SQUARES[from_square]:
+                attacks &= pin_lines[BB_SQUARES[from_square]]
+            for to in _scan(attacks):
+                buffer[n] = from_square | (to << 6) | (0x4000 if occ_them & BB_SQUARES[to] else 0)
+                n += 1
+
+        # Pawns, set-wise
+        pawns = board.pawns & occ_us
+        if us == chess.WHITE:
+            forward, left, right = 8, 7, 9
+            single = (pawns << 8) & ~occupied & BB_ALL
+            double = ((single & BB_RANK_3) << 8) & ~occupied
+            left_captures = ((pawns & NOT_FILE_A) << 7) & occ_them
+            right_captures = ((pawns & NOT_FILE_H) << 9) & occ_them
+        else:
+            forward, left, right = -8, -9, -7
+            single = (pawns >> 8) & ~occupied
+            double = ((single & BB_RANK_6) >> 8) & ~occupied
+            left_captures = ((pawns & NOT_FILE_A) >> 9) & occ_them
+            right_captures = ((pawns & NOT_FILE_H) >> 7) & occ_them
+
+        if captures_only:
+            pushes = ()
+        else:
+            pushes = ((single, forward, FLAG_QUIET), (double, 2 * forward, FLAG_DOUBLE_PUSH))
+        for destinations, step, flags in pushes + ((left_captures, left, FLAG_CAPTURE),
+                                                   (right_captures, right, FLAG_CAPTURE)):
+            for to in _scan(destinations & targets):
+                from_square = to - step
+                if legal and pinned & BB_SQUARES[from_square] and \
+                   not pin_lines[BB_SQUARES[from_square]] & BB_SQUARES[to]:
+                    continue
+                move = from_square | (to << 6) | (flags << 12)
+                if BB_SQUARES[to] & BB_BACKRANKS:
+                    promotion = move | 0x8000
+                    buffer[n] = promotion | 0x3000  # Queen first
+                    buffer[n + 1] = promotion
+                    buffer[n + 2] = promotion | 0x1000
+                    buffer[n + 3] = promotion | 0x2000
+                    n += 4
+                else:
+                    buffer[n] = move
+                    n += 1
+
+        # En passant, verified by replaying the capture on the occupancy
+        ep_square = board.ep_square
+        if ep_square is not None:
+            captured = ep_square - forward
+            if not checkers or checkers & BB_SQUARES[captured] or targets & BB_SQUARES[ep_square]:
+                for from_square in _scan(PAWN_ATTACKS[them][ep_square] & pawns):
+                    if legal and not self._ep_is_legal(board, from_square, ep_square, captured, occupied):
+                        continue
+                    buffer[n] = from_square | (ep_square << 6) | (FLAG_EN_PASSANT << 12)
+                    n += 1
+
+        return n
+
+    def _castling(self, board: chess.Board, us: chess.Color, occupied: int, buffer: List[int], n: int) -> int:
+        """Append legal castling moves (the caller checked we are not in check)."""
+        rooks = board.rooks & board.occupied_co[us]
+        for king_from, king_to, rook_square, empty, crossed, flag in CASTLING[us]:
+            if not board.castling_rights & BB_SQUARES[rook_square] or not rooks & BB_SQUARES[rook_square] or \
+               not board.kings & BB_SQUARES[king_from] or occupied & empty:
+                continue
+            if any(attackers_mask(board, not us, square, occupied) for square in crossed):
+                continue
+            buffer[n] = king_from | (king_to << 6) | (flag << 12)
+            n += 1
+        return n
+
+    def _ep_is_legal(self, board: chess.Board, from_square: int, to_square: int, captured: int,
+                     occupied: int, king: Optional[int] = None) -> bool:
+        """True if the en passant capture does not leave our king attacked."""
+        us = board.turn
+        if king is None:
+            king = self.king_square
+        occupied = (occupied ^ BB_SQUARES[from_square] ^ BB_SQUARES[captured]) | BB_SQUARES[to_square]
+        them = board.occupied_co[not us] & ~BB_SQUARES[captured]
+        return not ((ROOK_ATTACKS[king][occupied & ROOK_MASKS[king]] & (board.rooks | board.queens) & them) or
+                    (BISHOP_ATTACKS[king][occupied & BISHOP_MASKS[king]] & (board.bishops | board.queens) & them) or
+                    (KNIGHT_ATTACKS[king] & board.knights & them) or
+                    (PAWN_ATTACKS[us][king] & board.pawns & them))
+
+    def pin_state(self) -> tuple:
+        """Snapshot of what ``is_legal`` needs, for callers that recurse between
+        generating a position's moves and trying them."""
+        return self.king_square, self.pinned, self.pin_lines
+
+    def is_legal(self, board: chess.Board, move: int, pins: Optional[tuple] = None) -> bool:
+        """Legality of a move from ``generate(board, ..., legal=False)``; ``pins``
+        is that call's ``pin_state()`` (default: the last call)."""
+        king, pinned, pin_lines = pins if pins is not None else self.pin_state()
+        from_square = move & 63
+        to_square = (move >> 6) & 63
+        if from_square == king:
+            if (move >> 12) in (FLAG_KING_CASTLE, FLAG_QUEEN_CASTLE):
+                return True  # Castling is generated fully checked
+            occupied = board.occupied ^ BB_SQUARES[from_square]
+            return not attackers_mask(board, not board.turn, to_square, occupied)
+        if (move >> 12) == FLAG_EN_PASSANT:
+            captured = to_square - 8 if board.turn == chess.WHITE else to_square + 8
+            return self._ep_is_legal(board, from_square, to_square, captured, board.occupied, king)
+        from_bb = BB_SQUARES[from_square]
+        if pinned & from_bb:
+            return bool(pin_lines[from_bb] & BB_SQUARES[to_square])
+        return True
+
+    def generate_list(self, board: chess.Board, captures_only: bool = False) -> List[int]:
+        """Convenience wrapper returning a fresh list of legal encoded moves."""
+        buffer = [0] * MAX_MOVES
+        return buffer[:self.generate(board, buffer, captures_only)]
+
+    def perft(self, board: chess.Board, depth: int) -> int:
+        """Count leaf nodes to ``depth`` (bulk-counted at the last ply)."""
+        if depth <= 0:
+            return 1
+        buffer = self.buffers[depth]
+        count = self.generate(board, buffer)
+        if depth == 1:
+            return count
+        nodes = 0
+        push = board.push
+        pop = board.pop
+        for i in range(count):
+            push(to_chess_move(buffer[i]))
+            nodes += self.perft(board, depth - 1)
+            pop()
+        return nodes
@@ -6,6 +6,8 @@ Version: 1.0.0-BETA
 
 import chess
 
+from .movegen import BitboardMoveGenerator, MAX_MOVES, check_info, encode_chess_move, gives_check
+
 
 class MoveGenerator:
     """Handles move generation and basic move ordering."""
@@ -21,15 +23,40 @@ class MoveGenerator:
             chess.QUEEN: 900,
             chess.KING: 20000
         }
+        self.bitboard = BitboardMoveGenerator()
+        self._buffer = [0] * MAX_MOVES
         
     def get_legal_moves(self):
         """Get list of legal moves in current position."""
         return self.board.get_legal_moves()
         
+    def get_encoded_legal_moves(self):
+        """Get legal moves as 16-bit encoded ints (see ``core.movegen``), in
+        python-chess order so equally scored root moves keep their order."""
+        board = self.board.board
+        return [encode_chess_move(board, move) for move in board.legal_moves]
+        
+    def get_pseudo_legal_moves(self, captures_only=False):
+        """Get encoded pseudo-legal moves and the pin state needed to test them.
+        
+        Only king moves, en passant and moves of pinned pieces can be illegal
+        (evasions from check are always generated legal), so the search checks
+        each move with ``is_legal`` when it is tried instead of filtering the
+        whole list up front.
+        """
+        count = self.bitboard.generate(self.board.board, self._buffer, captures_only, legal=False)
+        return self._buffer[:count], self.bitboard.pin_state()
+        
+    def is_legal(self, move, pins):
+        """Check an encoded move from ``get_pseudo_legal_moves`` against its pin state."""
+        return self.bitboard.is_legal(self.board.board, move, pins)
+        
     def get_ordered_moves(self):
         """Get legal moves with basic ordering for better search efficiency."""
         moves = self.get_legal_moves()
         scored_moves = []
+        check = check_info(self.board.board)
+        opening = self.board.get_phase() == 'opening'
         
         for move in moves:
             # Special case: pawn captures queen gets highest priority
@@ -43,15 +70,19 @@ class MoveGenerator:
                     continue
                     
             # Normal move scoring
-            score = self._score_move(move)
+            score = self._score_move(move, check, opening)
             scored_moves.append((move, score))
             
         # Sort moves by score, highest first
         scored_moves.sort(key=lambda x: x[1], reverse=True)
         return [move for move, _ in scored_moves]
         
-    def _score_move(self, move):
-        """Score moves for ordering based on likely quality."""
+    def _score_move(self, move, check=None, opening=None):
+        """Score moves for ordering based on likely quality.
+        
+        ``check`` (from ``check_info``) and ``opening`` are per-position and
+        computed here when the caller does not pass them.
+        """
         # Move scoring constants
         QUEEN_PROMOTION = 100000    # Highest regular priority
         CAPTURE_QUEEN = 90000      # Capturing queen (regular captures)
@@ -64,6 +95,11 @@ class MoveGenerator:
         
         score = 0
         board = self.board.board
+        if check is None:
+            check = check_info(board)
+        if opening is None:
+            opening = self.board.get_phase() == 'opening'
+        checking = gives_check(board, encode_chess_move(board, move), check)
         
         # Queen promotions always highest
         if move.promotion == chess.QUEEN:
@@ -88,11 +124,11 @@ class MoveGenerator:
                 score = CAPTURE_QUEEN + capture_score
                 
         # Check bonus
-        if board.gives_check(move):
+        if checking:
             score += CHECK_BONUS
             
         # Development and center control in opening
-        if self.board.get_phase() == 'opening':
+        if opening:
             piece = board.piece_at(move.from_square)
             if piece:
                 # Development bonus for moving pieces out
@@ -109,12 +145,12 @@ class MoveGenerator:
                 if 2 <= to_rank <= 5 and 2 <= to_file <= 5:
                     score += CENTER_BONUS
             
-        # Check moves - using native python-chess gives_check
-        if board.gives_check(move):
+        # Check moves
+        if checking:
             score += 1000  # Higher priority for check moves
         
         # Central squares control and development in early game
-        if self.board.get_phase() == 'opening':
+        if opening:
             to_rank, to_file = chess.square_rank(move.to_square), chess.square_file(move.to_square)
             from_rank, from_file = chess.square_rank(move.from_square), chess.square_file(move.from_square)
             
@@ -0,0 +1,330 @@
+"""
+SlowMate Chess Engine - NNUE Evaluation Module
+Optional HalfKP-style network evaluator with an incrementally updated int16
+first-layer accumulator (requires NumPy and a local weights file)
+Version: 1.0.0-BETA
+"""
+
+import chess
+from typing import List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; NNUEEvaluator falls back to the handcrafted eval
+    np = None
+
+from . import eval_tables
+from .enhanced_evaluate import EnhancedEvaluator
+
+
+NNUE_FORMAT_VERSION = 1
+
+# HalfKP: (own king square, non-king piece kind relative to the perspective, square)
+NUM_PIECE_KINDS = 10  # (pawn..queen) x (own, enemy)
+NUM_FEATURES = 64 * NUM_PIECE_KINDS * 64
+
+
+def feature_index(perspective: chess.Color, king_square: int, piece_type: chess.PieceType,
+                  color: chess.Color, square: int) -> int:
+    """Return the HalfKP feature of a non-king piece seen from ``perspective``.
+
+    Black's view is mirrored vertically so both perspectives share weights.
+    """
+    if perspective == chess.BLACK:
+        king_square ^= 56
+        square ^= 56
+    kind = (piece_type - 1) * 2 + (color != perspective)
+    return (king_square * NUM_PIECE_KINDS + kind) * 64 + square
+
+
+def active_features(board: chess.Board, perspective: chess.Color) -> List[int]:
+    """Return every active feature of ``board`` from ``perspective``."""
+    king_square = board.king(perspective)
+    if king_square is None:
+        return []
+    features = []
+    for piece_type in (chess.PAWN, chess.KNIGHT, chess.BISHOP, chess.ROOK, chess.QUEEN):
+        for color in chess.COLORS:
+            for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                features.append(feature_index(perspective, king_square, piece_type, color, square))
+    return features
+
+
+class NNUENetwork:
+    """Network weights: one HalfKP feature transformer plus a linear output.
+
+    ``evaluate = (crelu(acc[us]) . w[0] + crelu(acc[them]) . w[1] + bias) // output_scale``
+    where ``crelu`` clamps to ``[0, clip]``. Weights files are ``.npz`` archives
+    holding ``version``, ``feature_weights`` (NUM_FEATURES, H) int16,
+    ``feature_bias`` (H,) int16, ``output_weights`` (2, H) int16,
+    ``output_bias``, ``clip`` and ``output_scale``.
+    """
+
+    def __init__(self, feature_weights, feature_bias, output_weights,
+                 output_bias: int = 0, clip: int = 255, output_scale: int = 1):
+        """Validate and store the weights."""
+        if np is None:
+            raise ImportError("NNUE evaluation requires NumPy")
+        self.feature_weights = np.ascontiguousarray(feature_weights, dtype=np.int16)
+        self.feature_bias = np.asarray(feature_bias, dtype=np.int16)
+        hidden = self.feature_bias.shape[0]
+        if self.feature_weights.shape != (NUM_FEATURES, hidden):
+            raise ValueError(f"feature_weights must have shape ({NUM_FEATURES}, {hidden})")
+        output_weights = np.asarray(output_weights, dtype=np.int16)
+        if output_weights.shape != (2, hidden):
+            raise ValueError(f"output_weights must have shape (2, {hidden})")
+        self.output_weights = output_weights.astype(np.int32)
+        # Flattened (black, white) accumulator weights for each side to move
+        self._turn_weights = (np.concatenate([self.output_weights[0], self.output_weights[1]]),
+                              np.concatenate([self.output_weights[1], self.output_weights[0]]))
+        self.output_bias = int(output_bias)
+        self.clip = int(clip)
+        self.output_scale = int(output_scale)
+        if self.output_scale <= 0:
+            raise ValueError("output_scale must be positive")
+        self.hidden_size = hidden
+
+    @classmethod
+    def load(cls, path: str) -> 'NNUENetwork':
+        """Load a weights file written by ``save``."""
+        with np.load(path) as data:
+            version = int(data['version'])
+            if version != NNUE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported NNUE weights version {version}")
+            return cls(data['feature_weights'], data['feature_bias'], data['output_weights'],
+                       int(data['output_bias']), int(data['clip']), int(data['output_scale']))
+
+    def save(self, path: str) -> None:
+        """Write the weights to ``path`` (``.npz``)."""
+        np.savez_compressed(path, version=NNUE_FORMAT_VERSION,
+                            feature_weights=self.feature_weights,
+                            feature_bias=self.feature_bias,
+                            output_weights=self.output_weights.astype(np.int16),
+                            output_bias=self.output_bias, clip=self.clip,
+                            output_scale=self.output_scale)
+
+    @classmethod
+    def bootstrap(cls, hidden_size: int = 16, piece_square_weight: float = 0.8,
+                  quantization: int = 8) -> 'NNUENetwork':
+        """Build a network reproducing material + weighted PST.
+
+        Hidden unit ``piece_type - 1`` sums the perspective's own pieces of
+        that type and unit ``piece_type + 4`` the enemy's, each in units of
+        ``quantization`` centipawns. Useful as a starting point for training
+        and as a sanity reference for the accumulator.
+        """
+        if np is None:
+            raise ImportError("NNUE evaluation requires NumPy")
+        if hidden_size < 10:
+            raise ValueError("bootstrap network needs at least 10 hidden units")
+        feature_weights = np.zeros((NUM_FEATURES, hidden_size), dtype=np.int16)
+        pst = {
+            chess.PAWN: eval_tables.PAWN_TABLE,
+            chess.KNIGHT: eval_tables.KNIGHT_TABLE,
+            chess.BISHOP: eval_tables.BISHOP_TABLE,
+            chess.ROOK: eval_tables.ROOK_TABLE,
+            chess.QUEEN: eval_tables.QUEEN_TABLE,
+        }
+        # Features are oriented so the perspective plays up the board: own
+        # pieces use the table as is, enemy pieces the mirrored table
+        for king_square in chess.SQUARES:
+            for piece_type, table in pst.items():
+                for square in chess.SQUARES:
+                    for color, unit, pst_square in ((chess.WHITE, piece_type - 1, square),
+                                                    (chess.BLACK, piece_type + 4, square ^ 56)):
+                        value = eval_tables.PIECE_VALUES[piece_type] + piece_square_weight * table[pst_square]
+                        index = feature_index(chess.WHITE, king_square, piece_type, color, square)
+                        feature_weights[index, unit] = round(value / quantization)
+
+        half = quantization // 2
+        output_weights = np.zeros((2, hidden_size), dtype=np.int16)
+        output_weights[0, 0:5] = half    # our pieces, our view
+        output_weights[0, 5:10] = -half  # their pieces, our view
+        output_weights[1, 0:5] = -half   # their pieces, their view
+        output_weights[1, 5:10] = half   # our pieces, their view
+        return cls(feature_weights, np.zeros(hidden_size, dtype=np.int16), output_weights,
+                   clip=255, output_scale=1)
+
+    def refresh(self, board: chess.Board, perspective: chess.Color):
+        """Compute one perspective's accumulator from scratch."""
+        features = active_features(board, perspective)
+        values = self.feature_bias.copy()
+        if features:
+            values += self.feature_weights[features].sum(axis=0, dtype=np.int16)
+        return values
+
+    def output(self, values, turn: chess.Color) -> int:
+        """Score accumulator ``values`` (indexed by colour) for the side ``turn``."""
+        clipped = np.minimum(np.maximum(values, 0), self.clip)  # np.clip is slow on tiny arrays
+        score = int(np.dot(clipped.ravel(), self._turn_weights[turn])) + self.output_bias
+        return score // self.output_scale
+
+
+class Accumulator:
+    """First-layer accumulator of one ``Board``, kept in step with its moves.
+
+    ``values[color]`` is the (H,) int16 accumulator from ``color``'s side. A king
+    move changes every HalfKP feature of its own side, so that perspective is
+    only flagged and recomputed when the position is next evaluated.
+    """
+
+    def __init__(self, network: NNUENetwork, board: chess.Board):
+        """Create the accumulator for ``board``'s current position."""
+        self.network = network
+        self._stack = []
+        self.refresh(board)
+
+    def refresh(self, board: chess.Board):
+        """Recompute both perspectives and forget the move history."""
+        self.values = np.stack([self.network.refresh(board, color)
+                                for color in (chess.BLACK, chess.WHITE)])
+        self.dirty = [False, False]
+        self.ply = len(board.move_stack)
+        self._stack = []
+
+    def push(self, board: chess.Board, move: chess.Move):
+        """Apply ``move`` (not yet pushed on ``board``)."""
+        self._stack.append((self.values, self.dirty))
+        self.values = self.values.copy()
+        self.dirty = self.dirty[:]
+        self.ply += 1
+        if not move:
+            return  # Null moves change no feature
+
+        us = board.turn
+        them = not us
+        from_square = move.from_square
+        to_square = move.to_square
+        piece_type = board.piece_type_at(from_square)
+        added = []
+        removed = []
+
+        if piece_type == chess.KING:
+            self.dirty[us] = True
+            if board.is_castling(move):
+                back_rank = chess.square_rank(from_square)
+                kingside = board.is_kingside_castling(move)
+                rook_to = chess.square(5 if kingside else 3, back_rank)
+                if board.piece_type_at(to_square) == chess.ROOK:
+                    rook_from = to_square
+                else:
+                    rook_from = chess.square(7 if kingside else 0, back_rank)
+                removed.append((chess.ROOK, us, rook_from))
+                added.append((chess.ROOK, us, rook_to))
+        else:
+            removed.append((piece_type, us, from_square))
+            added.append((move.promotion or piece_type, us, to_square))
+
+        if board.is_en_passant(move):
+            removed.append((chess.PAWN, them,
+                            chess.square(chess.square_file(to_square), chess.square_rank(from_square))))
+        elif not board.is_castling(move):
+            captured_type = board.piece_type_at(to_square)
+            if captured_type:
+                removed.append((captured_type, them, to_square))
+
+        weights = self.network.feature_weights
+        for perspective in (0, 1):  # Plain ints: NumPy treats bools as masks
+            if self.dirty[perspective]:
+                continue
+            king_square = board.king(perspective)
+            row = self.values[perspective]
+            for piece_type, color, square in added:
+                row += weights[feature_index(perspective, king_square, piece_type, color, square)]
+            for piece_type, color, square in removed:
+                row -= weights[feature_index(perspective, king_square, piece_type, color, square)]
+
+    def pop(self):
+        """Restore the state before the last ``push``."""
+        self.ply -= 1
+        if self._stack:
+            self.values, self.dirty = self._stack.pop()
+        else:
+            self.dirty = [True, True]
+
+    def current(self, board: chess.Board):
+        """Return up-to-date accumulator values for ``board``."""
+        if self.ply != len(board.move_stack):
+            self.refresh(board)  # Moves were pushed around the wrapper
+        elif self.dirty[0] or self.dirty[1]:
+            for perspective in (0, 1):
+                if self.dirty[perspective]:
+                    self.values[perspective] = self.network.refresh(board, bool(perspective))
+            self.dirty = [False, False]
+        return self.values
+
+
+class NNUEEvaluator:
+    """Evaluator backend with the ``EnhancedEvaluator.evaluate`` interface.
+
+    Uses the network when weights are loaded and NumPy is available, the
+    handcrafted ``fallback`` evaluator otherwise. With a ``Board`` wrapper the
+    accumulator is attached to it and updated incrementally by
+    ``Board.make_move``/``unmake_move``.
+    """
+
+    def __init__(self, weights_path: Optional[str] = None, fallback=None,
+                 network: Optional[NNUENetwork] = None):
+        """Load ``weights_path`` (or use ``network``), keeping ``fallback`` ready."""
+        self.fallback = fallback or EnhancedEvaluator()
+        self.piece_values = self.fallback.piece_values
+        self.network = network
+        self.load_error = None
+        self.nnue_evals = 0
+        if network is None and weights_path:
+            self.load(weights_path)
+
+    @property
+    def backend(self) -> str:
+        """Name of the active evaluation backend."""
+        return 'nnue' if self.network is not None else 'handcrafted'
+
+    def load(self, weights_path: str) -> bool:
+        """Load a weights file; on failure keep the handcrafted fallback."""
+        if np is None:
+            self.network = None
+            self.load_error = "NumPy not installed"
+            return False
+        try:
+            self.network = NNUENetwork.load(weights_path)
+            self.load_error = None
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            self.network = None
+            self.load_error = str(e)
+            return False
+
+    def evaluate(self, board, alpha: Optional[float] = None, beta: Optional[float] = None) -> float:
+        """Evaluate from the side to move's perspective.
+
+        ``alpha``/``beta`` are only used by the handcrafted fallback (lazy eval).
+        """
+        network = self.network
+        if network is None:
+            return self.fallback.evaluate(board, alpha, beta)
+
+        chess_board = board.board if hasattr(board, 'board') else board
+        if chess_board.is_insufficient_material():
+            return 0
+        self.nnue_evals += 1
+
+        if hasattr(board, 'nnue'):
+            accumulator = board.nnue
+            if accumulator is None or accumulator.network is not network:
+                accumulator = board.nnue = Accumulator(network, chess_board)
+            values = accumulator.current(chess_board)
+        else:
+            values = np.stack([network.refresh(chess_board, color)
+                               for color in (chess.BLACK, chess.WHITE)])
+        return network.output(values, chess_board.turn)
+
+    def reset_lazy_stats(self):
+        """Reset per-search statistics."""
+        self.nnue_evals = 0
+        self.fallback.reset_lazy_stats()
+
+    def lazy_summary(self) -> str:
+        """One-line statistics summary for ``info string``."""
+        if self.network is None:
+            return self.fallback.lazy_summary()
+        return f"nnue evals {self.nnue_evals} hidden {self.network.hidden_size}"
@@ -0,0 +1,320 @@
+"""
+SlowMate Chess Engine - Table Cache Module
+Precomputed evaluation and move generation tables, generated once per
+process and shared by every engine instance. With ``$SLOWMATE_CACHE_DIR``
+set they are also written to a versioned binary cache file there and
+memory-mapped on later starts; older cache versions in that directory are
+removed.
+Version: 1.0.0-BETA
+"""
+
+import array
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Optional
+
+import chess
+
+from . import eval_tables
+
+
+# Bump whenever the layout or meaning of a table changes
+TABLE_CACHE_VERSION = 3
+
+CACHE_FILENAME = f"slowmate_tables_v{TABLE_CACHE_VERSION}.bin"
+_MAGIC = b"SMTB"
+_HEADER = struct.Struct("<4sII20s")      # magic, version, section count, source digest
+_SECTION = struct.Struct("<24sc7xQQ")    # name, typecode, byte offset, item count
+
+
+def default_cache_dir() -> Optional[str]:
+    """Cache directory (opt-in): ``$SLOWMATE_CACHE_DIR``, or None for in-memory tables."""
+    return os.environ.get("SLOWMATE_CACHE_DIR") or None
+
+
+def source_digest() -> bytes:
+    """Digest of everything the tables are generated from."""
+    digest = hashlib.sha1()
+    digest.update(str(TABLE_CACHE_VERSION).encode())
+    for table in (eval_tables.PAWN_TABLE, eval_tables.KNIGHT_TABLE, eval_tables.BISHOP_TABLE,
+                  eval_tables.ROOK_TABLE, eval_tables.QUEEN_TABLE,
+                  eval_tables.KING_MIDDLE_TABLE, eval_tables.KING_END_TABLE):
+        digest.update(array.array('h', table).tobytes())
+    return digest.digest()
+
+
+ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+def _sliding_attacks(square: int, occupied: int, directions) -> int:
+    """Attacks of a slider on ``square``, stopping at the first blocker each way."""
+    attacks = 0
+    for file_step, rank_step in directions:
+        file, rank = chess.square_file(square) + file_step, chess.square_rank(square) + rank_step
+        while 0 <= file < 8 and 0 <= rank < 8:
+            target = chess.BB_SQUARES[chess.square(file, rank)]
+            attacks |= target
+            if occupied & target:
+                break
+            file, rank = file + file_step, rank + rank_step
+    return attacks
+
+
+def relevant_occupancy_mask(square: int, directions) -> int:
+    """Squares whose occupancy changes a slider's attacks (board edges excluded)."""
+    edges = (((chess.BB_RANK_1 | chess.BB_RANK_8) & ~chess.BB_RANKS[chess.square_rank(square)]) |
+             ((chess.BB_FILE_A | chess.BB_FILE_H) & ~chess.BB_FILES[chess.square_file(square)]))
+    return _sliding_attacks(square, 0, directions) & ~edges
+
+
+def occupancy_subsets(mask: int):
+    """Every subset of ``mask`` in carry-rippler (increasing) order, starting with 0."""
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if not subset:
+            break
+
+
+def slider_attack_table(square: int, directions):
+    """Attacks of a slider on ``square`` for every relevant occupancy, in
+    ``occupancy_subsets`` order.
+
+    Each line (pair of opposite directions) only depends on its own blockers,
+    so the two lines are walked separately and combined; walking all 4096
+    rook occupancies ray by ray is ten times slower.
+    """
+    lines = []
+    for direction in directions:
+        opposite = (-direction[0], -direction[1])
+        if direction > opposite:
+            pair = (direction, opposite)
+            lines.append([(subset, _sliding_attacks(square, subset, pair))
+                          for subset in occupancy_subsets(relevant_occupancy_mask(square, pair))])
+    first, second = lines
+    return [attacks for _, attacks in
+            sorted((a | b, attacks_a | attacks_b) for a, attacks_a in first for b, attacks_b in second)]
+
+
+def build_tables() -> Dict[str, array.array]:
+    """Generate every table as a flat ``array.array``."""
+    tables = {}
+
+    # PSTs per colour and piece type (black mirrored): index (color * 7 + piece_type) * 64 + square
+    for name, king_table in (('pst_mg', eval_tables.KING_MIDDLE_TABLE),
+                             ('pst_eg', eval_tables.KING_END_TABLE)):
+        square_tables = eval_tables.build_square_tables(king_table)
+        flat = array.array('h')
+        for color in (chess.BLACK, chess.WHITE):
+            for values in square_tables[color]:
+                flat.extend(values)
+        tables[name] = flat
+
+    # Passed pawn masks: enemy pawns in front on the same or adjacent files; index color * 64 + square
+    passed = array.array('Q', [0] * 128)
+    for square in chess.SQUARES:
+        file, rank = chess.square_file(square), chess.square_rank(square)
+        files = chess.BB_FILES[file]
+        if file > 0:
+            files |= chess.BB_FILES[file - 1]
+        if file < 7:
+            files |= chess.BB_FILES[file + 1]
+        ahead_white = sum(chess.BB_RANKS[r] for r in range(rank + 1, 8))
+        ahead_black = sum(chess.BB_RANKS[r] for r in range(rank))
+        passed[chess.WHITE * 64 + square] = files & ahead_white
+        passed[chess.BLACK * 64 + square] = files & ahead_black
+    tables['passed_pawn_masks'] = passed
+
+    # King zones and leaper attacks
+    tables['king_zone_masks'] = array.array('Q', [chess.BB_KING_ATTACKS[sq] | chess.BB_SQUARES[sq]
+                                                  for sq in chess.SQUARES])
+    tables['knight_attacks'] = array.array('Q', chess.BB_KNIGHT_ATTACKS)
+    tables['king_attacks'] = array.array('Q', chess.BB_KING_ATTACKS)
+    tables['pawn_attacks'] = array.array('Q', list(chess.BB_PAWN_ATTACKS[chess.BLACK]) +
+                                         list(chess.BB_PAWN_ATTACKS[chess.WHITE]))
+
+    # Slider attacks for every relevant occupancy, per square in
+    # ``occupancy_subsets`` order (the move generator turns them into dicts)
+    for name, directions in (('rook', ROOK_DIRECTIONS), ('bishop', BISHOP_DIRECTIONS)):
+        masks = array.array('Q')
+        attacks = array.array('Q')
+        for square in chess.SQUARES:
+            masks.append(relevant_occupancy_mask(square, directions))
+            attacks.extend(slider_attack_table(square, directions))
+        tables[f'{name}_masks'] = masks
+        tables[f'{name}_attacks'] = attacks
+
+    # Squares strictly between two aligned squares, and the full line through them;
+    # index a * 64 + b (0 when not on a common rank, file or diagonal)
+    between = array.array('Q', [0] * 4096)
+    line = array.array('Q', [0] * 4096)
+    for a in chess.SQUARES:
+        for directions in (ROOK_DIRECTIONS, BISHOP_DIRECTIONS):
+            rays = {direction: _sliding_attacks(a, 0, (direction,)) for direction in directions}
+            for (file_step, rank_step), ray in rays.items():
+                full_line = ray | rays[(-file_step, -rank_step)] | chess.BB_SQUARES[a]
+                for b in chess.scan_forward(ray):
+                    between[a * 64 + b] = ray & _sliding_attacks(b, 0, ((-file_step, -rank_step),))
+                    line[a * 64 + b] = full_line
+    tables['between'] = between
+    tables['line'] = line
+
+    return tables
+
+
+def write_cache(path: str, tables: Dict[str, array.array]) -> None:
+    """Write ``tables`` to ``path`` atomically."""
+    offset = _HEADER.size + _SECTION.size * len(tables)
+    sections = []
+    payload = []
+    for name, table in tables.items():
+        if len(name.encode()) > 24:
+            raise ValueError(f"table name too long: {name}")
+        offset = (offset + 7) & ~7  # 8-byte alignment for memoryview casts
+        data = table.tobytes()
+        sections.append(_SECTION.pack(name.encode(), table.typecode.encode(), offset, len(table)))
+        payload.append((offset, data))
+        offset += len(data)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, TABLE_CACHE_VERSION, len(tables), source_digest()))
+        for section in sections:
+            f.write(section)
+        for data_offset, data in payload:
+            f.write(b"\0" * (data_offset - f.tell()))
+            f.write(data)
+    os.replace(temp_path, path)
+
+
+def remove_stale_caches(cache_dir: str) -> int:
+    """Delete other cache versions and leftover temporary files; return how many."""
+    removed = 0
+    for stale in glob.glob(os.path.join(cache_dir, "slowmate_tables_v*.bin*")):
+        if os.path.basename(stale) != CACHE_FILENAME:
+            try:
+                os.remove(stale)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def load_cache(path: str) -> Optional[Dict[str, memoryview]]:
+    """Memory-map ``path``; return None if missing, stale or malformed."""
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, count, digest = _HEADER.unpack_from(mapped, 0)
+        if magic != _MAGIC or version != TABLE_CACHE_VERSION or digest != source_digest():
+            mapped.close()
+            return None
+        view = memoryview(mapped)
+        tables = {}
+        for i in range(count):
+            name, typecode, offset, length = _SECTION.unpack_from(mapped, _HEADER.size + i * _SECTION.size)
+            item_size = array.array(typecode.decode()).itemsize
+            tables[name.rstrip(b"\0").decode()] = \
+                view[offset:offset + length * item_size].cast(typecode.decode())
+        if sys.byteorder != 'little':
+            raise ValueError("table cache is little-endian")
+        return tables
+    except (struct.error, ValueError, TypeError):
+        return None
+
+
+class TableSet:
+    """The precomputed tables, shaped for direct indexing.
+
+    - ``pst_mg[color][piece_type][square]`` / ``pst_eg``: raw PST values
+    - ``passed_pawn_masks[color][square]``: squares where an enemy pawn stops
+      a pawn from being passed
+    - ``king_zone_masks[square]``, ``knight_attacks[square]``,
+      ``king_attacks[square]``, ``pawn_attacks[color][square]``
+    - ``rook_masks[square]`` / ``bishop_masks[square]`` and the flat
+      ``rook_attacks`` / ``bishop_attacks`` slider tables (see ``build_tables``)
+    - ``between[a][b]`` / ``line[a][b]``
+    """
+
+    def __init__(self, tables, source: str):
+        """Slice the flat tables (zero-copy for memory-mapped ones)."""
+        self.source = source  # 'cache', 'built' or 'memory'
+        self.pst_mg = self._per_color(tables['pst_mg'], 7)
+        self.pst_eg = self._per_color(tables['pst_eg'], 7)
+        self.passed_pawn_masks = self._rows(tables['passed_pawn_masks'], 2)
+        self.king_zone_masks = tables['king_zone_masks']
+        self.knight_attacks = tables['knight_attacks']
+        self.king_attacks = tables['king_attacks']
+        self.pawn_attacks = self._rows(tables['pawn_attacks'], 2)
+        self.rook_masks = tables['rook_masks']
+        self.bishop_masks = tables['bishop_masks']
+        self.rook_attacks = tables['rook_attacks']
+        self.bishop_attacks = tables['bishop_attacks']
+        self.between = self._rows(tables['between'], 64)
+        self.line = self._rows(tables['line'], 64)
+
+    @staticmethod
+    def _rows(flat, count):
+        return [flat[i * 64:(i + 1) * 64] for i in range(count)]
+
+    @classmethod
+    def _per_color(cls, flat, pieces):
+        return [cls._rows(flat[color * pieces * 64:(color + 1) * pieces * 64], pieces)
+                for color in (chess.BLACK, chess.WHITE)]
+
+
+_shared_tables: Optional[TableSet] = None
+
+
+def get_tables(cache_dir: Optional[str] = None) -> TableSet:
+    """Return the process-wide tables.
+
+    They are built in memory unless a cache directory is given (or set in
+    ``$SLOWMATE_CACHE_DIR``): then the cache file there is loaded, or
+    created after removing older versions.
+    """
+    global _shared_tables
+    if _shared_tables is not None and cache_dir is None:
+        return _shared_tables
+
+    directory = cache_dir or default_cache_dir()
+    if directory is None:
+        tables = TableSet(build_tables(), 'memory')
+    else:
+        path = os.path.join(directory, CACHE_FILENAME)
+        loaded = load_cache(path)
+        if loaded is not None:
+            tables = TableSet(loaded, 'cache')
+        else:
+            built = build_tables()
+            try:
+                write_cache(path, built)
+                remove_stale_caches(directory)
+                loaded = load_cache(path)
+            except OSError:
+                loaded = None  # Read-only location: keep the tables in memory
+            tables = TableSet(loaded, 'built') if loaded is not None else TableSet(built, 'memory')
+
+    if cache_dir is None:
+        _shared_tables = tables
+    return tables
+
+
+TABLES = get_tables()
+
+# Shorthands for the hot paths
+PST_MG = TABLES.pst_mg
+PST_EG = TABLES.pst_eg
+PASSED_PAWN_MASKS = TABLES.passed_pawn_masks
+KING_ZONE_MASKS = TABLES.king_zone_masks
@@ -3,10 +3,14 @@ Advanced Time Management System for SlowMate Chess Engine
 Version: 1.1.0
 """
 
+from collections import deque
 from typing import Optional, Dict, Tuple
+import math
 import time
 import chess
 
+from .complexity import COMPLEXITY, ComplexityFeatures
+
 class TimeManager:
     """Advanced time management system with dynamic allocation and phase awareness."""
     
@@ -18,6 +22,7 @@ class TimeManager:
         self.start_time: float = 0
         self.allocated_time: float = 0
         self.emergency_move_time: float = 0.1  # 100ms minimum
+        self.emergency_clock_time: float = 1.0  # Emergency profile below this on the clock
         
         # Phase-based time allocation weights
         self.phase_weights = {
@@ -34,6 +39,20 @@ class TimeManager:
             'tactical_opportunities': 1.25,  # Slightly increased for deeper tactical play
         }
         
+    def is_emergency(self, remaining_time: Optional[float], move_time: Optional[float] = None) -> bool:
+        """Whether to search with the emergency (low-clock) profile.
+        
+        Parameters
+        ----------
+        remaining_time : Optional[float]
+            Our clock in seconds, if playing with one
+        move_time : Optional[float]
+            Budget for this move in seconds, if known
+        """
+        if remaining_time is not None and remaining_time < self.emergency_clock_time:
+            return True
+        return move_time is not None and move_time < self.emergency_move_time
+        
     def start_new_game(self):
         """Reset time manager for a new game."""
         self.remaining_time = 0
@@ -102,13 +121,15 @@ class TimeManager:
         else:  # Endgame
             return self.phase_weights['endgame']
             
-    def _calculate_complexity(self, board: chess.Board) -> float:
+    def _calculate_complexity(self, board: chess.Board, key: Optional[int] = None) -> float:
         """Calculate position complexity factor.
         
         Parameters
         ----------
         board : chess.Board
             Current position
+        key : int, optional
+            Polyglot Zobrist key of the position, if the caller has it
             
         Returns
         -------
@@ -116,25 +137,25 @@ class TimeManager:
             Complexity factor (0.0 to 1.0)
         """
         complexity = 0.0
+        features = COMPLEXITY.features(board, key)
         
         # Material tension
         material_diff = abs(self._calculate_material_balance(board))
         complexity += (1.0 - min(1.0, material_diff / 10.0)) * self.complexity_weights['material_balance']
         
-        # Piece mobility (approximation)
-        mobility = len(list(board.legal_moves))
-        complexity += min(1.0, mobility / 40.0) * self.complexity_weights['piece_mobility']
+        # Piece mobility (pseudo-legal approximation)
+        complexity += min(1.0, features.mobility / 40.0) * self.complexity_weights['piece_mobility']
         
-        # King safety (basic metric)
-        king_safety = self._evaluate_king_safety(board)
+        # King safety (attacked king-zone squares)
+        king_safety = self._evaluate_king_safety(features)
         complexity += king_safety * self.complexity_weights['king_safety']
         
         # Pawn structure
         pawn_complexity = self._evaluate_pawn_structure(board)
         complexity += pawn_complexity * self.complexity_weights['pawn_structure']
         
-        # Tactical opportunities (basic check)
-        tactics = self._evaluate_tactical_potential(board)
+        # Tactical opportunities (captures and checks available)
+        tactics = self._evaluate_tactical_potential(features)
         complexity += tactics * self.complexity_weights['tactical_opportunities']
         
         return min(1.0, complexity)
@@ -155,24 +176,10 @@ class TimeManager:
             balance -= len(board.pieces(piece_type, chess.BLACK)) * piece_values[piece_type]
         return balance
         
-    def _evaluate_king_safety(self, board: chess.Board) -> float:
+    def _evaluate_king_safety(self, features: ComplexityFeatures) -> float:
         """Evaluate king safety for both sides."""
-        def king_zone_attacks(color: chess.Color) -> int:
-            king_square = board.king(color)
-            if king_square is None:
-                return 0
-            attacks = 0
-            king_zone = chess.BB_KING_ATTACKS[king_square]
-            for move in board.legal_moves:
-                if king_zone & chess.BB_SQUARES[move.to_square]:
-                    attacks += 1
-            return attacks
-            
-        white_attacks = king_zone_attacks(chess.WHITE)
-        black_attacks = king_zone_attacks(chess.BLACK)
-        
         # Normalize to 0-1 range
-        return min(1.0, (white_attacks + black_attacks) / 10.0)
+        return min(1.0, features.king_pressure / 10.0)
         
     def _evaluate_pawn_structure(self, board: chess.Board) -> float:
         """Evaluate pawn structure complexity."""
@@ -202,18 +209,9 @@ class TimeManager:
                 
         return min(1.0, (doubled_pawns + isolated_pawns) / 8.0)
         
-    def _evaluate_tactical_potential(self, board: chess.Board) -> float:
+    def _evaluate_tactical_potential(self, features: ComplexityFeatures) -> float:
         """Evaluate tactical potential in the position."""
-        tactical_potential = 0.0
-        
-        # Check for pieces under attack
-        for move in board.legal_moves:
-            if board.is_capture(move):
-                tactical_potential += 0.1
-            if board.gives_check(move):
-                tactical_potential += 0.2
-                
-        return min(1.0, tactical_potential)
+        return min(1.0, features.captures * 0.1 + features.checks * 0.2)
         
     def calculate_move_time(self, board: chess.Board, ply: int) -> float:
         """Calculate how much time to spend on the current move.
@@ -316,3 +314,108 @@ class TimeManager:
             
         # Standard time management
         return elapsed >= self.allocated_time
+
+
+class MoveOverheadTracker:
+    """Move overhead: the configured GUI/pipe margin plus measured latency.
+
+    The UCI loop stamps each ``go`` and each ``bestmove``; whatever the
+    go-to-bestmove gap exceeds the time the engine allocated itself
+    (thread start-up, an iteration overrunning its deadline, output) is
+    kept in a rolling window, and a high percentile of it is added to the
+    ``Move Overhead`` option before the next allocation.
+    """
+    
+    def __init__(self, base_ms: int = 10, window: int = 50, percentile: float = 90.0):
+        self.base_ms = base_ms
+        self.percentile = percentile
+        self.latencies = deque(maxlen=window)   # go -> bestmove, ms
+        self.overshoots = deque(maxlen=window)  # latency beyond the allocation, ms
+        self.go_time: Optional[float] = None
+        
+    def start(self) -> float:
+        """Stamp the arrival of ``go``; return the stamp."""
+        self.go_time = time.perf_counter()
+        return self.go_time
+        
+    def finish(self, allocated_ms: Optional[float] = None,
+               go_time: Optional[float] = None) -> Optional[float]:
+        """Stamp ``bestmove``; return the go-to-bestmove latency in ms.
+        
+        ``allocated_ms`` is the search's own time budget; searches without
+        one (depth, infinite) add to the latency statistics only. ``go_time``
+        is the stamp ``start`` returned for the go being answered, for
+        callers that stamp the next go before answering the previous one.
+        """
+        if go_time is None:
+            go_time, self.go_time = self.go_time, None
+        if go_time is None:
+            return None
+        latency = (time.perf_counter() - go_time) * 1000.0
+        self.latencies.append(latency)
+        if allocated_ms is not None:
+            self.overshoots.append(max(0.0, latency - allocated_ms))
+        return latency
+        
+    @staticmethod
+    def _percentile(samples, percentile: float) -> float:
+        """Nearest-rank percentile of ``samples`` (0 when empty)."""
+        if not samples:
+            return 0.0
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(percentile / 100.0 * len(ordered)))
+        return ordered[rank - 1]
+        
+    def measured_ms(self) -> float:
+        """Rolling percentile of the measured overshoot."""
+        return self._percentile(self.overshoots, self.percentile)
+        
+    def overhead_ms(self) -> float:
+        """Total overhead to subtract from a clock-based allocation."""
+        return self.base_ms + self.measured_ms()
+        
+    def summary(self) -> str:
+        """One-line statistics for ``info string``."""
+        return (f"overhead {self.overhead_ms():.0f}ms (option {self.base_ms} + measured "
+                f"p{self.percentile:g} {self.measured_ms():.1f}) latency "
+                f"p50 {self._percentile(self.latencies, 50):.1f} "
+                f"p{self.percentile:g} {self._percentile(self.latencies, self.percentile):.1f} "
+                f"max {max(self.latencies, default=0.0):.1f}ms over {len(self.latencies)} moves")
+
+
+class IterationCostModel:
+    """Predicts the cost of the next iterative-deepening iteration.
+    
+    Each completed iteration adds its own node count and duration; the
+    effective branching factor is the geometric mean of the last two node
+    ratios (which evens out the odd/even depth swing), and the next
+    iteration is predicted to take the last one's time times that factor.
+    """
+    
+    def __init__(self, min_ebf: float = 1.5, max_ebf: float = 20.0):
+        self.min_ebf = min_ebf
+        self.max_ebf = max_ebf
+        self.iterations = []  # (depth, nodes, seconds) per completed iteration
+        
+    def reset(self):
+        """Forget the previous search."""
+        self.iterations = []
+        
+    def add(self, depth: int, nodes: int, seconds: float):
+        """Record one completed iteration (its own nodes and time, not totals)."""
+        self.iterations.append((depth, max(nodes, 1), max(seconds, 1e-6)))
+        
+    def branching_factor(self) -> Optional[float]:
+        """Effective branching factor, or None before three iterations."""
+        if len(self.iterations) < 3:
+            return None
+        (_, n1, _), (_, n2, _), (_, n3, _) = self.iterations[-3:]
+        ebf = math.sqrt((n2 / n1) * (n3 / n2))
+        return max(self.min_ebf, min(self.max_ebf, ebf))
+        
+    def predict(self) -> Optional[float]:
+        """Predicted seconds for the next iteration, or None if unknown."""
+        ebf = self.branching_factor()
+        if ebf is None:
+            return None
+        return self.iterations[-1][2] * ebf
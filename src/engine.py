@@ -5,6 +5,7 @@ Target: Stable 650+ ELO with robust UCI compliance and reliable move generation
 """
 
 import chess
+import threading
 import time
 import math
 from typing import Optional, List, Tuple, Dict, Any
@@ -12,7 +13,12 @@ from typing import Optional, List, Tuple, Dict, Any
 from .core.board import Board
 from .core.moves import MoveGenerator
 from .core.enhanced_evaluate import EnhancedEvaluator
-from .search.enhanced import TranspositionTable, MoveOrderer, NodeType
+from .core.complexity import COMPLEXITY
+from .core.time_manager import IterationCostModel, TimeManager
+from .core.opening_book import OpeningBook
+from .core.movegen import (CAPTURE_BIT, INFO_CHECK_BIT, INFO_MOVE_MASK, INFO_VICTIM_SHIFT,
+                           encode_chess_move, move_infos, to_chess_move)
+from .search.enhanced import TranspositionTable, EncodedMoveOrderer, MoveListCache, NodeType
 from .uci.protocol_v2_2 import UCIProtocol
 
 
@@ -25,14 +31,18 @@ class SlowMateEngine:
         self.move_generator = MoveGenerator(self.board)
         self.evaluator = EnhancedEvaluator()
         self.tt = TranspositionTable(size_mb=64)
-        self.move_orderer = MoveOrderer()
+        self.move_cache = MoveListCache()
+        self.move_orderer = EncodedMoveOrderer()
         self.uci = UCIProtocol(self)
+        self.stop_event = self.uci.stop_event  # The running search's stop signal
         self.nodes = 0
         self.max_depth = 6
         self.search_deadline = None
         self.last_score = None
         self.start_time = None
         self.current_pv = []  # Principal variation line
+        self.best_move_so_far = None  # Encoded; read by the UCI watchdog mid-search
+        self.root_ply = 0  # Game ply of the search root (for mate distances)
         
         # v3.0: Advanced search parameters
         self.aspiration_window = 50
@@ -41,13 +51,27 @@ class SlowMateEngine:
         self.quiescence_max_depth = 4
         
         # v3.0: History and killer move management
-        self.history_table = {}
+        self.history_table = [0] * 4096  # Indexed by encoded move & 0xFFF (from | to << 6)
         self.killer_moves = [[] for _ in range(20)]
         self.counter_moves = {}
         
         # v3.0: Time management improvements
         self.time_scaling_factor = 1.0
         self.complexity_bonus = 0.0
+        self.soft_time_ratio = 0.8  # No new iteration past this share of the allocation
+        self.iteration_model = IterationCostModel()  # Predicts whether the next iteration fits
+        
+        # Emergency (low-clock) profile: thresholds live in the time manager
+        self.time_manager = TimeManager()
+        self.opening_book = OpeningBook()
+        self.emergency = False
+        self.emergency_depth = 2
+        
+        # Last search's time/iteration report (read by the telemetry log)
+        self.search_report = {}
+        self.best_move_changes = 0  # Root best-move changes in the current iteration
+        self.root_scores = {}  # Root moves fully searched in the current iteration -> score
+        self.progress_nodes = 4096  # Node count of the next periodic info check
         
     def get_version(self) -> str:
         """Return engine version."""
@@ -58,15 +82,52 @@ class SlowMateEngine:
         self.board = Board()
         self.move_generator = MoveGenerator(self.board)
         self.tt = TranspositionTable(size_mb=64)
-        self.move_orderer = MoveOrderer()
+        self.move_cache = MoveListCache()
+        self.move_orderer = EncodedMoveOrderer()
         self.nodes = 0
         self.last_score = None
         
         # Clear history tables
-        self.history_table.clear()
+        self.history_table = [0] * 4096
         self.killer_moves = [[] for _ in range(20)]
         self.counter_moves.clear()
         
+    def set_eval_file(self, path: str) -> str:
+        """Use the NNUE weights at ``path``, or the handcrafted eval if empty.
+        
+        Returns a description of the active backend; a file that fails to
+        load leaves the handcrafted evaluator in charge.
+        """
+        handcrafted = getattr(self.evaluator, 'fallback', self.evaluator)
+        if not path:
+            self.evaluator = handcrafted
+            return "handcrafted"
+        from .core.nnue import NNUEEvaluator  # Imports NumPy; only when requested
+        evaluator = NNUEEvaluator(path, fallback=handcrafted)
+        self.evaluator = evaluator
+        if evaluator.network is None:
+            return f"handcrafted (NNUE load failed: {evaluator.load_error})"
+        return f"nnue {path} ({evaluator.network.hidden_size} hidden units)"
+        
+    def set_eval_weights(self, path: str) -> str:
+        """Load tuned handcrafted-evaluation weights (empty path: defaults).
+        
+        Returns a status message; a file that fails to load keeps the
+        current weights.
+        """
+        handcrafted = EnhancedEvaluator()
+        if path:
+            try:
+                handcrafted.load_weights(path)
+            except (OSError, ValueError) as e:
+                return f"evaluation weights not loaded: {e}"
+        if hasattr(self.evaluator, 'fallback'):  # NNUE backend: replace its fallback
+            self.evaluator.fallback = handcrafted
+            self.evaluator.piece_values = handcrafted.piece_values
+        else:
+            self.evaluator = handcrafted
+        return f"evaluation weights {path or 'default'}"
+        
     def set_position(self, position: str):
         """Set the board position."""
         if position == "startpos":
@@ -77,54 +138,102 @@ class SlowMateEngine:
         
     def make_move(self, move: chess.Move):
         """Make a move on the board."""
-        if move not in self.move_generator.get_legal_moves():
+        if not self.board.board.is_legal(move):
             raise ValueError(f"Illegal move: {move.uci()}")
         self.board.make_move(move)
         
     def search(self, time_limit_ms: Optional[int] = None, depth_override: Optional[int] = None, *,
              wtime: Optional[int] = None, btime: Optional[int] = None,
              winc: Optional[int] = None, binc: Optional[int] = None,
-             moves_to_go: Optional[int] = None) -> Optional[chess.Move]:
+             moves_to_go: Optional[int] = None,
+             stop_event: Optional[threading.Event] = None,
+             go_time: Optional[float] = None) -> Optional[chess.Move]:
         """
         Search for the best move using iterative deepening with enhanced time management.
         
+        ``stop_event`` belongs to the caller's go and is never cleared here, so
+        a stop sent before the search starts still counts; without one the
+        search gets a fresh event (also installed as ``uci.stop_event``).
+        ``go_time`` is the ``time.time()`` at which ``go`` arrived; the
+        allocation runs from it rather than from the start of the search.
+        
         Returns:
             The best move found, or None if no legal moves available
         """
         self.nodes = 0
         self.last_score = None
-        self.start_time = time.time()
-        self.uci.stop_requested = False
+        self.start_time = go_time if go_time is not None else time.time()
+        self.root_ply = len(self.board.board.move_stack)
+        if stop_event is None:
+            stop_event = self.uci.stop_event = threading.Event()
+        self.stop_event = stop_event
+        self.uci.reset_periodic_info()
+        self.progress_nodes = 4096
+        self.move_cache.reset_stats()
+        if hasattr(self.evaluator, 'reset_lazy_stats'):
+            self.evaluator.reset_lazy_stats()
+        
+        # Low clock or tiny budget: emergency profile (decided before any analysis)
+        our_time = wtime if self.board.board.turn == chess.WHITE else btime
+        self.emergency = self.time_manager.is_emergency(
+            our_time / 1000.0 if our_time is not None else None,
+            time_limit_ms / 1000.0 if time_limit_ms else None
+        )
         
         # Calculate time allocation
         allocated_time = self._calculate_time_allocation(
             wtime, btime, winc, binc, moves_to_go, time_limit_ms
         )
+        if self.time_manager.is_emergency(None, allocated_time):
+            self.emergency = True
         self.search_deadline = self.start_time + allocated_time
+        self.search_report = {
+            'soft_ms': int(allocated_time * self.soft_time_ratio * 1000),
+            'hard_ms': int(allocated_time * 1000),
+            'complexity': None if self.emergency else round(self._evaluate_position_complexity(), 3),
+            'emergency': self.emergency,
+            'depth': 0,
+            'nodes': 0,
+            'iterations': [],  # [depth, elapsed ms, nodes, best-move changes]
+            'stopped_early': False,  # Next iteration predicted not to fit
+        }
+        self.iteration_model.reset()
+        soft_limit = allocated_time * self.soft_time_ratio
         
         try:
             self.uci._out(f"info string SlowMate v3.0 - Allocated time: {allocated_time:.3f}s")
         except Exception:
             pass
         
-        # Get legal moves
-        moves = self.move_generator.get_legal_moves()
+        # Get legal moves (encoded; converted back to chess.Move only for output)
+        moves = self.move_generator.get_encoded_legal_moves()
         if not moves:
             return None
             
         best_move = moves[0]  # Fallback move
         best_score = -30000
+        self.best_move_so_far = best_move
+        
+        if self.emergency:
+            instant = self._instant_move(moves)
+            if instant is not None:
+                self.best_move_so_far = instant
+                self.search_report['instant'] = True
+                return to_chess_move(instant)
         
         # Determine search depth
         max_depth = depth_override if depth_override else self.max_depth
-        if allocated_time >= 10:
-            max_depth = max(max_depth, 8)
-        elif allocated_time >= 5:
-            max_depth = max(max_depth, 7)
+        if not depth_override:
+            if allocated_time >= 10:
+                max_depth = max(max_depth, 8)
+            elif allocated_time >= 5:
+                max_depth = max(max_depth, 7)
+        if self.emergency:
+            max_depth = min(max_depth, self.emergency_depth)
         
         # Iterative deepening search
         for current_depth in range(1, max_depth + 1):
-            if self.uci.stop_requested:
+            if self.stop_event.is_set():
                 break
                 
             alpha = -30000
@@ -135,44 +244,103 @@ class SlowMateEngine:
                 alpha = self.last_score - self.aspiration_window
                 beta = self.last_score + self.aspiration_window
             
+            self.best_move_changes = 0
+            iteration_start, iteration_nodes = time.time(), self.nodes
             iteration_best_move, iteration_best_score, iteration_pv = self._search_depth_with_pv(
                 current_depth, alpha, beta, moves
             )
             
             # Handle aspiration window failures
-            if (iteration_best_score <= alpha or iteration_best_score >= beta) and current_depth >= 4:
+            if ((iteration_best_score <= alpha or iteration_best_score >= beta) and current_depth >= 4
+                    and not self.stop_event.is_set()):
                 # Widen window and re-search
                 alpha = -30000
                 beta = 30000
+                self.best_move_changes = 0
                 iteration_best_move, iteration_best_score, iteration_pv = self._search_depth_with_pv(
                     current_depth, alpha, beta, moves
                 )
             
             # Update best move if iteration completed
-            if not self.uci.stop_requested and iteration_best_move:
+            if not self.stop_event.is_set() and iteration_best_move:
                 best_move = iteration_best_move
                 best_score = iteration_best_score
+                self.best_move_so_far = best_move
                 self.current_pv = iteration_pv
                 self.last_score = best_score
+                self.search_report['depth'] = current_depth
+                self.iteration_model.add(current_depth, self.nodes - iteration_nodes,
+                                         time.time() - iteration_start)
+                self.search_report['iterations'].append(
+                    [current_depth, int((time.time() - self.start_time) * 1000), self.nodes,
+                     self.best_move_changes])
                 
                 try:
                     elapsed = time.time() - self.start_time
                     nps = int(self.nodes / max(elapsed, 0.001))
-                    pv_string = " ".join([move.uci() for move in self.current_pv])
+                    pv_string = " ".join([to_chess_move(move).uci() for move in self.current_pv])
                     self.uci._out(
                         f"info depth {current_depth} score cp {best_score} "
-                        f"nodes {self.nodes} nps {nps} time {int(elapsed * 1000)} "
-                        f"pv {pv_string}"
+                        f"nodes {self.nodes} nps {nps} hashfull {self.tt.hashfull()} "
+                        f"time {int(elapsed * 1000)} pv {pv_string}"
                     )
                 except Exception:
                     pass
+            elif (iteration_best_move and iteration_best_move != best_move and iteration_best_score > alpha
+                  and iteration_best_score > self.root_scores.get(best_move, 30000)):
+                # Interrupted, but a fully searched move already beat the
+                # previous best at this depth: take it
+                best_move = iteration_best_move
+                best_score = iteration_best_score
+                self.best_move_so_far = best_move
+                self.current_pv = iteration_pv
+                self.search_report['partial_depth'] = current_depth
+                try:
+                    elapsed = time.time() - self.start_time
+                    pv_string = " ".join([to_chess_move(move).uci() for move in self.current_pv])
+                    self.uci._out(
+                        f"info depth {current_depth} score cp {best_score} "
+                        f"nodes {self.nodes} time {int(elapsed * 1000)} pv {pv_string}"
+                    )
+                    self.uci._out(f"info string partial depth {current_depth}: "
+                                  f"{len(self.root_scores)}/{len(moves)} root moves searched")
+                except Exception:
+                    pass
             
             # Time management: check if we should continue
             elapsed = time.time() - self.start_time
-            if elapsed >= allocated_time * 0.8:  # Use 80% of allocated time
+            if elapsed >= soft_limit:
+                break
+            
+            # Bank the time rather than start an iteration that cannot finish
+            predicted = self.iteration_model.predict()
+            if (predicted is not None and current_depth < max_depth and not self.stop_event.is_set()
+                    and elapsed + predicted > soft_limit):
+                self.search_report['stopped_early'] = True
+                try:
+                    self.uci._out(
+                        f"info string depth {current_depth + 1} predicted {predicted:.3f}s "
+                        f"(ebf {self.iteration_model.branching_factor():.2f}), "
+                        f"{soft_limit - elapsed:.3f}s left: stopping"
+                    )
+                except Exception:
+                    pass
                 break
+        self.search_report['nodes'] = self.nodes
+        ebf = self.iteration_model.branching_factor()
+        self.search_report['ebf'] = round(ebf, 2) if ebf else None
+                
+        if hasattr(self.evaluator, 'lazy_summary'):
+            try:
+                self.uci._out(f"info string {self.evaluator.lazy_summary()}")
+            except Exception:
+                pass
+        try:
+            self.uci._out(f"info string {self.move_cache.summary()}")
+        except Exception:
+            pass
                 
-        return best_move
+        return to_chess_move(best_move)
     
     def _calculate_time_allocation(self, wtime: Optional[int], btime: Optional[int],
                                  winc: Optional[int], binc: Optional[int],
@@ -183,14 +351,14 @@ class SlowMateEngine:
             return time_limit_ms / 1000.0
             
         # Default allocation if no time controls provided
-        if not wtime and not btime:
+        if wtime is None and btime is None:
             return 2.0
             
         # Get our remaining time and increment
         our_time = wtime if self.board.board.turn == chess.WHITE else btime
         our_inc = winc if self.board.board.turn == chess.WHITE else binc
         
-        if not our_time:
+        if our_time is None:
             return 2.0
             
         our_time /= 1000.0  # Convert to seconds
@@ -206,8 +374,8 @@ class SlowMateEngine:
         # Basic time allocation: divide remaining time by estimated moves
         base_time = our_time / estimated_moves_remaining + our_inc * 0.8
         
-        # Complexity adjustments
-        position_complexity = self._evaluate_position_complexity()
+        # Complexity adjustments (skipped in the emergency profile)
+        position_complexity = 0.5 if self.emergency else self._evaluate_position_complexity()
         if position_complexity > 0.7:
             base_time *= 1.5  # Spend more time on complex positions
         elif position_complexity < 0.3:
@@ -216,63 +384,69 @@ class SlowMateEngine:
         # Ensure minimum and maximum bounds
         base_time = max(0.1, min(base_time, our_time * 0.1))
         
+        # Leave room for GUI/pipe latency and our own measured overshoot
+        base_time = max(0.01, base_time - self.uci.move_overhead.overhead_ms() / 1000.0)
+        
         return base_time
     
+    def _instant_move(self, moves: List[int]) -> Optional[int]:
+        """Emergency profile: a book move, else the TT move of a searched root."""
+        fen = self.board.board.fen()
+        book_move = self.opening_book.select_book_move(fen) if self.opening_book.in_book(fen) else None
+        if book_move:
+            move = encode_chess_move(self.board.board, chess.Move.from_uci(book_move))
+            if move in moves:
+                self.uci._out(f"info string emergency: book move {book_move}")
+                return move
+        entry = self.tt.table.get(self.board.zobrist)
+        if entry is not None and entry.move in moves and entry.depth >= self.emergency_depth:
+            self.uci._out(f"info string emergency: TT move {to_chess_move(entry.move).uci()} "
+                          f"(depth {entry.depth})")
+            return entry.move
+        return None
+    
     def _evaluate_position_complexity(self) -> float:
         """Evaluate the complexity of the current position (0.0 to 1.0)."""
-        board = self.board.board
-        complexity = 0.0
-        
-        # Material on board
-        total_material = sum(len(board.pieces(piece_type, color)) 
-                           for piece_type in chess.PIECE_TYPES 
-                           for color in chess.COLORS)
-        complexity += min(total_material / 32.0, 1.0) * 0.3
-        
-        # Number of legal moves
-        legal_moves = len(list(board.legal_moves))
-        complexity += min(legal_moves / 40.0, 1.0) * 0.4
-        
-        # Checks and tactics
-        if board.is_check():
-            complexity += 0.2
-        if any(board.is_capture(move) for move in board.legal_moves):
-            complexity += 0.1
-            
-        return min(complexity, 1.0)
+        return COMPLEXITY.score(self.board.board, self.board.zobrist)
     
     def _search_depth_with_pv(self, depth: int, alpha: int, beta: int, 
-                             moves: List[chess.Move]) -> Tuple[Optional[chess.Move], int, List[chess.Move]]:
+                             moves: List[int]) -> Tuple[Optional[int], int, List[int]]:
         """Search all moves at a given depth and collect principal variation."""
         best_move = None
         best_score = -30000
         best_pv = []
         
         # Order moves for better alpha-beta pruning
-        pos_key = hash(self.board.get_fen())
+        pos_key = self.board.zobrist
         tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
         tt_move = tt_entry[1] if tt_entry else None
         
         ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move,
+            self.board.board, move_infos(self.board.board, moves, checks=True), depth, tt_move,
             use_killer=True, prioritize_captures=True
         )
+        legal_moves = set(moves)
+        self.root_scores = {}
         
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
+        for i, info in enumerate(ordered_moves):
+            if self.stop_event.is_set():
                 break
                 
             # Validate move legality
-            if move not in moves:
+            move = info & INFO_MOVE_MASK
+            if move not in legal_moves:
                 continue
+            if self.uci.info_due():
+                self._send_progress(f"depth {depth} currmove {to_chess_move(move).uci()} "
+                                    f"currmovenumber {i + 1} ")
                 
-            self.board.make_move(move)
+            self.board.make_move(to_chess_move(move))
             
             # Late move reduction for non-critical moves
             reduction = 0
             if (depth >= 3 and i >= self.late_move_reduction_threshold 
-                and not self.board.board.is_check() 
-                and not self.board.board.is_capture(move)):
+                and not info & INFO_CHECK_BIT 
+                and not move & CAPTURE_BIT):
                 reduction = 1
             
             score, child_pv = self._negamax_with_pv(depth - 1 - reduction, -beta, -alpha)
@@ -284,8 +458,13 @@ class SlowMateEngine:
                 score = -score
             
             self.board.unmake_move()
+            if self.stop_event.is_set():
+                break  # Interrupted: this move's score is meaningless
+            self.root_scores[move] = score
             
             if score > best_score:
+                if best_move is not None:
+                    self.best_move_changes += 1
                 best_score = score
                 best_move = move
                 best_pv = [move] + child_pv
@@ -293,13 +472,13 @@ class SlowMateEngine:
                 
             if alpha >= beta:
                 # Update killer moves and history
-                if not self.board.board.is_capture(move):
+                if not move & CAPTURE_BIT:
                     self._update_killer_move(move, depth)
                     self._update_history(move, depth)
                 break
                 
-        # Store in transposition table
-        if best_move:
+        # Store in transposition table (not a partial iteration)
+        if best_move and not self.stop_event.is_set():
             node_type = NodeType.EXACT
             if best_score <= alpha:
                 node_type = NodeType.UPPER
@@ -310,36 +489,41 @@ class SlowMateEngine:
         return best_move, best_score, best_pv
 
     def _search_depth(self, depth: int, alpha: int, beta: int, 
-                     moves: List[chess.Move]) -> Tuple[Optional[chess.Move], int]:
+                     moves: List[int]) -> Tuple[Optional[int], int]:
         """Search all moves at a given depth."""
         best_move = None
         best_score = -30000
         
         # Order moves for better alpha-beta pruning
-        pos_key = hash(self.board.get_fen())
+        pos_key = self.board.zobrist
         tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
         tt_move = tt_entry[1] if tt_entry else None
         
         ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move,
+            self.board.board, move_infos(self.board.board, moves, checks=True), depth, tt_move,
             use_killer=True, prioritize_captures=True
         )
+        legal_moves = set(moves)
         
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
+        for i, info in enumerate(ordered_moves):
+            if self.stop_event.is_set():
                 break
                 
             # Validate move legality
-            if move not in moves:
+            move = info & INFO_MOVE_MASK
+            if move not in legal_moves:
                 continue
+            if self.uci.info_due():
+                self._send_progress(f"depth {depth} currmove {to_chess_move(move).uci()} "
+                                    f"currmovenumber {i + 1} ")
                 
-            self.board.make_move(move)
+            self.board.make_move(to_chess_move(move))
             
             # Late move reduction for non-critical moves
             reduction = 0
             if (depth >= 3 and i >= self.late_move_reduction_threshold 
-                and not self.board.board.is_check() 
-                and not self.board.board.is_capture(move)):
+                and not info & INFO_CHECK_BIT 
+                and not move & CAPTURE_BIT):
                 reduction = 1
             
             score = -self._negamax(depth - 1 - reduction, -beta, -alpha)
@@ -357,7 +541,7 @@ class SlowMateEngine:
                 
             if alpha >= beta:
                 # Update killer moves and history
-                if not self.board.board.is_capture(move):
+                if not move & CAPTURE_BIT:
                     self._update_killer_move(move, depth)
                     self._update_history(move, depth)
                 break
@@ -373,19 +557,31 @@ class SlowMateEngine:
             
         return best_move, best_score
     
-    def _negamax_with_pv(self, depth: int, alpha: int, beta: int) -> Tuple[int, List[chess.Move]]:
+    def _send_progress(self, fields: str = ""):
+        """Periodic search progress line (the caller checks the rate limit)."""
+        if self.start_time is None:
+            return  # Root search driven directly, outside search()
+        elapsed = time.time() - self.start_time
+        self.uci._out(f"info {fields}nodes {self.nodes} nps {int(self.nodes / max(elapsed, 0.001))} "
+                      f"hashfull {self.tt.hashfull()} time {int(elapsed * 1000)}")
+    
+    def _negamax_with_pv(self, depth: int, alpha: int, beta: int) -> Tuple[int, List[int]]:
         """Enhanced negamax search with principal variation collection."""
         self.nodes += 1
+        if self.nodes >= self.progress_nodes:
+            self.progress_nodes = self.nodes + 4096
+            if self.uci.info_due():
+                self._send_progress()
         
         # Time management check
-        if self.uci.stop_requested:
+        if self.stop_event.is_set():
             return 0, []
         if self.search_deadline and time.time() > self.search_deadline:
-            self.uci.stop_requested = True
+            self.stop_event.set()
             return 0, []
             
         # Transposition table lookup
-        pos_key = hash(self.board.get_fen())
+        pos_key = self.board.zobrist
         tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
         if tt_entry:
             return tt_entry[0], []
@@ -397,40 +593,39 @@ class SlowMateEngine:
         # Null move pruning
         if (depth >= 3 and not self.board.board.is_check() 
             and self._has_non_pawn_material()):
-            self.board.board.push(chess.Move.null())
+            self.board.make_move(chess.Move.null())
             null_score, _ = self._negamax_with_pv(depth - 1 - self.null_move_reduction, -beta, -alpha)
             null_score = -null_score
-            self.board.board.pop()
+            self.board.unmake_move()
             
             if null_score >= beta:
                 return beta, []
         
-        # Get and order moves
-        moves = self.move_generator.get_legal_moves()
-        if not moves:
-            if self.board.board.is_check():
-                return -20000 + self.nodes, []  # Checkmate (prefer shorter mates)
-            return 0, []  # Stalemate
-            
+        # Get and order pseudo-legal moves; legality is checked as each is tried
+        infos, pins, in_check = self._node_moves(pos_key)
         tt_move = tt_entry[1] if tt_entry else None
         ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move
+            self.board.board, infos, depth, tt_move
         )
         
         best_score = -30000
         best_move = None
         best_pv = []
         
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
+        legal_tried = 0
+        
+        for i, info in enumerate(ordered_moves):
+            if self.stop_event.is_set():
                 break
+            move = info & INFO_MOVE_MASK
+            if not self.move_generator.is_legal(move, pins):
+                continue
+            legal_tried += 1
                 
             # Check extension
-            extension = 0
-            if self.board.board.is_check():
-                extension = 1
+            extension = 1 if in_check else 0
                 
-            self.board.make_move(move)
+            self.board.make_move(to_chess_move(move))
             score, child_pv = self._negamax_with_pv(depth - 1 + extension, -beta, -alpha)
             score = -score
             self.board.unmake_move()
@@ -443,7 +638,7 @@ class SlowMateEngine:
                 
             if alpha >= beta:
                 # Update move ordering data
-                if not self.board.board.is_capture(move):
+                if not move & CAPTURE_BIT:
                     self._update_killer_move(move, depth)
                     self._update_history(move, depth)
                 break
@@ -456,22 +651,29 @@ class SlowMateEngine:
             elif best_score >= beta:
                 node_type = NodeType.LOWER
             self.tt.store(pos_key, depth, best_score, node_type, best_move)
+        elif not legal_tried and not self.stop_event.is_set():
+            # No legal move: checkmate (prefer shorter mates) or stalemate
+            return self._mate_score() if in_check else 0, []
             
         return best_score, best_pv
 
     def _negamax(self, depth: int, alpha: int, beta: int) -> int:
         """Enhanced negamax search with pruning and extensions."""
         self.nodes += 1
+        if self.nodes >= self.progress_nodes:
+            self.progress_nodes = self.nodes + 4096
+            if self.uci.info_due():
+                self._send_progress()
         
         # Time management check
-        if self.uci.stop_requested:
+        if self.stop_event.is_set():
             return 0
         if self.search_deadline and time.time() > self.search_deadline:
-            self.uci.stop_requested = True
+            self.stop_event.set()
             return 0
             
         # Transposition table lookup
-        pos_key = hash(self.board.get_fen())
+        pos_key = self.board.zobrist
         tt_entry = self.tt.lookup(pos_key, depth, alpha, beta)
         if tt_entry:
             return tt_entry[0]
@@ -483,38 +685,37 @@ class SlowMateEngine:
         # Null move pruning
         if (depth >= 3 and not self.board.board.is_check() 
             and self._has_non_pawn_material()):
-            self.board.board.push(chess.Move.null())
+            self.board.make_move(chess.Move.null())
             null_score = -self._negamax(depth - 1 - self.null_move_reduction, -beta, -alpha)
-            self.board.board.pop()
+            self.board.unmake_move()
             
             if null_score >= beta:
                 return beta
         
-        # Get and order moves
-        moves = self.move_generator.get_legal_moves()
-        if not moves:
-            if self.board.board.is_check():
-                return -20000 + self.nodes  # Checkmate (prefer shorter mates)
-            return 0  # Stalemate
-            
+        # Get and order pseudo-legal moves; legality is checked as each is tried
+        infos, pins, in_check = self._node_moves(pos_key)
         tt_move = tt_entry[1] if tt_entry else None
         ordered_moves = self.move_orderer.order_moves(
-            self.board.board, moves, depth, tt_move
+            self.board.board, infos, depth, tt_move
         )
         
         best_score = -30000
         best_move = None
         
-        for i, move in enumerate(ordered_moves):
-            if self.uci.stop_requested:
+        legal_tried = 0
+        
+        for i, info in enumerate(ordered_moves):
+            if self.stop_event.is_set():
                 break
+            move = info & INFO_MOVE_MASK
+            if not self.move_generator.is_legal(move, pins):
+                continue
+            legal_tried += 1
                 
             # Check extension
-            extension = 0
-            if self.board.board.is_check():
-                extension = 1
+            extension = 1 if in_check else 0
                 
-            self.board.make_move(move)
+            self.board.make_move(to_chess_move(move))
             score = -self._negamax(depth - 1 + extension, -beta, -alpha)
             self.board.unmake_move()
             
@@ -525,7 +726,7 @@ class SlowMateEngine:
                 
             if alpha >= beta:
                 # Update move ordering data
-                if not self.board.board.is_capture(move):
+                if not move & CAPTURE_BIT:
                     self._update_killer_move(move, depth)
                     self._update_history(move, depth)
                 break
@@ -538,41 +739,77 @@ class SlowMateEngine:
             elif best_score >= beta:
                 node_type = NodeType.LOWER
             self.tt.store(pos_key, depth, best_score, node_type, best_move)
+        elif not legal_tried and not self.stop_event.is_set():
+            # No legal move: checkmate (prefer shorter mates) or stalemate
+            return self._mate_score() if in_check else 0
             
         return best_score
     
+    def _node_moves(self, pos_key: int) -> Tuple[List[int], tuple, bool]:
+        """Move infos, pin state and in-check flag of the current position,
+        from the move-list cache when the position was visited before."""
+        entry = self.move_cache.get(pos_key)
+        if entry is None:
+            board = self.board.board
+            moves, pins = self.move_generator.get_pseudo_legal_moves()
+            entry = (move_infos(board, moves), pins, board.is_check())
+            self.move_cache.store(pos_key, entry)
+        return entry
+    
     def _quiescence_search(self, alpha: int, beta: int, depth: int) -> int:
         """Quiescence search to avoid horizon effect."""
         self.nodes += 1
+        board = self.board.board
+        
+        # Terminal detection (the evaluator is purely static). In check the
+        # evasion list is needed anyway; otherwise stalemate is only realistic
+        # with a bare king and pawns, where move generation is tiny.
+        in_check = board.is_check()
+        if in_check:
+            evasions, pins = self.move_generator.get_pseudo_legal_moves()  # Generated legal
+            if not evasions:
+                return self._mate_score()
+        elif not self._has_non_pawn_material() and not any(board.generate_legal_moves()):
+            return 0
         
-        # Evaluate current position
-        stand_pat = int(self.evaluator.evaluate(self.board))
+        # Evaluate current position (lazy: cheap terms only when far outside the
+        # window; material + PST only in the emergency profile)
+        if self.emergency:
+            stand_pat = int(getattr(self.evaluator, 'fallback', self.evaluator).evaluate_fast(self.board))
+        else:
+            stand_pat = int(self.evaluator.evaluate(self.board, alpha, beta))
         
         if depth <= 0 or stand_pat >= beta:
             return stand_pat
             
         alpha = max(alpha, stand_pat)
         
-        # Only consider captures in quiescence
-        moves = [move for move in self.move_generator.get_legal_moves() 
-                if self.board.board.is_capture(move)]
+        # Only consider captures in quiescence (pseudo-legal, checked when tried)
+        if in_check:
+            moves = [move for move in evasions if move & CAPTURE_BIT]
+        else:
+            moves, pins = self.move_generator.get_pseudo_legal_moves(captures_only=True)
         
         if not moves:
             return stand_pat
             
         # Order captures by SEE (Static Exchange Evaluation)
-        moves.sort(key=lambda m: self._see_capture_value(m), reverse=True)
+        infos = move_infos(board, moves)
+        infos.sort(key=self._see_capture_value, reverse=True)
         
-        for move in moves:
-            if self.uci.stop_requested:
+        for info in infos:
+            if self.stop_event.is_set():
                 break
                 
             # Delta pruning: skip captures that can't improve alpha
-            capture_value = self._see_capture_value(move)
+            capture_value = self._see_capture_value(info)
             if stand_pat + capture_value + 200 < alpha:  # 200cp margin
                 continue
+            move = info & INFO_MOVE_MASK
+            if not self.move_generator.is_legal(move, pins):
+                continue
                 
-            self.board.make_move(move)
+            self.board.make_move(to_chess_move(move))
             score = -self._quiescence_search(-beta, -alpha, depth - 1)
             self.board.unmake_move()
             
@@ -582,17 +819,17 @@ class SlowMateEngine:
             
         return alpha
     
-    def _see_capture_value(self, move: chess.Move) -> int:
-        """Static Exchange Evaluation for captures."""
-        board = self.board.board
-        if not board.is_capture(move):
-            return 0
-            
-        captured_piece = board.piece_at(move.to_square)
+    def _mate_score(self) -> int:
+        """Score for the side to move being checkmated, preferring shorter mates."""
+        return -20000 + (len(self.board.board.move_stack) - self.root_ply)
+    
+    def _see_capture_value(self, info: int) -> int:
+        """Static Exchange Evaluation for captures (from a move info)."""
+        captured_piece = (info >> INFO_VICTIM_SHIFT) & 7
         if not captured_piece:
-            return 0
+            return 0  # Not a capture, or en passant
             
-        return self.evaluator.piece_values.get(captured_piece.piece_type, 0)
+        return self.evaluator.piece_values.get(captured_piece, 0)
     
     def _has_non_pawn_material(self) -> bool:
         """Check if current side has non-pawn material."""
@@ -604,7 +841,7 @@ class SlowMateEngine:
                 return True
         return False
     
-    def _update_killer_move(self, move: chess.Move, depth: int):
+    def _update_killer_move(self, move: int, depth: int):
         """Update killer move table."""
         if depth < len(self.killer_moves):
             killers = self.killer_moves[depth]
@@ -613,12 +850,9 @@ class SlowMateEngine:
                 if len(killers) > 2:  # Keep only 2 killer moves per depth
                     killers.pop()
     
-    def _update_history(self, move: chess.Move, depth: int):
+    def _update_history(self, move: int, depth: int):
         """Update history heuristic."""
-        key = (move.from_square, move.to_square)
-        if key not in self.history_table:
-            self.history_table[key] = 0
-        self.history_table[key] += depth * depth  # Depth squared bonus
+        self.history_table[move & 0xFFF] += depth * depth  # Depth squared bonus (from | to << 6)
     
     def get_best_move(self) -> Optional[chess.Move]:
         """Get the best move from the last search."""
@@ -210,6 +210,9 @@ class SlowMateEngine:
             self.uci.stop_requested = True
             return 0
         if depth == 0:
+            # Evaluator is static; detect mate/stalemate here
+            if not any(self.board.board.generate_legal_moves()):
+                return -20000 if self.board.is_check() else 0
             return int(self.evaluator.evaluate(self.board))
             
         # Get ordered moves
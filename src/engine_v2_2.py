@@ -5,6 +5,7 @@ Target: 650-750 ELO range with systematic improvements
 """
 
 import chess
+import threading
 import time
 import math
 from typing import Optional, List, Tuple, Dict
@@ -12,6 +13,7 @@ from typing import Optional, List, Tuple, Dict
 from .core.board import Board
 from .core.moves import MoveGenerator
 from .core.enhanced_evaluate import EnhancedEvaluator
+from .core.complexity import COMPLEXITY
 from .search.enhanced import TranspositionTable, MoveOrderer, NodeType
 from .uci.protocol_v2_2 import UCIProtocol
 
@@ -27,6 +29,7 @@ class SlowMateEngine:
         self.tt = TranspositionTable(size_mb=64)  # Larger hash table
         self.move_orderer = MoveOrderer()
         self.uci = UCIProtocol(self)
+        self.stop_event = self.uci.stop_event  # The running search's stop signal
         self.nodes = 0
         self.max_depth = 6  # Increased from v2.1's 4
         self.search_deadline = None
@@ -91,30 +94,22 @@ class SlowMateEngine:
     def _analyze_position_complexity(self):
         """v2.2 ENHANCEMENT: Analyze position complexity for time management."""
         try:
-            legal_moves = list(self.board.board.legal_moves)
-            num_legal_moves = len(legal_moves)
-            
-            # Count tactical elements
-            captures = sum(1 for move in legal_moves if self.board.board.is_capture(move))
-            checks = sum(1 for move in legal_moves if self.board.board.gives_check(move))
-            
-            # Piece activity (simplified)
-            piece_count = len(self.board.board.piece_map())
+            features = COMPLEXITY.features(self.board.board, self.board.zobrist)
             
-            # Calculate complexity score
+            # Calculate complexity score from the cached bitboard features
             self.position_complexity = (
-                num_legal_moves * 2 +
-                captures * 5 +
-                checks * 3 +
-                max(0, piece_count - 10) * 2
+                features.mobility * 2 +
+                features.captures * 5 +
+                features.checks * 3 +
+                max(0, features.pieces - 10) * 2
             )
             
             # Mark as critical if high complexity
             self.critical_position = (
                 self.position_complexity > 60 or
-                captures > 3 or
-                checks > 2 or
-                self.board.is_check()
+                features.captures > 3 or
+                features.checks > 2 or
+                features.in_check
             )
             
         except Exception:
@@ -185,19 +180,30 @@ class SlowMateEngine:
             
             allocated_time = max(min_time, min(allocated_time, max_time))
             
+            # Leave room for GUI/pipe latency and our own measured overshoot
+            allocated_time = max(10, allocated_time - self.uci.move_overhead.overhead_ms())
+            
             return allocated_time / 1000.0  # Convert to seconds
         
         return base_time
         
-    def search(self, time_limit_ms: Optional[int] = None, depth_override: Optional[int] = None, **kwargs) -> Optional[chess.Move]:
+    def search(self, time_limit_ms: Optional[int] = None, depth_override: Optional[int] = None,
+               stop_event: Optional[threading.Event] = None, go_time: Optional[float] = None,
+               **kwargs) -> Optional[chess.Move]:
         """v2.2 ENHANCEMENT: Advanced iterative deepening search with aspiration windows."""
+        # The caller's go owns stop_event; a direct call gets a fresh one
+        if stop_event is None:
+            stop_event = self.uci.stop_event = threading.Event()
+        self.stop_event = stop_event
         try:
-            # Enhanced time management
+            # Enhanced time management (complexity of the position actually
+            # searched: the protocol plays moves on the board directly)
+            self._analyze_position_complexity()
             allocated_time = self._calculate_time_allocation(time_limit_ms, **kwargs)
             
             self.nodes = 0
             self.last_score = None
-            self.start_time = time.time()
+            self.start_time = go_time if go_time is not None else time.time()
             self.search_deadline = self.start_time + allocated_time
             
             # Reset search statistics
@@ -225,7 +231,7 @@ class SlowMateEngine:
             
             # Iterative deepening loop
             for current_depth in range(1, max_depth + 1):
-                if self.uci.stop_requested or time.time() > self.search_deadline:
+                if self.stop_event.is_set() or time.time() > self.search_deadline:
                     break
                     
                 try:
@@ -248,7 +254,7 @@ class SlowMateEngine:
                         score = self._negamax(current_depth, -30000, 30000, best_move)
                     
                     # Update best move if search completed
-                    if not self.uci.stop_requested:
+                    if not self.stop_event.is_set():
                         iteration_move = self._get_best_move_from_root(current_depth)
                         if iteration_move and self._validate_move_legal(iteration_move):
                             best_move = iteration_move
@@ -349,10 +355,10 @@ class SlowMateEngine:
         alpha_orig = alpha
         
         # Time and stop checks
-        if self.uci.stop_requested:
+        if self.stop_event.is_set():
             return 0
         if self.search_deadline and time.time() > self.search_deadline:
-            self.uci.stop_requested = True
+            self.stop_event.set()
             return 0
             
         # Check transposition table
@@ -478,6 +484,10 @@ class SlowMateEngine:
         """v2.2 ENHANCEMENT: Quiescence search for tactical stability."""
         self.nodes += 1
         
+        # Evaluator is static; detect mate/stalemate here
+        if not any(self.board.board.generate_legal_moves()):
+            return -20000 + (self.max_depth + qs_depth) if self.board.is_check() else 0
+        
         if qs_depth >= self.quiescence_max_depth:
             return int(self.evaluator.evaluate(self.board))
         
@@ -4,10 +4,15 @@ Version: 1.0.0-BETA
 Based on stable v0.2.01 architecture
 """
 
-import chess
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import sys
+from collections import OrderedDict
 from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+import chess
+
+from ..core.movegen import (CAPTURE_BIT, PROMOTION_BIT, NULL_MOVE, INFO_MOVE_MASK,
+                            INFO_ATTACKER_SHIFT, INFO_VICTIM_SHIFT)
 
 class NodeType(Enum):
     """Search node types for transposition table."""
@@ -15,15 +20,18 @@ class NodeType(Enum):
     UPPER = 1    # Upper bound (beta cutoff)
     LOWER = 2    # Lower bound (failed low)
 
-@dataclass
 class TTEntry:
     """Transposition table entry."""
-    key: int         # Zobrist hash key
-    depth: int       # Search depth
-    score: int       # Position score
-    node_type: NodeType  # Type of score
-    move: Optional[chess.Move]  # Best move found
-    age: int        # Search iteration when entry was stored
+    __slots__ = ('key', 'depth', 'score', 'node_type', 'move', 'age')
+    
+    def __init__(self, key: int, depth: int, score: int, node_type: NodeType,
+                 move, age: int):
+        self.key = key              # Position hash key
+        self.depth = depth          # Search depth
+        self.score = score          # Position score
+        self.node_type = node_type  # Type of score
+        self.move = move            # Best move found (encoded int for the v3 engine)
+        self.age = age              # Search iteration when entry was stored
 
 class TranspositionTable:
     """Enhanced transposition table with aging and replacement scheme."""
@@ -72,6 +80,77 @@ class TranspositionTable:
                 return beta, entry.move
                 
         return None
+    
+    def hashfull(self) -> int:
+        """Table occupancy in permille, as reported by UCI ``info hashfull``."""
+        return min(1000, len(self.table) * 1000 // max(1, self.size))
+
+class MoveListCache:
+    """Bounded LRU cache of per-position move lists keyed by Zobrist key.
+    
+    Iterative deepening revisits the same interior nodes every iteration;
+    a hit skips move generation and the move-info pass. Entries are
+    whatever the search stores (the v3 engine: move infos, pin state and
+    the in-check flag). Memory use is an estimate of the cached objects.
+    """
+    
+    ENTRY_OVERHEAD = 200  # Dict slot, key, entry tuple and pin state, in bytes
+    
+    def __init__(self, max_entries: int = 16384):
+        """Initialize the cache.
+        
+        Args:
+            max_entries: Positions kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[int, tuple]' = OrderedDict()
+        self.memory = 0  # Estimated bytes
+        self.hits = 0
+        self.lookups = 0
+        
+    def get(self, key: int) -> Optional[tuple]:
+        """Return the cached entry for ``key``, or None."""
+        self.lookups += 1
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return entry
+        
+    def store(self, key: int, entry: tuple) -> None:
+        """Cache ``entry`` (whose first item is the move list) for ``key``."""
+        if key in self.entries:
+            self.memory -= self._entry_size(self.entries.pop(key))
+        elif len(self.entries) >= self.max_entries:
+            _, evicted = self.entries.popitem(last=False)
+            self.memory -= self._entry_size(evicted)
+        self.entries[key] = entry
+        self.memory += self._entry_size(entry)
+        
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        self.entries.clear()
+        self.memory = 0
+        self.reset_stats()
+        
+    def reset_stats(self) -> None:
+        """Reset the hit counters (entries are kept)."""
+        self.hits = 0
+        self.lookups = 0
+        
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+        
+    def summary(self) -> str:
+        """One-line statistics for ``info string`` output."""
+        return (f"movecache hits {self.hits}/{self.lookups} ({self.hit_rate:.0%}) "
+                f"entries {len(self.entries)}/{self.max_entries} memory {self.memory // 1024} KB")
+        
+    def _entry_size(self, entry: tuple) -> int:
+        moves = entry[0]
+        return self.ENTRY_OVERHEAD + sys.getsizeof(moves) + 28 * len(moves)
+
 
 class MoveOrderer:
     """Advanced move ordering system."""
@@ -183,3 +262,82 @@ class MoveOrderer:
             chess.KING: 20000
         }
         return values[piece_type]
+
+
+class EncodedMoveOrderer(MoveOrderer):
+    """Move ordering for move infos (``core.movegen.move_infos``).
+    
+    Same scoring as ``MoveOrderer``, reading the capture, victim, attacker
+    and promotion facts from each packed record instead of the board.
+    Killers are kept as lists of encoded moves, and history and counter
+    moves in flat tables indexed by ``move & 0xFFF`` (from and to square),
+    so no ``chess.Move`` or tuple is built per node.
+    """
+    
+    def __init__(self):
+        """Initialize move ordering tables."""
+        super().__init__()
+        self.killer_moves: Dict[int, List[int]] = {}  # depth -> moves
+        self.history_table: List[int] = [0] * 4096  # from | to << 6 -> score
+        self.counter_moves: List[int] = [NULL_MOVE] * 4096  # opponent from | to << 6 -> counter
+        
+    def order_moves(self, board: chess.Board, moves: List[int], depth: int,
+                   tt_move: Optional[int] = None,
+                   use_killer: bool = False,
+                   prioritize_captures: bool = False) -> List[int]:
+        """Order move infos, supporting killer moves and capture prioritization."""
+        killers = self.killer_moves.get(depth, ()) if use_killer else ()
+        scored_moves = []
+        
+        for info in moves:
+            score = self._score_move(board, info, depth, tt_move)
+            if prioritize_captures and info & CAPTURE_BIT:
+                score += 5000
+            if info & INFO_MOVE_MASK in killers:
+                score += 4000
+            scored_moves.append((score, info))
+            
+        scored_moves.sort(key=lambda x: x[0], reverse=True)
+        return [info for _, info in scored_moves]
+        
+    def _score_move(self, board: chess.Board, info: int, depth: int,
+                    tt_move: Optional[int]) -> int:
+        """Score a move info for ordering."""
+        move = info & INFO_MOVE_MASK
+        if move == tt_move:
+            return 20000  # Hash move
+            
+        score = 0
+        
+        # Captures (en passant has no victim on the target square)
+        victim = (info >> INFO_VICTIM_SHIFT) & 7
+        if victim:
+            score = 10000 + self._mvv_lva(victim, (info >> INFO_ATTACKER_SHIFT) & 7)
+                
+        # Promotions
+        if move & PROMOTION_BIT:
+            score += 9000 + self._get_piece_value(((move >> 12) & 3) + chess.KNIGHT)
+            
+        # Killer moves
+        killers = self.killer_moves.get(depth)
+        if killers and move in killers:
+            score += 8000 + (1000 if move == killers[0] else 0)
+            
+        # Counter moves
+        if board.move_stack:
+            last_move = board.move_stack[-1]
+            if last_move and move == self.counter_moves[last_move.from_square | (last_move.to_square << 6)]:
+                score += 7000
+                
+        # History heuristic
+        score += self.history_table[move & 0xFFF]
+        
+        return score
+        
+    def update_history(self, move: int, depth: int) -> None:
+        """Update history table."""
+        self.history_table[move & 0xFFF] += depth * depth
+        
+    def update_counter_move(self, opponent_move: chess.Move, counter_move: int) -> None:
+        """Update counter move table."""
+        self.counter_moves[opponent_move.from_square | (opponent_move.to_square << 6)] = counter_move
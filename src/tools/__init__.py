@@ -0,0 +1,5 @@
+"""
+SlowMate Chess Engine - Tools Module
+Diagnostic and benchmarking tools shared by the CLI and the UCI front end
+Version: 1.0.0-BETA
+"""
@@ -0,0 +1,181 @@
+"""
+SlowMate Chess Engine - Perft Tool
+Counts move-generation leaf nodes through Board.make_move/unmake_move to
+validate the move generators and measure their throughput, with per-move
+divide output, optional bulk counting at the last ply and root moves split
+across worker processes
+Version: 1.0.0-BETA
+
+Usage:
+    python -m slowmate.tools.perft [startpos kiwipete ... | all] --depth 4
+        [--fen FEN] [--generator bitboard] [--bulk] [--divide] [--jobs 4]
+
+The same tool backs the ``perft <depth> [bulk] [generator <name>]`` (or
+``go perft <depth>``) UCI command, which runs on the current position.
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import chess
+
+from ..core.board import Board
+from ..core.movegen import to_chess_move
+from ..core.moves import MoveGenerator
+
+
+# Standard positions with published node counts, indexed by depth
+PERFT_POSITIONS = {
+    'startpos': (chess.STARTING_FEN, [1, 20, 400, 8902, 197281, 4865609]),
+    'kiwipete': ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                 [1, 48, 2039, 97862, 4085603]),
+    'position3': ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", [1, 14, 191, 2812, 43238, 674624]),
+    'position4': ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                  [1, 6, 264, 9467, 422333]),
+    'position5': ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                  [1, 44, 1486, 62379, 2103487]),
+}
+
+# 'python-chess': MoveGenerator.get_legal_moves; 'bitboard': the bitboard
+# generator's legal moves; 'pseudo': pseudo-legal moves filtered with
+# is_legal, as the search does
+GENERATORS = ('python-chess', 'bitboard', 'pseudo')
+
+
+@dataclass
+class PerftResult:
+    """Outcome of one perft run."""
+    nodes: int
+    seconds: float
+    divide: Dict[str, int] = field(default_factory=dict)  # root move (UCI) -> nodes
+    expected: Optional[int] = None  # Published count, when known
+
+    @property
+    def nps(self) -> int:
+        return int(self.nodes / max(self.seconds, 1e-9))
+
+    @property
+    def ok(self) -> Optional[bool]:
+        """True/False against the published count, None if there is none."""
+        return None if self.expected is None else self.nodes == self.expected
+
+
+def expected_count(fen: str, depth: int) -> Optional[int]:
+    """Published node count for ``fen`` at ``depth``, if it is a standard position."""
+    key = ' '.join(fen.split()[:4])
+    for position_fen, counts in PERFT_POSITIONS.values():
+        if ' '.join(position_fen.split()[:4]) == key and depth < len(counts):
+            return counts[depth]
+    return None
+
+
+def legal_moves(move_generator: MoveGenerator, generator: str = 'bitboard') -> List[chess.Move]:
+    """Legal moves of the generator's board, produced by ``generator``."""
+    if generator == 'python-chess':
+        return move_generator.get_legal_moves()
+    if generator == 'bitboard':
+        return [to_chess_move(move) for move in move_generator.bitboard.generate_list(move_generator.board.board)]
+    if generator == 'pseudo':
+        moves, pins = move_generator.get_pseudo_legal_moves()
+        return [to_chess_move(move) for move in moves if move_generator.is_legal(move, pins)]
+    raise ValueError(f"unknown generator: {generator}")
+
+
+def perft(board: Board, depth: int, generator: str = 'bitboard', bulk: bool = False,
+          move_generator: Optional[MoveGenerator] = None) -> int:
+    """Leaf nodes at ``depth``; with ``bulk`` the last ply is counted, not played."""
+    if depth <= 0:
+        return 1
+    if move_generator is None:
+        move_generator = MoveGenerator(board)
+    moves = legal_moves(move_generator, generator)
+    if bulk and depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        board.make_move(move)
+        nodes += perft(board, depth - 1, generator, bulk, move_generator)
+        board.unmake_move()
+    return nodes
+
+
+def _divide_move(args):
+    """Worker: nodes below one root move."""
+    fen, move, depth, generator, bulk = args
+    board = Board()
+    board.set_fen(fen)
+    board.make_move(chess.Move.from_uci(move))
+    return move, perft(board, depth - 1, generator, bulk)
+
+
+def run_perft(fen: str, depth: int, generator: str = 'bitboard', bulk: bool = False,
+              jobs: int = 1) -> PerftResult:
+    """Divide ``fen`` to ``depth``, spreading root moves over ``jobs`` processes."""
+    board = Board()
+    board.set_fen(fen)
+    start = time.perf_counter()
+    if depth <= 0:
+        return PerftResult(1, time.perf_counter() - start, {}, expected_count(fen, depth))
+
+    root_moves = [move.uci() for move in legal_moves(MoveGenerator(board), generator)]
+    tasks = [(fen, move, depth, generator, bulk) for move in root_moves]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(min(jobs, len(tasks))) as pool:
+            divide = dict(pool.map(_divide_move, tasks))
+    elif bulk and depth == 1:
+        divide = {move: 1 for move in root_moves}
+    else:
+        divide = dict(_divide_move(task) for task in tasks)
+    return PerftResult(sum(divide.values()), time.perf_counter() - start, divide, expected_count(fen, depth))
+
+
+def format_result(name: str, depth: int, result: PerftResult) -> str:
+    """One summary line for a perft run."""
+    status = {None: "", True: "  ok", False: f"  MISMATCH (expected {result.expected})"}[result.ok]
+    return (f"{name:<10} depth {depth}  nodes {result.nodes:>9}  time {result.seconds:6.2f}s  "
+            f"nps {result.nps:>8}{status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Perft / divide for the SlowMate move generators")
+    parser.add_argument('positions', nargs='*', default=['all'],
+                        help=f"Standard positions ({', '.join(PERFT_POSITIONS)}) or 'all'")
+    parser.add_argument('--fen', help="Run this position instead")
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--generator', choices=GENERATORS, default='bitboard')
+    parser.add_argument('--bulk', action='store_true', help="Count the last ply without playing it")
+    parser.add_argument('--divide', action='store_true', help="Print the node count of every root move")
+    parser.add_argument('--jobs', type=int, default=1, help="Worker processes for the root moves")
+    args = parser.parse_args()
+
+    if args.fen:
+        runs = [('fen', args.fen)]
+    else:
+        names = list(PERFT_POSITIONS) if 'all' in args.positions else args.positions
+        unknown = [name for name in names if name not in PERFT_POSITIONS]
+        if unknown:
+            parser.error(f"unknown position(s): {', '.join(unknown)}")
+        runs = [(name, PERFT_POSITIONS[name][0]) for name in names]
+
+    total_nodes, total_seconds, failures = 0, 0.0, 0
+    for name, fen in runs:
+        result = run_perft(fen, args.depth, args.generator, args.bulk, args.jobs)
+        if args.divide:
+            for move, nodes in result.divide.items():
+                print(f"  {move}: {nodes}")
+        print(format_result(name, args.depth, result))
+        total_nodes += result.nodes
+        total_seconds += result.seconds
+        failures += result.ok is False
+    print(f"Total: {total_nodes} nodes in {total_seconds:.2f}s = {int(total_nodes / max(total_seconds, 1e-9))} nps "
+          f"({args.generator}{', bulk' if args.bulk else ''}, {args.jobs} job(s))")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
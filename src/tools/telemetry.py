@@ -0,0 +1,171 @@
+"""
+SlowMate Chess Engine - Time Telemetry Tool
+Appends one JSON line per ``go`` (clocks, allocated soft/hard time, time
+actually used, depth, nodes, per-iteration best-move changes, complexity)
+from a background writer thread, and summarizes such logs across games to
+tune the time manager
+Version: 1.0.0-BETA
+
+Usage:
+    setoption name TelemetryFile value slowmate_time.jsonl
+    python -m slowmate.tools.telemetry slowmate_time.jsonl [more.jsonl ...]
+"""
+
+import argparse
+import json
+import queue
+import statistics
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class TelemetryLog:
+    """Buffered JSONL sink; ``record`` only enqueues, a daemon thread writes.
+
+    The file is opened here, so an unwritable path raises ``OSError`` to the
+    caller instead of killing the writer thread.
+    """
+
+    def __init__(self, path: str, flush_every: int = 8):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self.flush_every = flush_every  # Records per write
+        self.written = 0
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=1024)
+        self._thread = threading.Thread(target=self._writer, name="slowmate-telemetry", daemon=True)
+        self._thread.start()
+
+    def record(self, record: Dict[str, Any]):
+        """Queue ``record``; never blocks the caller (drops when the queue is full)."""
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = 2.0):
+        """Write everything queued and stop the writer."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _writer(self):
+        """Drain the queue in batches, flushing after each batch or when idle."""
+        with self._file as f:
+            pending = 0
+            while True:
+                try:
+                    record = self._queue.get(timeout=1.0 if pending else None)
+                except queue.Empty:
+                    f.flush()
+                    pending = 0
+                    continue
+                if record is None:
+                    break
+                f.write(json.dumps(record, separators=(',', ':')) + "\n")
+                self.written += 1
+                pending += 1
+                if pending >= self.flush_every or self._queue.empty():
+                    f.flush()
+                    pending = 0
+
+
+def load_records(paths: Iterable[str]) -> List[Dict[str, Any]]:
+    """Read every record of the given JSONL files, skipping malformed lines."""
+    records = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    return records
+
+
+def _phase(ply: int) -> str:
+    return 'opening' if ply < 20 else 'middlegame' if ply < 60 else 'endgame'
+
+
+def summarize(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Time-use efficiency of timed searches.
+
+    - ``soft_use``: time used / soft limit (1.0 = allocation fully used)
+    - ``wasted``: share of the time spent after the last completed iteration,
+      i.e. on an iteration whose result was thrown away
+    - ``overruns``: searches that took longer than their hard limit
+    - per game phase: searches, mean time, mean depth, mean complexity
+
+    Emergency searches skip the complexity estimate (``complexity`` None)
+    and are left out of the complexity statistics.
+    """
+    timed = [r for r in records if r.get('hard_ms')]
+    games = {r.get('game') for r in records}
+    summary: Dict[str, Any] = {'games': len(games), 'searches': len(records), 'timed': len(timed)}
+    if not timed:
+        return summary
+
+    soft_use = [r['used_ms'] / r['soft_ms'] for r in timed if r.get('soft_ms')]
+    wasted = []
+    for r in timed:
+        completed = r['iterations'][-1][1] if r.get('iterations') else 0
+        if r['used_ms'] > 0:
+            wasted.append(max(0, r['used_ms'] - completed) / r['used_ms'])
+    summary.update({
+        'soft_use_mean': statistics.fmean(soft_use) if soft_use else 0.0,
+        'soft_use_median': statistics.median(soft_use) if soft_use else 0.0,
+        'wasted_mean': statistics.fmean(wasted) if wasted else 0.0,
+        'overruns': sum(r['used_ms'] > r['hard_ms'] for r in timed),
+        'depth_mean': statistics.fmean(r.get('depth', 0) for r in timed),
+        'changes_last_iteration_mean': statistics.fmean(
+            r['iterations'][-1][3] if r.get('iterations') else 0 for r in timed),
+    })
+
+    phases = {}
+    for name in ('opening', 'middlegame', 'endgame'):
+        group = [r for r in timed if _phase(r.get('ply', 0)) == name]
+        if group:
+            complexity = [r['complexity'] for r in group if r.get('complexity') is not None]
+            phases[name] = {
+                'searches': len(group),
+                'used_ms_mean': statistics.fmean(r['used_ms'] for r in group),
+                'depth_mean': statistics.fmean(r.get('depth', 0) for r in group),
+                'complexity_mean': statistics.fmean(complexity) if complexity else 0.0,
+            }
+    summary['phases'] = phases
+
+    # Does the time spent follow the complexity estimate?
+    pairs = [(r['complexity'], r['used_ms']) for r in timed if r.get('complexity') is not None]
+    if len(pairs) >= 3 and len({c for c, _ in pairs}) > 1 and len({u for _, u in pairs}) > 1:
+        summary['complexity_time_correlation'] = statistics.correlation(*zip(*pairs))
+    return summary
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Human-readable report of ``summarize``."""
+    lines = [f"{summary['games']} game(s), {summary['searches']} searches ({summary['timed']} timed)"]
+    if not summary['timed']:
+        return lines[0]
+    lines.append(f"soft limit used: mean {summary['soft_use_mean']:.2f}, median {summary['soft_use_median']:.2f}")
+    lines.append(f"time after last completed iteration: {summary['wasted_mean']:.1%}")
+    lines.append(f"hard limit overruns: {summary['overruns']}")
+    lines.append(f"mean depth {summary['depth_mean']:.2f}, "
+                 f"best-move changes in last iteration {summary['changes_last_iteration_mean']:.2f}")
+    for name, phase in summary['phases'].items():
+        lines.append(f"  {name:<10} {phase['searches']:>5} searches  {phase['used_ms_mean']:8.0f} ms  "
+                     f"depth {phase['depth_mean']:.2f}  complexity {phase['complexity_mean']:.2f}")
+    if 'complexity_time_correlation' in summary:
+        lines.append(f"complexity/time correlation: {summary['complexity_time_correlation']:+.2f}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize SlowMate time telemetry logs")
+    parser.add_argument('logs', nargs='+', help="JSONL files written via the TelemetryFile option")
+    parser.add_argument('--json', action='store_true', help="Print the summary as JSON")
+    args = parser.parse_args()
+    summary = summarize(load_records(args.logs))
+    print(json.dumps(summary, indent=2) if args.json else format_summary(summary))
+
+
+if __name__ == '__main__':
+    main()
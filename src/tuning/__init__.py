@@ -0,0 +1,5 @@
+"""
+SlowMate Chess Engine - Tuning Module
+Offline tools for fitting evaluation parameters
+Version: 1.0.0-BETA
+"""
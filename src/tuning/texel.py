@@ -0,0 +1,429 @@
+"""
+SlowMate Chess Engine - Texel Tuner
+Fits material, piece-square tables and pawn-structure terms of the
+EnhancedEvaluator to game results by minimizing the logistic (Texel) loss,
+with position extraction and gradient evaluation spread over a process pool
+(requires NumPy)
+Version: 1.0.0-BETA
+
+Usage:
+    python -m slowmate.tuning.texel [games/ extra.pgn ...] --output tuned_weights.json
+
+The evaluation is linear in the tuned parameters once the remaining terms
+(king safety, mobility, activity, center) are fixed, so every position is
+reduced once to an int8 feature row plus a constant; the fit then only needs
+matrix products over shared-memory feature matrices.
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import chess
+import chess.pgn
+import numpy as np
+
+from ..core import eval_tables
+from ..core.board import Board
+from ..core.enhanced_evaluate import (EnhancedEvaluator, TABLE_ATTRIBUTES, WEIGHTS_FORMAT,
+                                      WEIGHTS_VERSION)
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GAMES_DIR = os.path.join(REPO_ROOT, 'games')
+
+# Parameter vector layout: piece values (pawn..queen), the seven PSTs in
+# TABLE_ORDER, then doubled / isolated / passed bonus for relative ranks 1-6
+TABLE_ORDER = ['pawn', 'knight', 'bishop', 'rook', 'queen', 'king_middle', 'king_end']
+NUM_VALUES = 5
+NUM_TABLE_FEATURES = len(TABLE_ORDER) * 64
+NUM_PAWN_FEATURES = 8
+TABLE_OFFSET = NUM_VALUES
+PAWN_OFFSET = NUM_VALUES + NUM_TABLE_FEATURES
+NUM_PARAMETERS = PAWN_OFFSET + NUM_PAWN_FEATURES
+
+RESULTS = {'1-0': 1.0, '0-1': 0.0, '1/2-1/2': 0.5}
+
+
+# ---------------------------------------------------------------------------
+# Position extraction
+# ---------------------------------------------------------------------------
+
+def is_quiet(board: chess.Board) -> bool:
+    """True when not in check and no capture or promotion obviously wins material."""
+    if board.is_check():
+        return False
+    values = eval_tables.PIECE_VALUES
+    for move in board.generate_legal_captures():
+        if move.promotion:
+            return False
+        victim = chess.PAWN if board.is_en_passant(move) else board.piece_type_at(move.to_square)
+        attacker = board.piece_type_at(move.from_square)
+        if values[victim] >= values[attacker] or not board.is_attacked_by(not board.turn, move.to_square):
+            return False
+    return not any(move.promotion for move in board.generate_legal_moves(chess.BB_ALL, chess.BB_BACKRANKS))
+
+
+def extract_positions(pgn_path: str, skip_plies: int = 8) -> List[Tuple[str, float]]:
+    """Return (FEN, result from White's side) for the quiet positions of a PGN file."""
+    positions = []
+    with open(pgn_path, errors='ignore') as pgn:
+        while True:
+            game = chess.pgn.read_game(pgn)
+            if game is None:
+                break
+            result = RESULTS.get(game.headers.get('Result'))
+            if result is None:
+                continue
+            board = game.board()
+            for ply, move in enumerate(game.mainline_moves()):
+                board.push(move)
+                if ply + 1 >= skip_plies and is_quiet(board):
+                    positions.append((board.fen(), result))
+    return positions
+
+
+def collect_pgn_paths(paths: Sequence[str]) -> List[str]:
+    """Expand directories into their ``*.pgn`` files."""
+    pgn_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            pgn_paths.extend(sorted(glob.glob(os.path.join(path, '*.pgn'))))
+        else:
+            pgn_paths.append(path)
+    return pgn_paths
+
+
+# ---------------------------------------------------------------------------
+# Features and parameters
+# ---------------------------------------------------------------------------
+
+def position_features(evaluator: EnhancedEvaluator, board: chess.Board):
+    """Return (table feature row, pawn feature row) of ``board``, White minus Black.
+
+    Table features count pieces per (table, square) with Black mirrored, the
+    king using the middlegame or endgame table exactly as the evaluator does.
+    """
+    table_row = np.zeros(NUM_TABLE_FEATURES, dtype=np.int8)
+    pawn_row = np.zeros(NUM_PAWN_FEATURES, dtype=np.int8)
+    phase = evaluator._calculate_game_phase(board)
+    king_block = 5 if phase < 8 else 6
+
+    for square, piece in board.piece_map().items():
+        sign = 1 if piece.color == chess.WHITE else -1
+        oriented = square if piece.color == chess.WHITE else square ^ 56
+        block = king_block if piece.piece_type == chess.KING else piece.piece_type - 1
+        table_row[block * 64 + oriented] += sign
+
+    for color in chess.COLORS:
+        sign = 1 if color == chess.WHITE else -1
+        pawns = board.pieces_mask(chess.PAWN, color)
+        files = [chess.popcount(pawns & chess.BB_FILES[file]) for file in range(8)]
+        for file, count in enumerate(files):
+            if count == 0:
+                continue
+            pawn_row[0] += sign * (count - 1)
+            if (file == 0 or files[file - 1] == 0) and (file == 7 or files[file + 1] == 0):
+                pawn_row[1] += sign
+        for pawn in chess.scan_forward(pawns):
+            if evaluator._is_passed_pawn(board, pawn, color):
+                rank = chess.square_rank(pawn)
+                relative_rank = rank if color == chess.WHITE else 7 - rank
+                pawn_row[1 + relative_rank] += sign
+
+    return table_row, pawn_row
+
+
+def evaluator_parameters(evaluator: EnhancedEvaluator) -> np.ndarray:
+    """Pack the evaluator's tunable parameters into a vector."""
+    theta = np.zeros(NUM_PARAMETERS)
+    theta[:NUM_VALUES] = [evaluator.piece_values[piece_type] for piece_type in chess.PIECE_TYPES[:NUM_VALUES]]
+    for block, name in enumerate(TABLE_ORDER):
+        start = TABLE_OFFSET + block * 64
+        theta[start:start + 64] = getattr(evaluator, TABLE_ATTRIBUTES[name])
+    theta[PAWN_OFFSET] = evaluator.doubled_pawn_penalty
+    theta[PAWN_OFFSET + 1] = evaluator.isolated_pawn_penalty
+    theta[PAWN_OFFSET + 2:] = evaluator.passed_pawn_bonus[1:7]
+    return theta
+
+
+def effective_weights(theta: np.ndarray, weights: Dict[str, float]):
+    """Map parameters to per-feature weights (table features, pawn features)."""
+    table_weights = theta[TABLE_OFFSET:PAWN_OFFSET] * weights['piece_square']
+    for block in range(NUM_VALUES):
+        table_weights[block * 64:(block + 1) * 64] += theta[block]
+    pawn_weights = theta[PAWN_OFFSET:] * weights['pawn_structure']
+    return table_weights.astype(np.float32), pawn_weights.astype(np.float32)
+
+
+def parameter_gradient(table_gradient: np.ndarray, pawn_gradient: np.ndarray,
+                       weights: Dict[str, float]) -> np.ndarray:
+    """Chain rule from per-feature gradients back to the parameter vector."""
+    gradient = np.zeros(NUM_PARAMETERS)
+    gradient[:NUM_VALUES] = table_gradient[:NUM_VALUES * 64].reshape(NUM_VALUES, 64).sum(axis=1)
+    gradient[TABLE_OFFSET:PAWN_OFFSET] = table_gradient * weights['piece_square']
+    gradient[PAWN_OFFSET:] = pawn_gradient * weights['pawn_structure']
+    return gradient
+
+
+def write_weights(path: str, theta: np.ndarray, weights: Dict[str, float],
+                  metadata: Optional[dict] = None) -> None:
+    """Write rounded parameters as a weights file for ``EnhancedEvaluator.load_weights``."""
+    theta = np.rint(theta).astype(int)
+    data = {
+        'format': WEIGHTS_FORMAT,
+        'version': WEIGHTS_VERSION,
+        'piece_values': {chess.piece_name(piece_type): int(theta[piece_type - 1])
+                         for piece_type in chess.PIECE_TYPES[:NUM_VALUES]},
+        'piece_square_tables': {
+            name: [int(value) for value in theta[TABLE_OFFSET + block * 64:TABLE_OFFSET + (block + 1) * 64]]
+            for block, name in enumerate(TABLE_ORDER)
+        },
+        'pawn_structure': {
+            'doubled': int(theta[PAWN_OFFSET]),
+            'isolated': int(theta[PAWN_OFFSET + 1]),
+            'passed': [0] + [int(value) for value in theta[PAWN_OFFSET + 2:]] + [0],
+        },
+        'weights': {'piece_square': weights['piece_square'],
+                    'pawn_structure': weights['pawn_structure']},
+        'tuning': metadata or {},
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1)
+
+
+def _build_features(args):
+    """Worker: features, full White-side evaluation and result for a chunk."""
+    fens, results, init_weights = args
+    evaluator = EnhancedEvaluator()
+    if init_weights:
+        evaluator.load_weights(init_weights)
+    tables = np.zeros((len(fens), NUM_TABLE_FEATURES), dtype=np.int8)
+    pawns = np.zeros((len(fens), NUM_PAWN_FEATURES), dtype=np.int8)
+    full = np.zeros(len(fens), dtype=np.float32)
+    board = Board()
+    for i, fen in enumerate(fens):
+        board.set_fen(fen)
+        tables[i], pawns[i] = position_features(evaluator, board.board)
+        score = evaluator.evaluate(board)
+        full[i] = score if board.board.turn == chess.WHITE else -score
+    return tables, pawns, full, np.asarray(results, dtype=np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Loss and gradient over shared-memory shards
+# ---------------------------------------------------------------------------
+
+_worker_arrays = {}
+
+
+def _attach_shared(specs):
+    """Pool initializer: map the shared feature arrays."""
+    for name, (shm_name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _worker_arrays[name] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _shard_loss(args):
+    """Worker: squared-error sum and feature gradients for rows [start, end)."""
+    start, end, table_weights, pawn_weights, k, with_gradient = args
+    tables = _worker_arrays['tables'][1][start:end].astype(np.float32)
+    pawns = _worker_arrays['pawns'][1][start:end].astype(np.float32)
+    rest = _worker_arrays['rest'][1][start:end]
+    results = _worker_arrays['results'][1][start:end]
+
+    scores = tables @ table_weights + pawns @ pawn_weights + rest
+    predicted = 1.0 / (1.0 + np.power(10.0, -k * scores / 400.0))
+    error = predicted - results
+    loss = float(np.dot(error, error))
+    if not with_gradient:
+        return loss, None, None
+    residual = 2.0 * error * predicted * (1.0 - predicted) * (k * math.log(10) / 400.0)
+    return loss, tables.T @ residual, pawns.T @ residual
+
+
+class TexelTuner:
+    """Logistic-loss fit of the linear evaluation parameters.
+
+    Feature matrices live in shared memory; every loss/gradient evaluation
+    is split into one contiguous shard per worker process.
+    """
+
+    def __init__(self, positions: List[Tuple[str, float]], workers: Optional[int] = None,
+                 init_weights: Optional[str] = None, chunk_size: int = 2000):
+        """Build features for ``positions`` and start the worker pool."""
+        if not positions:
+            raise ValueError("No positions to tune on")
+        self.workers = workers or os.cpu_count() or 1
+        self.evaluator = EnhancedEvaluator()
+        if init_weights:
+            self.evaluator.load_weights(init_weights)
+        self.weights = dict(self.evaluator.weights)
+        self.theta = evaluator_parameters(self.evaluator)
+        self.count = len(positions)
+        self.stats = {}
+
+        start = time.perf_counter()
+        chunks = [([fen for fen, _ in positions[i:i + chunk_size]],
+                   [result for _, result in positions[i:i + chunk_size]], init_weights)
+                  for i in range(0, self.count, chunk_size)]
+        with ProcessPoolExecutor(self.workers) as pool:
+            parts = list(pool.map(_build_features, chunks))
+        tables = np.concatenate([part[0] for part in parts])
+        pawns = np.concatenate([part[1] for part in parts])
+        full = np.concatenate([part[2] for part in parts])
+        results = np.concatenate([part[3] for part in parts])
+        self.stats['feature_seconds'] = time.perf_counter() - start
+
+        # Everything the tuned parameters do not touch becomes a constant
+        table_weights, pawn_weights = effective_weights(self.theta, self.weights)
+        rest = full - (tables.astype(np.float32) @ table_weights + pawns.astype(np.float32) @ pawn_weights)
+
+        self._shared = []
+        specs = {}
+        for name, array in (('tables', tables), ('pawns', pawns), ('rest', rest.astype(np.float32)),
+                            ('results', results)):
+            shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+            self._shared.append(shm)
+            specs[name] = (shm.name, array.shape, array.dtype)
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_attach_shared, initargs=(specs,))
+        bounds = np.linspace(0, self.count, self.workers + 1).astype(int)
+        self.shards = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+        self.evaluated_positions = 0
+        self.evaluation_seconds = 0.0
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        self.pool.shutdown()
+        for shm in self._shared:
+            shm.close()
+            shm.unlink()
+        self._shared = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def loss(self, theta: np.ndarray, k: float, with_gradient: bool = False):
+        """Return mean loss (and its parameter gradient) for ``theta``."""
+        table_weights, pawn_weights = effective_weights(theta, self.weights)
+        start = time.perf_counter()
+        parts = list(self.pool.map(_shard_loss, [(a, b, table_weights, pawn_weights, k, with_gradient)
+                                                 for a, b in self.shards]))
+        self.evaluation_seconds += time.perf_counter() - start
+        self.evaluated_positions += self.count
+        loss = sum(part[0] for part in parts) / self.count
+        if not with_gradient:
+            return loss
+        table_gradient = sum(part[1] for part in parts) / self.count
+        pawn_gradient = sum(part[2] for part in parts) / self.count
+        return loss, parameter_gradient(table_gradient, pawn_gradient, self.weights)
+
+    def fit_scaling(self, low: float = 0.1, high: float = 4.0, iterations: int = 30) -> float:
+        """Golden-section search for the sigmoid scaling constant K."""
+        ratio = (math.sqrt(5) - 1) / 2
+        a, b = low, high
+        c, d = b - ratio * (b - a), a + ratio * (b - a)
+        loss_c, loss_d = self.loss(self.theta, c), self.loss(self.theta, d)
+        for _ in range(iterations):
+            if loss_c < loss_d:
+                b, d, loss_d = d, c, loss_c
+                c = b - ratio * (b - a)
+                loss_c = self.loss(self.theta, c)
+            else:
+                a, c, loss_c = c, d, loss_d
+                d = a + ratio * (b - a)
+                loss_d = self.loss(self.theta, d)
+        return (a + b) / 2
+
+    def tune(self, k: float, iterations: int = 200, learning_rate: float = 1.0,
+             report=None) -> np.ndarray:
+        """Adam descent on the parameters; returns the fitted vector."""
+        theta = self.theta.copy()
+        first_moment = np.zeros_like(theta)
+        second_moment = np.zeros_like(theta)
+        beta1, beta2, epsilon = 0.9, 0.999, 1e-12
+        for step in range(1, iterations + 1):
+            loss, gradient = self.loss(theta, k, with_gradient=True)
+            first_moment = beta1 * first_moment + (1 - beta1) * gradient
+            second_moment = beta2 * second_moment + (1 - beta2) * gradient * gradient
+            corrected_first = first_moment / (1 - beta1 ** step)
+            corrected_second = second_moment / (1 - beta2 ** step)
+            theta -= learning_rate * corrected_first / (np.sqrt(corrected_second) + epsilon)
+            if report:
+                report(step, loss)
+        return theta
+
+    def positions_per_second_per_core(self) -> float:
+        """Loss/gradient throughput per worker process."""
+        return self.evaluated_positions / max(self.evaluation_seconds, 1e-9) / self.workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Texel tuning of the SlowMate evaluation")
+    parser.add_argument('pgn', nargs='*', default=[GAMES_DIR], help="PGN files or directories")
+    parser.add_argument('--output', default='tuned_weights.json')
+    parser.add_argument('--init', help="Weights file to start from")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--learning-rate', type=float, default=1.0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-positions', type=int, default=200000)
+    parser.add_argument('--skip-plies', type=int, default=8)
+    args = parser.parse_args()
+
+    pgn_paths = collect_pgn_paths(args.pgn)
+    workers = args.workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        per_file = list(pool.map(extract_positions, pgn_paths, [args.skip_plies] * len(pgn_paths)))
+    positions = []
+    seen = set()
+    for file_positions in per_file:
+        for fen, result in file_positions:
+            key = ' '.join(fen.split()[:4])
+            if key not in seen:
+                seen.add(key)
+                positions.append((fen, result))
+    positions = positions[:args.max_positions]
+    extract_seconds = time.perf_counter() - start
+    print(f"Extracted {len(positions)} quiet positions from {len(pgn_paths)} PGN files "
+          f"in {extract_seconds:.1f}s")
+    if not positions:
+        return
+
+    with TexelTuner(positions, workers, args.init) as tuner:
+        print(f"Features: {tuner.stats['feature_seconds']:.1f}s "
+              f"({len(positions) / tuner.stats['feature_seconds'] / workers:.0f} positions/s/core)")
+        k = tuner.fit_scaling()
+        initial_loss = tuner.loss(tuner.theta, k)
+        print(f"K = {k:.3f}, initial loss {initial_loss:.6f}")
+
+        def report(step, loss):
+            if step == 1 or step % 25 == 0:
+                print(f"  iteration {step:4d}  loss {loss:.6f}")
+
+        theta = tuner.tune(k, args.iterations, args.learning_rate, report)
+        final_loss = tuner.loss(np.rint(theta), k)
+        throughput = tuner.positions_per_second_per_core()
+        print(f"Final loss {final_loss:.6f} (rounded parameters)")
+        print(f"Throughput: {throughput:.0f} positions/s per core, {workers} worker(s)")
+
+        write_weights(args.output, theta, tuner.weights, {
+            'positions': len(positions), 'iterations': args.iterations, 'k': round(k, 4),
+            'initial_loss': round(initial_loss, 6), 'final_loss': round(final_loss, 6),
+            'positions_per_second_per_core': round(throughput),
+        })
+        print(f"Wrote {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -312,6 +312,12 @@ class UCIProtocol:
                 if self.debug:
                     self._send_search_info({"string": f"Search error: {e}"})
                 
+            # The engine's info lines go through its own output thread:
+            # let them reach stdout before our bestmove
+            engine_uci = getattr(self.engine, 'uci', None)
+            if hasattr(engine_uci, 'flush_output'):
+                engine_uci.flush_output()
+                
             # Send best move
             if best_move and not self.stop_requested:
                 self.send_bestmove(best_move)
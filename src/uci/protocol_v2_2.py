@@ -4,11 +4,15 @@ Advanced time management and robust communication
 """
 
 import chess
+import queue
 import threading
 import time
 import sys
 from typing import Optional, Dict, Any
 
+from slowmate.core.movegen import to_chess_move
+from slowmate.core.time_manager import MoveOverheadTracker
+
 # Import TranspositionTable for hash option
 try:
     from slowmate.search.enhanced import TranspositionTable
@@ -25,10 +29,39 @@ class UCIProtocol:
     def __init__(self, engine):
         """Initialize UCI protocol handler."""
         self.engine = engine
-        self.stop_requested = False
+        self.stop_event = threading.Event()  # Stop signal of the current go (new per go)
         self.debug_mode = False
         self.position_set = False
         self.search_thread = None
+        # Last position command, (base, applied moves, board): a position
+        # that extends it only plays the new moves
+        self._position_state = None
+        
+        # Output: a writer thread owns stdout and the debug log, so the
+        # search never blocks on I/O
+        self._output: "queue.Queue" = queue.Queue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        self.debug_log_path = 'slowmate_uci_debug.log'
+        self._debug_log = None
+        self.info_interval = 0.1     # Seconds between periodic info lines (<= 10/s)
+        self._last_periodic_info = 0.0
+        
+        # Exactly one bestmove per go: the search thread, the watchdog and
+        # stop race for it under this lock
+        self._bestmove_lock = threading.Lock()
+        self._go_id = 0
+        self._bestmove_pending = False
+        self._go_stamp = None        # Move overhead stamp of the current go
+        self._go_fallback = "0000"   # First legal root move, fixed when go arrives
+        self._go_legal = set()       # Legal root moves (UCI) for validating shared state
+        self._go_root = (0, 'w')     # (ply, side to move) of the current go's root
+        self.watchdog_margin = 0.1   # Seconds past movetime before the watchdog answers
+        self.watchdog_clock_share = 0.3  # Most of our clock one move may ever take
+        self.stop_grace = 0.1        # Seconds a stopped search gets to answer itself
+        self._search_done = None     # Set when the current go's search returns
+        self._go_request = None      # (go_id, params, done) of a go sent to the worker
+        self.worker = None           # SearchWorker when the SearchProcess option is on
         
         # v2.2 ENHANCEMENT: UCI options
         self.options = {
@@ -55,8 +88,58 @@ class UCIProtocol:
                 'type': 'check',
                 'default': False,
                 'value': False
+            },
+            'EvalFile': {
+                'type': 'string',
+                'default': '',
+                'value': ''
+            },
+            'EvalWeights': {
+                'type': 'string',
+                'default': '',
+                'value': ''
+            },
+            'Move Overhead': {
+                'type': 'spin',
+                'default': 10,
+                'min': 0,
+                'max': 5000,
+                'value': 10
+            },
+            'Emergency Clock': {
+                'type': 'spin',
+                'default': 1000,
+                'min': 0,
+                'max': 60000,
+                'value': 1000
+            },
+            'Emergency Move Time': {
+                'type': 'spin',
+                'default': 100,
+                'min': 0,
+                'max': 5000,
+                'value': 100
+            },
+            'TelemetryFile': {
+                'type': 'string',
+                'default': '',
+                'value': ''
+            },
+            'SearchProcess': {
+                'type': 'check',
+                'default': False,
+                'value': False
             }
         }
+        # Options that only concern this (I/O) process, never forwarded to a worker
+        self.local_options = {'Move Overhead', 'TelemetryFile', 'SearchProcess'}
+        
+        # Go -> bestmove latency, subtracted from clock-based allocations
+        self.move_overhead = MoveOverheadTracker(base_ms=self.options['Move Overhead']['default'])
+        
+        # Optional per-go time telemetry (TelemetryFile option)
+        self.telemetry = None
+        self.game_number = 0
         
         # v2.2 ENHANCEMENT: Performance tracking
         self.search_stats = {
@@ -66,32 +149,89 @@ class UCIProtocol:
             'nodes_per_second': 0
         }
     
+    @property
+    def stop_requested(self) -> bool:
+        """Whether the current search should stop (backed by ``stop_event``)."""
+        return self.stop_event.is_set()
+    
+    @stop_requested.setter
+    def stop_requested(self, value: bool):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
+    
     def _out(self, message: str):
-        """Send message to UCI interface."""
-        try:
-            print(message, flush=True)
-            if self.debug_mode:
-                with open('slowmate_uci_debug.log', 'a') as f:
-                    f.write(f"OUT: {message}\n")
-        except Exception:
-            pass  # Fail silently to avoid UCI protocol disruption
+        """Send message to UCI interface (queued for the output thread)."""
+        self._emit(message, f"OUT: {message}" if self.debug_mode else None)
     
     def _debug(self, message: str):
         """Send debug message if debug mode is enabled."""
         if self.debug_mode:
+            self._out(f"info string DEBUG: {message}")
+            self._emit(None, f"DEBUG: {message}")
+    
+    def _emit(self, line: Optional[str], log: Optional[str] = None):
+        """Queue a stdout line and/or a debug log line; never blocks."""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._output_writer,
+                                                    name="slowmate-output", daemon=True)
+                    self._writer.start()
+        self._output.put((line, log))
+    
+    def _output_writer(self):
+        """Write queued output in batches: one stdout write and flush per batch."""
+        while True:
+            batch = [self._output.get()]
+            while True:
+                try:
+                    batch.append(self._output.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [item[0] for item in batch if isinstance(item, tuple) and item[0] is not None]
+            logs = [item[1] for item in batch if isinstance(item, tuple) and item[1] is not None]
             try:
-                self._out(f"info string DEBUG: {message}")
-                with open('slowmate_uci_debug.log', 'a') as f:
-                    f.write(f"DEBUG: {message}\n")
+                if lines:
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    sys.stdout.flush()
+                if logs:
+                    if self._debug_log is None:
+                        self._debug_log = open(self.debug_log_path, 'a', buffering=65536)
+                    self._debug_log.write("\n".join(logs) + "\n")
+                    self._debug_log.flush()
             except Exception:
-                pass
+                pass  # Fail silently to avoid UCI protocol disruption
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()  # flush_output marker
+    
+    def flush_output(self, timeout: float = 1.0) -> bool:
+        """Wait until everything queued so far has been written."""
+        if self._writer is None:
+            return True
+        marker = threading.Event()
+        self._output.put(marker)
+        return marker.wait(timeout)
+    
+    def reset_periodic_info(self):
+        """Start a search: the first periodic info line comes after ``info_interval``."""
+        self._last_periodic_info = time.perf_counter()
+    
+    def info_due(self) -> bool:
+        """Whether a periodic info line (currmove, nodes, nps) may be sent now."""
+        now = time.perf_counter()
+        if now - self._last_periodic_info < self.info_interval:
+            return False
+        self._last_periodic_info = now
+        return True
     
     def handle_command(self, command: str):
         """Handle incoming UCI command."""
         try:
             if self.debug_mode:
-                with open('slowmate_uci_debug.log', 'a') as f:
-                    f.write(f"IN: {command}\n")
+                self._emit(None, f"IN: {command}")
             
             parts = command.strip().split()
             if not parts:
@@ -121,6 +261,8 @@ class UCIProtocol:
                 self._handle_ponderhit()
             elif cmd == "quit":
                 self._handle_quit()
+            elif cmd == "perft":
+                self._handle_perft(parts)
             else:
                 self._debug(f"Unknown command: {command}")
                 
@@ -139,6 +281,8 @@ class UCIProtocol:
                 self._out(f"option name {option_name} type spin default {option_data['default']} min {option_data['min']} max {option_data['max']}")
             elif option_data['type'] == 'check':
                 self._out(f"option name {option_name} type check default {option_data['default']}")
+            elif option_data['type'] == 'string':
+                self._out(f"option name {option_name} type string default {option_data['default'] or '<empty>'}")
         
         self._out("uciok")
     
@@ -166,9 +310,12 @@ class UCIProtocol:
         """Handle setoption command."""
         try:
             if len(parts) >= 4 and parts[1].lower() == "name":
-                option_name = parts[2]
-                if len(parts) >= 5 and parts[3].lower() == "value":
-                    option_value = " ".join(parts[4:])
+                # Option names may contain spaces ("Move Overhead")
+                lowered = [part.lower() for part in parts]
+                value_index = lowered.index("value") if "value" in lowered[3:] else len(parts)
+                option_name = " ".join(parts[2:value_index])
+                if value_index + 1 < len(parts):
+                    option_value = " ".join(parts[value_index + 1:])
                     
                     if option_name in self.options:
                         # v2.2 ENHANCEMENT: Process option changes
@@ -183,17 +330,110 @@ class UCIProtocol:
                             self.options[option_name]['value'] = int(option_value)
                             self._debug(f"MultiPV set to {option_value}")
                         
+                        elif option_name == "Move Overhead":
+                            overhead = max(0, min(5000, int(option_value)))
+                            self.options[option_name]['value'] = overhead
+                            self.move_overhead.base_ms = overhead
+                            self._debug(f"Move Overhead set to {overhead} ms")
+                        
                         elif option_name in ["Ponder", "OwnBook"]:
                             self.options[option_name]['value'] = option_value.lower() == "true"
                             self._debug(f"{option_name} set to {option_value}")
                         
+                        elif option_name == "EvalFile":
+                            eval_file = "" if option_value == "<empty>" else option_value
+                            self.options[option_name]['value'] = eval_file
+                            if hasattr(self.engine, 'set_eval_file'):
+                                backend = self.engine.set_eval_file(eval_file)
+                                self._out(f"info string evaluation backend {backend}")
+                        
+                        elif option_name == "EvalWeights":
+                            weights_file = "" if option_value == "<empty>" else option_value
+                            self.options[option_name]['value'] = weights_file
+                            if hasattr(self.engine, 'set_eval_weights'):
+                                self._out(f"info string {self.engine.set_eval_weights(weights_file)}")
+                        
+                        elif option_name in ["Emergency Clock", "Emergency Move Time"]:
+                            threshold = max(0, min(self.options[option_name]['max'], int(option_value)))
+                            self.options[option_name]['value'] = threshold
+                            time_manager = getattr(self.engine, 'time_manager', None)
+                            if time_manager is not None:
+                                if option_name == "Emergency Clock":
+                                    time_manager.emergency_clock_time = threshold / 1000.0
+                                else:
+                                    time_manager.emergency_move_time = threshold / 1000.0
+                            self._debug(f"{option_name} set to {threshold} ms")
+                        
+                        elif option_name == "TelemetryFile":
+                            telemetry_file = "" if option_value == "<empty>" else option_value
+                            self.options[option_name]['value'] = telemetry_file
+                            self._set_telemetry_file(telemetry_file)
+                        
+                        elif option_name == "SearchProcess":
+                            self.options[option_name]['value'] = option_value.lower() == "true"
+                            self._set_search_process(self.options[option_name]['value'])
+                        
                         else:
                             self._debug(f"Option {option_name} not implemented")
+                        
+                        if self.worker and option_name not in self.local_options:
+                            self.worker.command(" ".join(parts))
                     else:
                         self._debug(f"Unknown option: {option_name}")
         except Exception as e:
             self._debug(f"Set option error: {e}")
     
+    def _set_telemetry_file(self, path: str):
+        """Close the current telemetry log and open ``path`` (empty: off)."""
+        if self.telemetry:
+            self.telemetry.close()
+            self.telemetry = None
+        if path:
+            from slowmate.tools.telemetry import TelemetryLog  # Only needed when logging
+            try:
+                self.telemetry = TelemetryLog(path)
+                self._out(f"info string telemetry {path}")
+            except OSError as e:
+                self.options['TelemetryFile']['value'] = ''
+                self._out(f"info string telemetry not started: {e}")
+    
+    def _set_search_process(self, enabled: bool):
+        """Start or stop the out-of-process search worker."""
+        if self.worker:
+            self._handle_stop()
+            self.worker.close()
+            self.worker = None
+        if enabled:
+            from slowmate.uci.worker import SearchWorker  # Only needed in process mode
+            self.worker = SearchWorker(self._out, self._worker_bestmove, self._worker_exit)
+            # Replay the engine options the child has not seen
+            for name, option in self.options.items():
+                if name not in self.local_options and option['value'] != option['default']:
+                    self.worker.command(f"setoption name {name} value {option['value']}")
+    
+    def _worker_bestmove(self, move: str, go_id: int, report: Dict[str, Any]):
+        """Reader thread: the worker's search returned."""
+        request = self._go_request
+        if request is None or request[0] != go_id:
+            return  # A go that was already answered and replaced
+        _, search_params, done = request
+        self.engine.search_report = report
+        self.engine.nodes = report.get('nodes', 0)
+        timed = "movetime" in search_params or "wtime" in search_params or "btime" in search_params
+        self._send_bestmove(move if move in self._go_legal else self._go_fallback,
+                            timed, search_params, go_id, report.get('hard_ms'))
+        done.set()
+    
+    def _worker_exit(self):
+        """Reader thread: the worker process ended; answer any pending go."""
+        request = self._go_request
+        if request is not None and self._bestmove_pending:
+            self._send_best_so_far(request[0], "search process exited", request[1])
+            request[2].set()
+        if self.worker and not self.worker.alive:
+            self.worker = None
+            self.options['SearchProcess']['value'] = False
+    
     def _handle_register(self):
         """Handle register command (not needed for free engine)."""
         pass
@@ -201,8 +441,13 @@ class UCIProtocol:
     def _handle_ucinewgame(self):
         """Handle new game command."""
         try:
+            self._wait_for_search()
             self.engine.new_game()
             self.position_set = False
+            self._position_state = None
+            self.game_number += 1
+            if self.worker:
+                self.worker.command("ucinewgame")
             self.search_stats = {
                 'positions_analyzed': 0,
                 'total_search_time': 0.0,
@@ -220,12 +465,12 @@ class UCIProtocol:
                 return
             
             if parts[1] == "startpos":
-                self.engine.set_position("startpos")
+                base = "startpos"
                 moves_start = 2
             elif parts[1] == "fen":
                 # Find where FEN ends and moves begin
                 fen_parts = []
-                moves_start = 2
+                moves_start = len(parts)
                 for i in range(2, len(parts)):
                     if parts[i] == "moves":
                         moves_start = i
@@ -233,8 +478,7 @@ class UCIProtocol:
                     fen_parts.append(parts[i])
                 
                 if fen_parts:
-                    fen = " ".join(fen_parts)
-                    self.engine.set_position(fen)
+                    base = " ".join(fen_parts)
                 else:
                     self._debug("Invalid FEN in position command")
                     return
@@ -242,19 +486,20 @@ class UCIProtocol:
                 self._debug(f"Invalid position command: {' '.join(parts)}")
                 return
             
-            # Apply moves if present
+            move_strs = []
             if moves_start < len(parts) and parts[moves_start] == "moves":
-                for move_str in parts[moves_start + 1:]:
-                    try:
-                        move = chess.Move.from_uci(move_str)
-                        if move in self.engine.board.board.legal_moves:
-                            self.engine.make_move(move)
-                        else:
-                            self._debug(f"Illegal move: {move_str}")
-                            break
-                    except Exception as e:
-                        self._debug(f"Move parsing error: {move_str} - {e}")
-                        break
+                move_strs = parts[moves_start + 1:]
+            
+            self._wait_for_search()
+            
+            # Same game a move or two later (the usual case): play only the
+            # new moves. Anything else is set up from scratch.
+            applied = self._continuation(base, move_strs)
+            if applied is None:
+                self.engine.set_position(base)
+                applied = []
+            applied += self._apply_moves(move_strs[len(applied):])
+            self._position_state = (base, applied, self.engine.board)
             
             self.position_set = True
             self._debug(f"Position set: {self.engine.board.get_fen()}")
@@ -262,32 +507,138 @@ class UCIProtocol:
         except Exception as e:
             self._debug(f"Position command error: {e}")
     
+    def _continuation(self, base: str, move_strs) -> Optional[list]:
+        """Moves already on the board if ``base`` + ``move_strs`` extends the last position, else None."""
+        if self._position_state is None:
+            return None
+        last_base, applied, board = self._position_state
+        if base != last_base or board is not self.engine.board or move_strs[:len(applied)] != applied:
+            return None
+        stack = board.board.move_stack
+        if len(stack) != len(applied) or (applied and stack[-1].uci() != applied[-1]):
+            return None  # The board was changed behind our back
+        return list(applied)
+    
+    def _apply_moves(self, move_strs) -> list:
+        """Play UCI moves until one is illegal; return those played."""
+        applied = []
+        board = self.engine.board.board
+        for move_str in move_strs:
+            try:
+                move = chess.Move.from_uci(move_str)
+            except ValueError as e:
+                self._debug(f"Move parsing error: {move_str} - {e}")
+                break
+            # is_legal checks just this move, no legal move list; the board
+            # move skips engine.make_move's own legality check
+            if not board.is_legal(move):
+                self._debug(f"Illegal move: {move_str}")
+                break
+            self.engine.board.make_move(move)
+            applied.append(move_str)
+        return applied
+    
     def _handle_go(self, parts):
         """Handle go command with enhanced time management."""
+        # The clock runs from here, not from when the previous search let go
+        go_stamp = self.move_overhead.start()
+        go_time = time.time()
+        if len(parts) > 1 and parts[1].lower() == "perft":
+            self._handle_perft(parts[1:])
+            return
         if not self.position_set:
             self._debug("No position set, cannot search")
             return
         
-        # Stop any ongoing search
+        # Stop any ongoing search (answering its go if it does not) and let
+        # it leave the board before this one starts
         self._handle_stop()
+        self._wait_for_search()
         
+        with self._bestmove_lock:
+            self._go_id += 1
+            go_id = self._go_id
+            self._go_stamp = go_stamp
+            self._bestmove_pending = True
         try:
             # Parse search parameters
             search_params = self._parse_go_command(parts)
             self._debug(f"Search parameters: {search_params}")
             
-            # Start search in separate thread
-            self.stop_requested = False
-            self.search_thread = threading.Thread(
-                target=self._search_thread,
-                args=(search_params,),
-                daemon=True
-            )
-            self.search_thread.start()
+            # Root facts the watchdog may need while the search owns the board
+            board = self.engine.board.board
+            legal_moves = [move.uci() for move in board.legal_moves]
+            self._go_legal = set(legal_moves)
+            self._go_fallback = legal_moves[0] if legal_moves else "0000"
+            self._go_root = (len(board.move_stack), 'w' if board.turn == chess.WHITE else 'b')
+            self.engine.search_report = {}  # Filled in by this go's search
+            if hasattr(self.engine, 'best_move_so_far'):
+                self.engine.best_move_so_far = None
+            
+            # Start search in separate thread (or the worker process),
+            # watched against a hard limit. Each go gets its own stop event:
+            # an overrunning earlier search keeps seeing its own as set.
+            done = threading.Event()
+            self._search_done = done
+            if self.worker:
+                self._go_request = (go_id, search_params, done)
+                # The child allocates with this process's move overhead
+                worker_params = dict(search_params, overhead_ms=self.move_overhead.overhead_ms(),
+                                     go_time=go_time)
+                self.stop_event = self.worker.go(board.root().fen(),
+                                                 [move.uci() for move in board.move_stack],
+                                                 worker_params, go_id)
+                stop_event = self.stop_event
+            else:
+                self.stop_event = stop_event = threading.Event()
+                self.search_thread = threading.Thread(
+                    target=self._search_thread,
+                    args=(search_params, go_id, done, stop_event, go_time),
+                    daemon=True
+                )
+                self.search_thread.start()
+            hard_limit = self._hard_limit(search_params)
+            if hard_limit is not None:
+                threading.Thread(target=self._watchdog,
+                                 args=(go_id, hard_limit, done, search_params, stop_event),
+                                 daemon=True).start()
             
         except Exception as e:
             self._debug(f"Go command error: {e}")
-            self._out("bestmove 0000")  # Emergency fallback
+            self._send_bestmove(self._go_fallback, go_id=go_id)  # Emergency fallback
+    
+    def _handle_perft(self, parts):
+        """Handle ``perft <depth> [bulk] [generator <name>] [jobs <n>]`` on the
+        current position: one ``<move>: <nodes>`` line per root move, then a
+        summary checked against the published count for standard positions."""
+        from slowmate.tools.perft import GENERATORS, run_perft  # Only needed for perft
+        
+        depth, bulk, generator, jobs = 1, False, 'bitboard', 1
+        i = 1
+        while i < len(parts):
+            token = parts[i].lower()
+            if token == "bulk":
+                bulk = True
+            elif token == "generator" and i + 1 < len(parts):
+                generator = parts[i + 1]
+                i += 1
+            elif token == "jobs" and i + 1 < len(parts):
+                jobs = int(parts[i + 1])
+                i += 1
+            else:
+                depth = int(token)
+            i += 1
+        if generator not in GENERATORS:
+            self._out(f"info string perft: unknown generator {generator} ({', '.join(GENERATORS)})")
+            return
+        
+        result = run_perft(self.engine.board.board.fen(), depth, generator, bulk, jobs)
+        for move, nodes in result.divide.items():
+            self._out(f"{move}: {nodes}")
+        status = {None: "", True: " ok", False: f" MISMATCH expected {result.expected}"}[result.ok]
+        self._out(f"info string perft depth {depth} nodes {result.nodes} "
+                  f"time {int(result.seconds * 1000)} nps {result.nps}{status}")
+        self._out(f"Nodes searched: {result.nodes}")
     
     def _parse_go_command(self, parts) -> Dict[str, Any]:
         """v2.2 ENHANCEMENT: Parse go command parameters."""
@@ -344,28 +695,30 @@ class UCIProtocol:
         
         return params
     
-    def _search_thread(self, search_params: Dict[str, Any]):
+    def _search_thread(self, search_params: Dict[str, Any], go_id: Optional[int] = None,
+                       done: Optional[threading.Event] = None,
+                       stop_event: Optional[threading.Event] = None,
+                       go_time: Optional[float] = None):
         """Enhanced search thread with better error handling."""
+        timed = False
         try:
             start_time = time.time()
             
-            # Calculate time allocation
-            time_limit = None
-            depth_limit = None
-            
-            if "movetime" in search_params:
-                time_limit = search_params["movetime"]
-            elif "depth" in search_params:
-                depth_limit = search_params["depth"]
-            elif not search_params.get("infinite", False):
-                # Calculate time from time control
-                time_limit = self._calculate_time_limit(search_params)
+            # The engine allocates time from the clocks itself
+            time_limit = search_params.get("movetime")
+            depth_limit = search_params.get("depth")
+            clocks = {("moves_to_go" if key == "movestogo" else key): value
+                      for key, value in search_params.items()
+                      if key in ("wtime", "btime", "winc", "binc", "movestogo")}
+            timed = time_limit is not None or "wtime" in clocks or "btime" in clocks
             
             # Perform search
             best_move = self.engine.search(
                 time_limit_ms=time_limit,
                 depth_override=depth_limit,
-                **search_params
+                stop_event=stop_event,
+                go_time=go_time,
+                **clocks
             )
             
             # Calculate search statistics
@@ -376,77 +729,148 @@ class UCIProtocol:
             if hasattr(self.engine, 'nodes'):
                 self.search_stats['nodes_per_second'] = int(self.engine.nodes / max(elapsed_time, 0.001))
             
-            # Send best move
-            if best_move and not self.stop_requested:
-                self._out(f"bestmove {best_move.uci()}")
+            # Send best move (also after stop or the deadline: it is the best found)
+            if best_move:
+                self._send_bestmove(best_move.uci(), timed, search_params, go_id)
                 self._debug(f"Search completed: {best_move.uci()} in {elapsed_time:.3f}s, {self.engine.nodes} nodes")
             else:
                 # Emergency fallback
-                legal_moves = list(self.engine.board.board.legal_moves)
-                if legal_moves:
-                    fallback_move = legal_moves[0]
-                    self._out(f"bestmove {fallback_move.uci()}")
-                    self._debug(f"Emergency fallback move: {fallback_move.uci()}")
-                else:
-                    self._out("bestmove 0000")
-                    self._debug("No legal moves available")
+                self._send_bestmove(self._go_fallback, timed, search_params, go_id)
+                self._debug(f"Emergency fallback move: {self._go_fallback}")
             
         except Exception as e:
             self._debug(f"Search thread error: {e}")
-            try:
-                # Ultimate fallback
-                legal_moves = list(self.engine.board.board.legal_moves)
-                if legal_moves:
-                    self._out(f"bestmove {legal_moves[0].uci()}")
-                else:
-                    self._out("bestmove 0000")
-            except:
-                self._out("bestmove 0000")
+            # Ultimate fallback (the board may still hold the interrupted line)
+            self._send_bestmove(self._go_fallback, timed, go_id=go_id)
+        finally:
+            if done is not None:
+                done.set()
     
-    def _calculate_time_limit(self, search_params: Dict[str, Any]) -> Optional[int]:
-        """v2.2 ENHANCEMENT: Advanced time limit calculation."""
-        is_white = self.engine.board.board.turn == chess.WHITE
+    def _hard_limit(self, search_params: Dict[str, Any]) -> Optional[float]:
+        """Wall-clock seconds after which the watchdog answers the go itself.
         
-        our_time = search_params.get('wtime' if is_white else 'btime', 0)
-        our_increment = search_params.get('winc' if is_white else 'binc', 0)
-        moves_to_go = search_params.get('movestogo', 40)
-        
-        if our_time <= 0:
+        ``movetime`` plus a small margin, or a share of our clock less the
+        move overhead; None for depth, infinite and ponder searches.
+        """
+        if search_params.get("infinite") or search_params.get("ponder"):
             return None
+        if "movetime" in search_params:
+            return search_params["movetime"] / 1000.0 + self.watchdog_margin
+        is_white = self.engine.board.board.turn == chess.WHITE
+        our_time = search_params.get('wtime' if is_white else 'btime')
+        if our_time is not None:
+            limit = our_time * self.watchdog_clock_share - self.move_overhead.overhead_ms()
+            return max(0.02, limit / 1000.0)
+        return None
+    
+    def _watchdog(self, go_id: int, hard_limit: float, done: threading.Event,
+                  search_params: Dict[str, Any], stop_event):
+        """Answer the go at ``hard_limit`` if the search has not."""
+        if done.wait(hard_limit):
+            return
+        stop_event.set()  # Let the search wind down on its own
+        self._send_best_so_far(go_id, f"hard limit {hard_limit:.3f}s", search_params)
+    
+    def _send_best_so_far(self, go_id: int, reason: str,
+                          search_params: Optional[Dict[str, Any]] = None):
+        """Answer go ``go_id`` from the engine's shared best move right now."""
+        if self.worker:
+            move = self.worker.best_move_for(go_id) or None
+        else:
+            move = getattr(self.engine, 'best_move_so_far', None)
+        if isinstance(move, int):
+            move = to_chess_move(move)
+        uci = move.uci() if move else None
+        if uci not in self._go_legal:
+            uci = self._go_fallback
+        self._out(f"info string watchdog: {reason}, search still running; bestmove from shared state")
+        self._send_bestmove(uci, True, search_params, go_id)
+    
+    def _send_bestmove(self, move: str, timed: bool = False,
+                       search_params: Optional[Dict[str, Any]] = None,
+                       go_id: Optional[int] = None,
+                       allocated_ms: Optional[float] = None):
+        """Write ``bestmove``, recording the go-to-bestmove latency first.
         
-        # Basic time allocation: divide remaining time by expected moves
-        base_allocation = our_time / (moves_to_go + 5)  # Conservative
-        
-        # Add most of the increment
-        base_allocation += our_increment * 0.8
-        
-        # Position complexity adjustment (if available)
-        if hasattr(self.engine, 'position_complexity'):
-            complexity_factor = 1.0
-            if self.engine.critical_position:
-                complexity_factor = 1.5
-            elif self.engine.position_complexity > 40:
-                complexity_factor = 1.2
-            elif self.engine.position_complexity < 20:
-                complexity_factor = 0.8
-            
-            base_allocation *= complexity_factor
-        
-        # Safety limits
-        max_time = our_time * 0.1  # Never use more than 10%
-        min_time = max(100, our_time * 0.01)  # At least 100ms or 1%
+        Only the first answer to go ``go_id`` is written; later ones (the
+        search finishing after the watchdog answered) are dropped. For timed
+        searches the latency beyond the engine's own allocation feeds the
+        measured part of the move overhead; with a telemetry log open, the
+        search is recorded once ``bestmove`` is out. ``allocated_ms`` is the
+        search process's own budget; in-process searches leave it to the
+        engine's deadline.
+        """
+        with self._bestmove_lock:
+            if go_id is not None:
+                if go_id != self._go_id or not self._bestmove_pending:
+                    self._debug(f"Dropped duplicate bestmove {move} for go {go_id}")
+                    return
+                self._bestmove_pending = False
+            if not timed:
+                allocated_ms = None
+            elif allocated_ms is None and not self.worker:
+                start = getattr(self.engine, 'start_time', None)
+                deadline = getattr(self.engine, 'search_deadline', None)
+                if start and deadline:
+                    allocated_ms = (deadline - start) * 1000.0
+            latency = self.move_overhead.finish(allocated_ms, self._go_stamp)
+            self._go_stamp = None
+            if latency is not None:
+                self._out(f"info string latency {latency:.1f}ms {self.move_overhead.summary()}")
+            self._out(f"bestmove {move}")
+        if self.telemetry and search_params is not None:
+            self.telemetry.record(self._telemetry_record(move, latency, search_params))
+    
+    def _telemetry_record(self, move: str, latency: Optional[float],
+                          search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """One telemetry line: clocks, the engine's search report, time used.
         
-        allocated_time = max(min_time, min(base_allocation, max_time))
+        The root is the one captured at ``go``: a watchdog answer is written
+        while the search is still moving pieces on the board.
+        """
+        ply, side = self._go_root
+        record = {
+            'game': self.game_number,
+            'ply': ply,
+            'side': side,
+            'clocks': {key: search_params[key] for key in
+                       ('wtime', 'btime', 'winc', 'binc', 'movestogo', 'movetime', 'depth')
+                       if key in search_params},
+            'used_ms': round(latency or 0.0, 1),
+            'overhead_ms': round(self.move_overhead.overhead_ms(), 1),
+            'bestmove': move,
+        }
+        record.update(getattr(self.engine, 'search_report', {}))
+        return record
+    
+    def _wait_for_search(self):
+        """Stop the search thread, if any, and wait until it has left the board.
         
-        return int(allocated_time)
+        The board is shared with the search thread; an answered but still
+        running search (watchdog, stop grace) must end before position,
+        ucinewgame or the next go change it. The worker has its own board.
+        """
+        thread = self.search_thread
+        if (self.worker or thread is None or not thread.is_alive()
+                or thread is threading.current_thread()):
+            return
+        self.stop_requested = True
+        while thread.is_alive():
+            thread.join(1.0)
+            if thread.is_alive():
+                self._debug("Waiting for the previous search to finish")
     
     def _handle_stop(self):
-        """Handle stop command."""
+        """Handle stop command: the search gets ``stop_grace`` to answer, after
+        which the best move so far is sent on its behalf."""
         self.stop_requested = True
         
-        # Wait for search thread to finish
-        if self.search_thread and self.search_thread.is_alive():
-            self.search_thread.join(timeout=1.0)
+        # Wait for the search (thread or worker process) to answer
+        done = self._search_done
+        if done is not None and not done.is_set():
+            done.wait(self.stop_grace)
+            if not done.is_set() and self._bestmove_pending:
+                self._send_best_so_far(self._go_id, "stop")
         
         self._debug("Search stopped")
     
@@ -459,7 +883,13 @@ class UCIProtocol:
     def _handle_quit(self):
         """Handle quit command."""
         self._handle_stop()
+        if self.worker:
+            self.worker.close()
+            self.worker = None
+        if self.telemetry:
+            self.telemetry.close()
         self._debug("Engine shutting down")
+        self.flush_output()
         try:
             sys.exit(0)
         except:
@@ -485,3 +915,4 @@ class UCIProtocol:
             self._debug(f"UCI loop error: {e}")
         finally:
             self._debug("UCI interface shutting down")
+            self.flush_output()
@@ -0,0 +1,212 @@
+"""
+SlowMate Chess Engine - Search Worker Process
+Runs the search in a persistent child process (keeping its TT, move cache
+and history between moves) so the UCI process only relays I/O and never
+competes with a CPU-bound search for the GIL
+Version: 1.0.0-BETA
+
+Parent -> child (pipe): ``('go', root_fen, moves, params, go_id)``,
+``('command', line)`` for setoption/ucinewgame, ``('quit',)``. The go
+params carry the parent's ``overhead_ms``: ``Move Overhead`` and the
+measured go-to-bestmove latency live in the parent, and the child engine
+subtracts them like the in-process search does. They also carry
+``go_time``, the wall-clock arrival of ``go``, which the child's clock
+runs from.
+Child -> parent (pipe): ``('out', line)`` for info output and
+``('bestmove', move, go_id, report)`` once a search returns.
+``stop`` is a shared counter (the newest go id stopped) and the best move
+so far a shared integer packing its go id with the move (one value, read
+and written whole), so neither needs the child to read its pipe mid-search. Only the parent stops a go and nothing ever
+clears a stop: a stop that beats the child to its search still counts, and
+an older search cannot be revived by a newer go.
+"""
+
+import multiprocessing
+import threading
+from typing import Callable, Optional
+
+# Spawned rather than forked: the parent has I/O threads running
+_CONTEXT = multiprocessing.get_context('spawn')
+
+_ALL_GOS = 2 ** 31 - 1  # Stops every go (shutdown)
+_MOVE_BITS = 16  # Encoded moves fit in 16 bits; the go id sits above them
+
+
+def _pack_best(go_id: int, move: int) -> int:
+    """Shared best-move value: ``move`` tagged with the go it belongs to."""
+    return go_id << _MOVE_BITS | move
+
+
+class GoStop:
+    """Event-like stop signal of one go, backed by the shared stop counter.
+    
+    Set once go ``go_id`` or any later go was stopped; usable as the
+    engine's ``stop_event`` in the child and the protocol's in the parent.
+    """
+    
+    def __init__(self, stopped_go, go_id: int):
+        self.stopped_go = stopped_go
+        self.go_id = go_id
+    
+    def is_set(self) -> bool:
+        return self.stopped_go.value >= self.go_id
+    
+    def set(self):
+        with self.stopped_go.get_lock():
+            if self.stopped_go.value < self.go_id:
+                self.stopped_go.value = self.go_id
+    
+    def clear(self):
+        pass  # A stopped go stays stopped; the next go has a higher id
+
+
+def _worker_engine_class():
+    """SlowMateEngine whose ``best_move_so_far`` is mirrored to shared memory."""
+    from slowmate.engine import SlowMateEngine
+
+    class WorkerEngine(SlowMateEngine):
+        shared_best_move = None  # multiprocessing.Value, set before __init__
+        go_id = 0                # Go the mirrored move belongs to
+
+        @property
+        def best_move_so_far(self):
+            return self._best_move_so_far
+
+        @best_move_so_far.setter
+        def best_move_so_far(self, move):
+            self._best_move_so_far = move
+            if self.shared_best_move is not None:
+                self.shared_best_move.value = _pack_best(self.go_id, move or 0)
+
+    return WorkerEngine
+
+
+def _worker_main(conn, stopped_go, shared_best_move):
+    """Child process: own engine, commands from ``conn`` until quit."""
+    import chess
+
+    engine_class = _worker_engine_class()
+    engine_class.shared_best_move = shared_best_move
+    engine = engine_class()
+    engine.uci._out = lambda line: conn.send(('out', line))
+    conn.send(('out', "info string search process ready"))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        kind = message[0]
+        if kind == 'quit':
+            break
+        if kind == 'command':
+            engine.uci.handle_command(message[1])
+            continue
+        if kind != 'go':
+            continue
+
+        _, root_fen, moves, params, go_id = message
+        move_uci, report = "0000", {}
+        stop = GoStop(stopped_go, go_id)
+        engine.go_id = go_id
+        shared_best_move.value = _pack_best(go_id, 0)  # Nothing found yet for this go
+        if stop.is_set():
+            # Stopped before it started (the parent already answered it)
+            conn.send(('bestmove', move_uci, go_id, report))
+            continue
+        try:
+            if "overhead_ms" in params:
+                engine.uci.move_overhead.base_ms = params["overhead_ms"]
+            engine.set_position(root_fen)
+            for uci in moves:
+                engine.board.make_move(chess.Move.from_uci(uci))
+            clocks = {("moves_to_go" if key == "movestogo" else key): value
+                      for key, value in params.items()
+                      if key in ("wtime", "btime", "winc", "binc", "movestogo")}
+            best_move = engine.search(time_limit_ms=params.get("movetime"),
+                                      depth_override=params.get("depth"),
+                                      stop_event=stop, go_time=params.get("go_time"),
+                                      **clocks)
+            if best_move is not None:
+                move_uci = best_move.uci()
+            report = dict(engine.search_report, nodes=engine.nodes)
+        except Exception as e:
+            conn.send(('out', f"info string search process error: {e}"))
+        conn.send(('bestmove', move_uci, go_id, report))
+    conn.close()
+
+
+class SearchWorker:
+    """Parent-side handle of the search process.
+
+    ``on_output(line)`` and ``on_bestmove(move, go_id, report)`` are called
+    from a reader thread; ``on_exit()`` when the child goes away.
+    """
+
+    def __init__(self, on_output: Callable[[str], None],
+                 on_bestmove: Callable[[str, int, dict], None],
+                 on_exit: Optional[Callable[[], None]] = None):
+        self.on_output = on_output
+        self.on_bestmove = on_bestmove
+        self.on_exit = on_exit
+        self.stopped_go = _CONTEXT.Value('i', 0)  # Newest go id that was stopped
+        self.best_move = _CONTEXT.Value('q', 0, lock=False)  # go id << 16 | encoded move
+        self._conn, child_conn = _CONTEXT.Pipe()
+        self._send_lock = threading.Lock()
+        self.process = _CONTEXT.Process(target=_worker_main, name="slowmate-search",
+                                        args=(child_conn, self.stopped_go, self.best_move),
+                                        daemon=True)
+        self.process.start()
+        child_conn.close()
+        self._reader = threading.Thread(target=self._read, name="slowmate-search-reader", daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def _send(self, message):
+        with self._send_lock:
+            self._conn.send(message)
+
+    def go(self, root_fen: str, moves, params: dict, go_id: int) -> GoStop:
+        """Search the position ``root_fen`` + ``moves`` (UCI strings).
+        
+        ``go_id`` must grow with every call; returns the go's stop signal.
+        """
+        self._send(('go', root_fen, list(moves), params, go_id))
+        return GoStop(self.stopped_go, go_id)
+    
+    def best_move_for(self, go_id: int) -> int:
+        """Encoded best move so far of go ``go_id``, 0 if none (or another go's)."""
+        packed = self.best_move.value
+        return packed & ((1 << _MOVE_BITS) - 1) if packed >> _MOVE_BITS == go_id else 0
+
+    def command(self, line: str):
+        """Forward a UCI command (setoption, ucinewgame) to the child engine."""
+        self._send(('command', line))
+
+    def close(self, timeout: float = 1.0):
+        """Stop any search and end the child process."""
+        GoStop(self.stopped_go, _ALL_GOS).set()
+        try:
+            self._send(('quit',))
+        except (OSError, BrokenPipeError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+
+    def _read(self):
+        """Relay child messages until its pipe closes."""
+        while True:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                break
+            if message[0] == 'out':
+                self.on_output(message[1])
+            elif message[0] == 'bestmove':
+                self.on_bestmove(message[1], message[2], message[3])
+        if self.on_exit is not None:
+            self.on_exit()
@@ -8,6 +8,7 @@ Can be used as a standalone script or imported for testing.
 import sys
 import os
 import signal
+import multiprocessing
 from typing import Optional
 
 # Add the parent directory to the path to import slowmate modules
@@ -31,7 +32,8 @@ class UCIMain:
         """Initialize the chess engine and UCI protocol."""
         try:
             self.engine = SlowMateEngine()
-            self.uci = UCIProtocol(self.engine)
+            # Use the engine's own protocol: the search polls its stop event
+            self.uci = getattr(self.engine, 'uci', None) or UCIProtocol(self.engine)
             self.uci.debug_mode = self.debug_mode
             return True
         except Exception as e:
@@ -90,6 +92,9 @@ class UCIMain:
             # Wait for search thread to finish
             if hasattr(self.uci, 'search_thread') and self.uci.search_thread:
                 self.uci.search_thread.join(timeout=1.0)
+            # Output is written by a background thread: drain it before exit
+            if hasattr(self.uci, 'flush_output'):
+                self.uci.flush_output()
             
     def test_uci_command(self, command: str) -> Optional[str]:
         """Test a single UCI command (useful for testing)."""
@@ -123,4 +128,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds: let a spawned search process (the
+    # SearchProcess option) run its worker instead of this UCI loop
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,43 @@
+"""
+SlowMate Chess Engine - Benchmark Positions
+Shared position sources for the benchmark scripts
+"""
+
+import glob
+import os
+import sys
+from typing import List
+
+import chess
+import chess.pgn
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GAMES_DIR = os.path.join(REPO_ROOT, 'games')
+
+# Add the repository root to the Python path so ``slowmate`` resolves
+sys.path.insert(0, REPO_ROOT)
+
+from slowmate.tools.perft import PERFT_POSITIONS
+
+# Standard test positions (start, Kiwipete, perft suite positions 3-5) and
+# their published perft node counts, by depth
+STANDARD_FENS = {name: fen for name, (fen, _) in PERFT_POSITIONS.items()}
+PERFT_COUNTS = {name: counts for name, (_, counts) in PERFT_POSITIONS.items()}
+
+
+def load_game_positions(limit: int = 2000, games_dir: str = GAMES_DIR) -> List[chess.Board]:
+    """Collect positions from the PGN files in ``games_dir``."""
+    boards = []
+    for path in sorted(glob.glob(os.path.join(games_dir, '*.pgn'))):
+        with open(path, errors='ignore') as pgn:
+            while len(boards) < limit:
+                game = chess.pgn.read_game(pgn)
+                if game is None:
+                    break
+                board = game.board()
+                for move in game.mainline_moves():
+                    board.push(move)
+                    boards.append(board.copy(stack=False))
+        if len(boards) >= limit:
+            break
+    return boards[:limit]
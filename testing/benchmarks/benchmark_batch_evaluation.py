@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Batch Evaluation Benchmark for SlowMate Chess Engine
+Compares NumPy batch evaluation against the scalar EnhancedEvaluator path
+on the material, piece-square and pawn-structure terms.
+
+Usage:
+    python testing/benchmarks/benchmark_batch_evaluation.py [--positions 5000]
+"""
+
+import argparse
+import time
+
+from bench_positions import load_game_positions
+
+from slowmate.core.batch_evaluate import (BatchEvaluator, encode_bitboards,
+                                          encode_boards, scalar_terms)
+from slowmate.core.board import Board
+from slowmate.core.enhanced_evaluate import EnhancedEvaluator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--positions', type=int, default=5000)
+    args = parser.parse_args()
+
+    boards = load_game_positions(args.positions)
+    print(f"Loaded {len(boards)} positions")
+
+    evaluator = EnhancedEvaluator()
+    wrapped = []
+    for chess_board in boards:
+        board = Board()
+        board.set_fen(chess_board.fen())
+        wrapped.append(board)
+
+    start = time.perf_counter()
+    scalar_scores = [scalar_terms(evaluator, board) for board in wrapped]
+    scalar_time = time.perf_counter() - start
+
+    batch_evaluator = BatchEvaluator()
+    planes = encode_boards(boards)
+    bitboards = encode_bitboards(boards)
+
+    start = time.perf_counter()
+    plane_scores = batch_evaluator.evaluate(planes)
+    plane_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bitboard_scores = batch_evaluator.evaluate(bitboards)
+    bitboard_time = time.perf_counter() - start
+
+    max_diff = max(max(abs(a - b), abs(a - c))
+                   for a, b, c in zip(scalar_scores, plane_scores, bitboard_scores))
+
+    count = len(boards)
+    print(f"Scalar EnhancedEvaluator terms: {count / scalar_time:12.0f} evals/s")
+    print(f"Batch (N, 12, 64) planes:      {count / plane_time:12.0f} evals/s "
+          f"({scalar_time / plane_time:.1f}x)")
+    print(f"Batch (N, 12) bitboards:       {count / bitboard_time:12.0f} evals/s "
+          f"({scalar_time / bitboard_time:.1f}x)")
+    print(f"Max |scalar - batch| difference: {max_diff:.6f}")
+
+
+if __name__ == '__main__':
+    main()
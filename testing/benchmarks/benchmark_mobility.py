@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Mobility Micro-Benchmark for SlowMate Chess Engine
+Compares the legacy Evaluator mobility term (turn flipping plus two legal
+move generations) with the attack-bitboard implementation.
+
+Usage:
+    python testing/benchmarks/benchmark_mobility.py [--positions 2000]
+"""
+
+import argparse
+import time
+
+import chess
+from bench_positions import load_game_positions
+
+from slowmate.core.evaluate import Evaluator
+
+
+def legal_move_mobility(evaluator: Evaluator, board: chess.Board) -> int:
+    """Previous mobility term: flips ``board.turn`` and counts legal moves."""
+    original_turn = board.turn
+    try:
+        board.turn = chess.WHITE
+        white_moves = list(board.legal_moves)
+        white_central = sum(1 for m in white_moves if 2 <= chess.square_rank(m.to_square) <= 5
+                            and 2 <= chess.square_file(m.to_square) <= 5)
+        board.turn = chess.BLACK
+        black_moves = list(board.legal_moves)
+        black_central = sum(1 for m in black_moves if 2 <= chess.square_rank(m.to_square) <= 5
+                            and 2 <= chess.square_file(m.to_square) <= 5)
+    finally:
+        board.turn = original_turn
+    score = (len(white_moves) - len(black_moves)) * evaluator.MOBILITY_WEIGHT
+    score += (white_central - black_central) * evaluator.CENTER_CONTROL_WEIGHT
+    return score
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--positions', type=int, default=2000)
+    args = parser.parse_args()
+
+    boards = load_game_positions(args.positions)
+    evaluator = Evaluator()
+
+    start = time.perf_counter()
+    legacy = [legal_move_mobility(evaluator, board) for board in boards]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = [evaluator._evaluate_mobility(board) for board in boards]
+    current_time = time.perf_counter() - start
+
+    same_sign = sum(1 for a, b in zip(legacy, current) if (a > 0) == (b > 0) or a == b == 0)
+    count = len(boards)
+    print(f"Positions: {count}")
+    print(f"Legal-move mobility:    {count / legacy_time:10.0f} calls/s")
+    print(f"Attack-count mobility:  {count / current_time:10.0f} calls/s "
+          f"({legacy_time / current_time:.1f}x)")
+    print(f"Sign agreement with legal-move mobility: {same_sign / count:.1%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+NNUE Benchmark for SlowMate Chess Engine
+Compares the NNUE backend with the handcrafted evaluator: evaluations per
+second (from scratch and incrementally updated during search), fixed-depth
+search speed, and a short fixed-depth match between the two.
+
+Without --weights the bootstrap network (material + PST only) is used.
+
+Usage:
+    python testing/benchmarks/benchmark_nnue.py [--weights net.npz] [--depth 3] [--games 10]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import chess
+from bench_positions import STANDARD_FENS, load_game_positions
+
+from benchmark_search import bench_search
+from slowmate.core.board import Board
+from slowmate.core.nnue import NNUENetwork
+from slowmate.engine import SlowMateEngine
+
+
+def wrapped_positions(count: int):
+    """Game positions as ``Board`` wrappers."""
+    boards = []
+    for chess_board in load_game_positions(count):
+        board = Board()
+        board.set_fen(chess_board.fen())
+        boards.append(board)
+    return boards
+
+
+def bench_scratch_evaluation(evaluator, count: int) -> float:
+    """Return evals/s when every position is evaluated from scratch."""
+    boards = wrapped_positions(count)
+    for board in boards:
+        board.nnue = None
+    start = time.perf_counter()
+    for board in boards:
+        evaluator.evaluate(board)
+        board.nnue = None  # Drop the accumulator the NNUE evaluator attached
+    return len(boards) / (time.perf_counter() - start)
+
+
+def bench_incremental_evaluation(evaluator, count: int) -> float:
+    """Return evals/s when every evaluation follows a single make_move."""
+    positions = []
+    for board in wrapped_positions(count):
+        moves = board.get_legal_moves()
+        if moves:
+            evaluator.evaluate(board)  # Attach the accumulator
+            positions.append((board, moves[len(moves) // 2]))
+    start = time.perf_counter()
+    for board, move in positions:
+        board.make_move(move)
+        evaluator.evaluate(board)
+        board.unmake_move()
+    return len(positions) / (time.perf_counter() - start)
+
+
+def play_match(weights_path: str, games: int, depth: int):
+    """Play NNUE vs handcrafted from the standard positions, colours alternating.
+
+    Returns (nnue wins, draws, nnue losses).
+    """
+    engines = {'handcrafted': SlowMateEngine(), 'nnue': SlowMateEngine()}
+    engines['nnue'].set_eval_file(weights_path)
+    for engine in engines.values():
+        engine.uci._out = lambda message: None
+    fens = list(STANDARD_FENS.values())
+    wins = draws = losses = 0
+    for game_number in range(games):
+        board = chess.Board(fens[(game_number // 2) % len(fens)])
+        nnue_color = chess.WHITE if game_number % 2 == 0 else chess.BLACK
+        for engine in engines.values():
+            engine.new_game()
+        while not board.is_game_over(claim_draw=True) and board.ply() < 200:
+            engine = engines['nnue' if board.turn == nnue_color else 'handcrafted']
+            engine.set_position(board.fen())
+            move = engine.search(time_limit_ms=600000, depth_override=depth)
+            if move is None:
+                break
+            board.push(move)
+        outcome = board.outcome(claim_draw=True)
+        if outcome is None or outcome.winner is None:
+            draws += 1
+        elif outcome.winner == nnue_color:
+            wins += 1
+        else:
+            losses += 1
+        print(f"  game {game_number + 1}: nnue {'white' if nnue_color else 'black'} "
+              f"-> {outcome.result() if outcome else 'unfinished'}")
+    return wins, draws, losses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--weights', help="NNUE weights (.npz); default: bootstrap network")
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--eval-positions', type=int, default=2000)
+    parser.add_argument('--games', type=int, default=10)
+    parser.add_argument('--match-depth', type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        weights_path = args.weights
+        if not weights_path:
+            weights_path = os.path.join(temp_dir, 'bootstrap.npz')
+            NNUENetwork.bootstrap().save(weights_path)
+
+        handcrafted = SlowMateEngine()
+        nnue = SlowMateEngine()
+        print(f"Backend: {nnue.set_eval_file(weights_path)}")
+
+        for name, engine in (('handcrafted', handcrafted), ('nnue', nnue)):
+            print(f"{name}:")
+            print(f"  scratch eval:     {bench_scratch_evaluation(engine.evaluator, args.eval_positions):9.0f} evals/s")
+            print(f"  incremental eval: {bench_incremental_evaluation(engine.evaluator, args.eval_positions):9.0f} evals/s")
+            nodes, elapsed = bench_search(engine, args.depth)
+            print(f"  depth {args.depth}: {nodes} nodes in {elapsed:.2f}s = {nodes / max(elapsed, 1e-9):.0f} nps")
+
+        if args.games:
+            print(f"Match, {args.games} games at depth {args.match_depth}:")
+            wins, draws, losses = play_match(weights_path, args.games, args.match_depth)
+            print(f"NNUE +{wins} ={draws} -{losses} "
+                  f"({(wins + draws / 2) / args.games * 100:.0f}% score)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Perft Benchmark for SlowMate Chess Engine
+Compares the bitboard move generator with python-chess: perft nodes per
+second (bulk-counted, both pushing moves on a ``chess.Board``) and raw
+legal/pseudo-legal generation time, checking every count against the
+published perft numbers.
+
+Usage:
+    python testing/benchmarks/benchmark_perft.py [--depth 3] [--positions 3000]
+"""
+
+import argparse
+import time
+
+import chess
+from bench_positions import PERFT_COUNTS, STANDARD_FENS, load_game_positions
+
+from slowmate.core.movegen import BitboardMoveGenerator, MAX_MOVES
+
+
+def python_chess_perft(board: chess.Board, depth: int) -> int:
+    """Reference perft with python-chess legal move generation."""
+    if depth == 1:
+        return board.legal_moves.count()
+    nodes = 0
+    for move in board.legal_moves:
+        board.push(move)
+        nodes += python_chess_perft(board, depth - 1)
+        board.pop()
+    return nodes
+
+
+def bench_generation(generator: BitboardMoveGenerator, boards) -> dict:
+    """Microseconds per position for each generator."""
+    buffer = [0] * MAX_MOVES
+    timings = {}
+    for name, generate in (
+        ('bitboard legal', lambda board: generator.generate(board, buffer)),
+        ('python-chess legal', lambda board: list(board.legal_moves)),
+        ('bitboard pseudo-legal', lambda board: generator.generate(board, buffer, legal=False)),
+        ('python-chess pseudo-legal', lambda board: list(board.generate_pseudo_legal_moves())),
+    ):
+        start = time.perf_counter()
+        for board in boards:
+            generate(board)
+        timings[name] = (time.perf_counter() - start) / len(boards) * 1e6
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--positions', type=int, default=3000)
+    args = parser.parse_args()
+
+    generator = BitboardMoveGenerator()
+    totals = {'bitboard': [0, 0.0], 'python-chess': [0, 0.0]}
+    print(f"Perft to depth {args.depth}:")
+    for name, fen in STANDARD_FENS.items():
+        expected = PERFT_COUNTS[name][args.depth] if args.depth < len(PERFT_COUNTS[name]) else None
+        line = f"  {name:<10}"
+        for label, perft in (('bitboard', generator.perft), ('python-chess', python_chess_perft)):
+            board = chess.Board(fen)
+            start = time.perf_counter()
+            nodes = perft(board, args.depth)
+            elapsed = time.perf_counter() - start
+            totals[label][0] += nodes
+            totals[label][1] += elapsed
+            status = "" if expected is None else (" ok" if nodes == expected else f" MISMATCH (expected {expected})")
+            line += f"  {label} {nodes:>9} {nodes / elapsed:>9.0f} nps{status}"
+        print(line)
+    for label, (nodes, elapsed) in totals.items():
+        print(f"Total {label}: {nodes} nodes in {elapsed:.2f}s = {nodes / elapsed:.0f} nps")
+
+    boards = load_game_positions(args.positions)
+    print(f"Move generation over {len(boards)} game positions:")
+    for name, micros in bench_generation(generator, boards).items():
+        print(f"  {name:<26} {micros:6.1f} us/position")
+
+
+if __name__ == '__main__':
+    main()
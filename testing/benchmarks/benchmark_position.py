@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Position Command Benchmark for SlowMate Chess Engine
+Replays a long game the way a GUI sends it ("position startpos moves ..."
+with the whole move list before every go) and reports the time spent per
+position command, incremental versus rebuilding from the start position.
+
+Usage:
+    python testing/benchmarks/benchmark_position.py [--plies 200] [--seed 1]
+"""
+
+import argparse
+import random
+import time
+
+import chess
+
+from slowmate.engine import SlowMateEngine
+
+
+def random_game(plies: int, seed: int):
+    """UCI moves of a random legal game of up to ``plies`` plies."""
+    rng = random.Random(seed)
+    board = chess.Board()
+    moves = []
+    while len(moves) < plies and not board.is_game_over():
+        move = rng.choice(list(board.legal_moves))
+        board.push(move)
+        moves.append(move.uci())
+    return moves
+
+
+def bench(moves, incremental: bool) -> float:
+    """Seconds spent in all position commands of the game."""
+    engine = SlowMateEngine()
+    engine.uci._out = lambda message: None
+    elapsed = 0.0
+    for ply in range(1, len(moves) + 1):
+        if not incremental:
+            engine.uci._position_state = None  # Force the full rebuild
+        command = "position startpos moves " + " ".join(moves[:ply])
+        start = time.perf_counter()
+        engine.uci.handle_command(command)
+        elapsed += time.perf_counter() - start
+    assert [m.uci() for m in engine.board.board.move_stack] == moves
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--plies', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    moves = random_game(args.plies, args.seed)
+    rebuild = bench(moves, incremental=False)
+    incremental = bench(moves, incremental=True)
+    print(f"{len(moves)} position commands")
+    print(f"Full rebuild: {rebuild * 1000:8.1f} ms total, {rebuild / len(moves) * 1000:.3f} ms/command")
+    print(f"Incremental:  {incremental * 1000:8.1f} ms total, {incremental / len(moves) * 1000:.3f} ms/command")
+    print(f"Speedup: {rebuild / incremental:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
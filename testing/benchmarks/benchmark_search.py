@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Search Benchmark for SlowMate Chess Engine
+Reports static evaluations per second and fixed-depth search nodes per
+second on the standard benchmark positions.
+
+Usage:
+    python testing/benchmarks/benchmark_search.py [--depth 3] [--eval-positions 2000]
+"""
+
+import argparse
+import time
+
+from bench_positions import STANDARD_FENS, load_game_positions
+
+from slowmate.core.board import Board
+from slowmate.engine import SlowMateEngine
+
+
+def bench_evaluation(engine: SlowMateEngine, count: int) -> float:
+    """Return evaluator calls per second over game positions."""
+    boards = []
+    for chess_board in load_game_positions(count):
+        board = Board()
+        board.set_fen(chess_board.fen())
+        boards.append(board)
+    start = time.perf_counter()
+    for board in boards:
+        engine.evaluator.evaluate(board)
+    return len(boards) / (time.perf_counter() - start)
+
+
+def bench_search(engine: SlowMateEngine, depth: int):
+    """Search every standard position to ``depth``; return (nodes, seconds)."""
+    engine.uci._out = lambda message: None  # Silence info output
+    total_nodes = 0
+    total_time = 0.0
+    for name, fen in STANDARD_FENS.items():
+        engine.new_game()
+        engine.set_position(fen)
+        start = time.perf_counter()
+        move = engine.search(time_limit_ms=600000, depth_override=depth)
+        elapsed = time.perf_counter() - start
+        total_nodes += engine.nodes
+        total_time += elapsed
+        print(f"  {name:<10} {move}  nodes {engine.nodes:>8}  "
+              f"time {elapsed:6.2f}s  nps {engine.nodes / max(elapsed, 1e-9):8.0f}")
+    return total_nodes, total_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depth', type=int, default=3)
+    parser.add_argument('--eval-positions', type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = SlowMateEngine()
+    print(f"Evaluation: {bench_evaluation(engine, args.eval_positions):.0f} evals/s")
+
+    print(f"Search to depth {args.depth}:")
+    nodes, elapsed = bench_search(engine, args.depth)
+    print(f"Total: {nodes} nodes in {elapsed:.2f}s = {nodes / max(elapsed, 1e-9):.0f} nps")
+
+
+if __name__ == '__main__':
+    main()
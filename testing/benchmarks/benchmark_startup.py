@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark for SlowMate Chess Engine
+Reports module import time, precomputed table generation versus cache load,
+and engine construction time.
+
+Usage:
+    python testing/benchmarks/benchmark_startup.py [--repeat 200]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def bench_import() -> float:
+    """Return the wall time of importing the engine in a fresh interpreter."""
+    code = ("import time; start = time.perf_counter(); import slowmate.engine; "
+            "print(time.perf_counter() - start)")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return float(result.stdout.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"Import slowmate.engine: {bench_import() * 1000:.1f} ms")
+
+    from slowmate.core import table_cache
+    from slowmate.engine import SlowMateEngine
+
+    start = time.perf_counter()
+    tables = table_cache.build_tables()
+    build_time = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, table_cache.CACHE_FILENAME)
+        table_cache.write_cache(path, tables)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            table_cache.load_cache(path)
+        load_time = (time.perf_counter() - start) / args.repeat
+        size = os.path.getsize(path)
+    print(f"Table generation: {build_time * 1000:.2f} ms")
+    print(f"Table cache load: {load_time * 1000:.3f} ms ({size} bytes, mmap)")
+    print(f"Shared tables source: {table_cache.TABLES.source}")
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        SlowMateEngine()
+    construct_time = (time.perf_counter() - start) / args.repeat
+    print(f"Engine construction: {construct_time * 1e6:.1f} us")
+
+
+if __name__ == '__main__':
+    main()
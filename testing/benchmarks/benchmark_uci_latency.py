@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+UCI Latency Benchmark for SlowMate Chess Engine
+Measures isready->readyok and stop->bestmove latency while the engine is
+searching (``go infinite``), with the search in a thread of the UCI process
+and in a separate search process (``setoption name SearchProcess``).
+
+Usage:
+    python testing/benchmarks/benchmark_uci_latency.py [--rounds 20] [--search-ms 300]
+"""
+
+import argparse
+import queue
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+
+class EngineProcess:
+    """The UCI engine as a child process, with a line reader thread."""
+
+    def __init__(self):
+        self.process = subprocess.Popen([sys.executable, '-m', 'slowmate.uci_main'],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        text=True, bufsize=1)
+        self.lines: "queue.Queue[tuple]" = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.put((time.perf_counter(), line.strip()))
+
+    def send(self, command: str) -> float:
+        sent = time.perf_counter()
+        self.process.stdin.write(command + "\n")
+        self.process.stdin.flush()
+        return sent
+
+    def wait_for(self, prefix: str, timeout: float = 10.0) -> float:
+        """Timestamp of the next line starting with ``prefix``."""
+        deadline = time.perf_counter() + timeout
+        while True:
+            stamp, line = self.lines.get(timeout=max(0.0, deadline - time.perf_counter()))
+            if line.startswith(prefix):
+                return stamp
+
+    def close(self):
+        self.send("quit")
+        self.process.wait(timeout=10)
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return statistics.median(ordered), p95, ordered[-1]
+
+
+def bench(search_process: bool, rounds: int, search_ms: int):
+    """Return (isready latencies, stop latencies) in ms."""
+    engine = EngineProcess()
+    engine.send("uci")
+    engine.wait_for("uciok")
+    if search_process:
+        engine.send("setoption name SearchProcess value true")
+        engine.wait_for("info string search process ready", timeout=30.0)
+    engine.send("isready")
+    engine.wait_for("readyok")
+
+    ready, stop = [], []
+    for _ in range(rounds):
+        engine.send("position startpos moves e2e4 e7e5 g1f3")
+        engine.send("go infinite")
+        time.sleep(search_ms / 2000)
+        sent = engine.send("isready")
+        ready.append((engine.wait_for("readyok") - sent) * 1000)
+        time.sleep(search_ms / 2000)
+        sent = engine.send("stop")
+        stop.append((engine.wait_for("bestmove") - sent) * 1000)
+    engine.close()
+    return ready, stop
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--search-ms', type=int, default=300, help="Search time before stop")
+    args = parser.parse_args()
+
+    print(f"{'mode':<16}{'command':<10}{'median':>10}{'p95':>10}{'max':>10}  (ms)")
+    for search_process in (False, True):
+        mode = "search process" if search_process else "search thread"
+        ready, stop = bench(search_process, args.rounds, args.search_ms)
+        for name, samples in (("isready", ready), ("stop", stop)):
+            median, p95, worst = percentiles(samples)
+            print(f"{mode:<16}{name:<10}{median:>10.2f}{p95:>10.2f}{worst:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
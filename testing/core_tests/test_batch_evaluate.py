@@ -0,0 +1,61 @@
+"""
+SlowMate Chess Engine - Batch Evaluation Tests
+Version: 1.0.0-BETA
+"""
+
+import unittest
+import chess
+
+try:
+    import numpy as np
+    from slowmate.core.batch_evaluate import (BatchEvaluator, encode_bitboards,
+                                              encode_boards, scalar_terms)
+except ImportError:  # NumPy is optional
+    np = None
+
+from slowmate.core.board import Board
+from slowmate.core.enhanced_evaluate import EnhancedEvaluator
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestBatchEvaluator(unittest.TestCase):
+    FENS = [
+        chess.STARTING_FEN,
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        "rnb1k1nr/pppp1ppp/4p3/8/4P3/2P2P2/P1P1NP1P/R1B1KB1R b KQkq - 0 7",
+        "8/5k2/8/1P6/8/3K4/8/8 b - - 0 1",
+    ]
+    
+    def setUp(self):
+        self.batch = BatchEvaluator()
+        self.evaluator = EnhancedEvaluator()
+        self.boards = [chess.Board(fen) for fen in self.FENS]
+        
+    def _scalar_scores(self):
+        scores = []
+        for chess_board in self.boards:
+            board = Board()
+            board.set_fen(chess_board.fen())
+            scores.append(scalar_terms(self.evaluator, board))
+        return np.array(scores)
+        
+    def test_planes_match_scalar(self):
+        """Test (N, 12, 64) planes against the scalar evaluator terms."""
+        scores = self.batch.evaluate(encode_boards(self.boards))
+        np.testing.assert_allclose(scores, self._scalar_scores(), atol=1e-9)
+        
+    def test_bitboards_match_planes(self):
+        """Test (N, 12) bitboards produce the same scores as planes."""
+        np.testing.assert_allclose(self.batch.evaluate(encode_bitboards(self.boards)),
+                                   self.batch.evaluate(encode_boards(self.boards)))
+        
+    def test_side_to_move_perspective(self):
+        """Test scores flip for black to move when turn is given."""
+        turn = np.array([board.turn for board in self.boards])
+        white = self.batch.evaluate(encode_boards(self.boards))
+        relative = self.batch.evaluate(encode_boards(self.boards), turn)
+        np.testing.assert_allclose(relative, np.where(turn, white, -white))
+        
+if __name__ == '__main__':
+    unittest.main()
@@ -77,5 +77,51 @@ class TestBoard(unittest.TestCase):
         self.board.set_fen("k7/8/8/8/8/8/8/K7 w - - 0 1")
         self.assertTrue(self.board.is_insufficient_material())
         
+    def test_incremental_accumulators(self):
+        """Test material/PST/phase accumulators across special moves."""
+        board = Board(debug_accumulators=True)
+        # Castling both sides, en passant and a capturing under-promotion
+        board.set_fen("r3k2r/1P4pp/8/3pP3/8/8/6PP/R3K2R w KQkq d6 0 1")
+        start = (board.material[:], board.pst_mg[:], board.pst_eg[:], board.phase)
+        for uci in ["e5d6", "e8g8", "e1c1", "h7h6", "b7a8n"]:
+            board.make_move(chess.Move.from_uci(uci))
+        self.assertEqual(board.material[chess.BLACK], 20000 + 500 + 2 * 100)
+        self.assertEqual(board.phase, 3 * 2 + 1)
+        for _ in range(5):
+            board.unmake_move()
+        self.assertEqual((board.material, board.pst_mg, board.pst_eg, board.phase), start)
+        
+    def test_incremental_zobrist_key(self):
+        """Test the incremental Zobrist key matches polyglot hashing."""
+        import chess.polyglot
+        board = Board(debug_accumulators=True)  # Verifies the key after every move
+        board.set_fen("r3k2r/1P4pp/8/3pP3/8/8/6PP/R3K2R w KQkq d6 0 1")
+        start = board.zobrist
+        self.assertEqual(start, chess.polyglot.zobrist_hash(board.board))
+        for uci in ["e5d6", "e8g8", "e1c1", "h7h5", "0000", "g8h7", "b7a8n"]:
+            board.make_move(chess.Move.from_uci(uci))
+        for _ in range(7):
+            board.unmake_move()
+        self.assertEqual(board.zobrist, start)
+        # Same position reached by a different move order: same key
+        keys = []
+        for order in (["g1f3", "g8f6", "b1c3"], ["b1c3", "g8f6", "g1f3"]):
+            board.set_fen(chess.STARTING_FEN)
+            for uci in order:
+                board.make_move(chess.Move.from_uci(uci))
+            keys.append(board.zobrist)
+        self.assertEqual(keys[0], keys[1])
+        
+    def test_enhanced_evaluator_uses_accumulators(self):
+        """Test that accumulator-based evaluation matches a board scan."""
+        from slowmate.core.enhanced_evaluate import EnhancedEvaluator
+        evaluator = EnhancedEvaluator()
+        for move in ["e2e4", "d7d5", "e4d5", "d8d5", "b1c3"]:
+            self.board.make_move(chess.Move.from_uci(move))
+            incremental = evaluator._material_and_pst(self.board)
+            scratch = evaluator._material_and_pst(self.board.board)
+            self.assertEqual(incremental[:2], scratch[:2])
+            self.assertAlmostEqual(incremental[2], scratch[2])
+        
 if __name__ == '__main__':
     unittest.main()
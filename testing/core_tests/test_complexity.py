@@ -0,0 +1,81 @@
+"""
+SlowMate Chess Engine - Complexity Estimator Tests
+Version: 1.0.0-BETA
+"""
+
+import random
+import unittest
+import chess
+import chess.polyglot
+
+from slowmate.core.board import Board
+from slowmate.core.complexity import ComplexityEstimator, complexity_features
+from slowmate.core.time_manager import TimeManager
+
+
+class TestComplexityEstimator(unittest.TestCase):
+
+    def test_features_track_legal_moves(self):
+        """Pseudo-legal counts bound the legal ones; in-check matches python-chess."""
+        rng = random.Random(7)
+        for _ in range(6):
+            board = chess.Board()
+            for _ in range(60):
+                moves = list(board.legal_moves)
+                if not moves:
+                    break
+                features = complexity_features(board)
+                self.assertEqual(features.in_check, board.is_check())
+                self.assertEqual(features.pieces, len(board.piece_map()))
+                ordinary = [m for m in moves if not board.is_castling(m) and not board.is_en_passant(m)]
+                if not board.is_check():
+                    self.assertGreaterEqual(features.mobility, len(ordinary))
+                    captures = {(m.from_square, m.to_square) for m in ordinary if board.is_capture(m)}
+                    self.assertGreaterEqual(features.captures, len(captures))
+                self.assertTrue(0.0 <= features.score <= 1.0)
+                board.push(rng.choice(moves))
+
+    def test_known_position(self):
+        """Startpos: 20 moves, nothing to capture or check."""
+        features = complexity_features(chess.Board())
+        self.assertEqual((features.mobility, features.captures, features.checks), (20, 0, 0))
+        self.assertEqual(features.attacked_pieces, 0)
+        board = chess.Board("4k3/8/8/8/8/8/3q4/R3K3 w - - 0 1")
+        features = complexity_features(board)
+        self.assertTrue(features.in_check)
+        self.assertGreater(features.king_pressure, 0)
+        # Ra8+ and Ke1xd2 (and the king stepping next to the queen) are counted
+        self.assertGreaterEqual(features.checks, 1)
+        self.assertEqual(features.captures, 1)
+
+    def test_score_weighting(self):
+        """Material 0.3, moves 0.4, in check 0.2, any capture 0.1."""
+        self.assertAlmostEqual(complexity_features(chess.Board()).score, 0.3 + 0.2)
+        features = complexity_features(chess.Board("4k3/8/8/8/8/8/3q4/R3K3 w - - 0 1"))
+        self.assertAlmostEqual(features.score,
+                               4 / 32 * 0.3 + min(features.mobility / 40, 1.0) * 0.4 + 0.2 + 0.1)
+
+    def test_cache_keyed_by_zobrist(self):
+        """``Board.zobrist`` and a bare chess.Board hit the same entry."""
+        estimator = ComplexityEstimator(max_entries=2)
+        board = Board()
+        board.make_move(chess.Move.from_uci("e2e4"))
+        first = estimator.features(board.board, board.zobrist)
+        self.assertIs(estimator.features(board.board.copy()), first)
+        self.assertEqual((estimator.hits, estimator.misses), (1, 1))
+        estimator.features(chess.Board())
+        estimator.features(chess.Board("8/8/8/8/8/8/8/K6k w - - 0 1"))
+        self.assertEqual(len(estimator.entries), 2)
+        self.assertNotIn(board.zobrist, estimator.entries)
+
+    def test_time_manager_uses_estimator(self):
+        """The time manager's complexity stays within 0-1 and grows with tension."""
+        manager = TimeManager()
+        quiet = manager._calculate_complexity(chess.Board("8/8/4k3/8/8/4K3/8/8 w - - 0 1"))
+        sharp = manager._calculate_complexity(chess.Board(
+            "r1bqk2r/pppp1ppp/2n2n2/2b1p3/2B1P3/3P1N2/PPP2PPP/RNBQK2R w KQkq - 1 5"))
+        self.assertTrue(0.0 <= quiet < sharp <= 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+SlowMate Chess Engine - Emergency Profile Tests
+Version: 1.0.0-BETA
+"""
+
+import time
+import unittest
+import chess
+
+from slowmate.core.time_manager import TimeManager
+from slowmate.engine import SlowMateEngine
+
+
+class TestEmergencyProfile(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.lines = []
+        self.engine.uci._out = self.lines.append
+
+    def test_thresholds(self):
+        manager = TimeManager()
+        self.assertTrue(manager.is_emergency(0.5))
+        self.assertTrue(manager.is_emergency(None, 0.05))
+        self.assertFalse(manager.is_emergency(30.0, 1.0))
+        self.assertFalse(manager.is_emergency(None))
+
+    def test_book_move_is_instant(self):
+        move = self.engine.search(wtime=400, btime=400)
+        self.assertIn(move.uci(), self.engine.opening_book.get_book_moves(chess.STARTING_FEN))
+        self.assertTrue(self.engine.search_report['instant'])
+        self.assertTrue(any("emergency: book move" in line for line in self.lines))
+
+    def test_low_clock_search_is_capped(self):
+        self.engine.set_position("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+        start = time.perf_counter()
+        move = self.engine.search(wtime=400, btime=400)
+        self.assertIn(move, self.engine.board.get_legal_moves())
+        self.assertLess(time.perf_counter() - start, 0.4)
+        report = self.engine.search_report
+        self.assertTrue(report['emergency'])
+        self.assertIsNone(report['complexity'])
+        self.assertLessEqual(report['depth'], self.engine.emergency_depth)
+        # The next emergency search of the same position plays the TT move at once
+        again = self.engine.search(wtime=300, btime=300)
+        self.assertEqual(again, move)
+        self.assertTrue(self.engine.search_report['instant'])
+
+    def test_zero_clock_is_a_clock(self):
+        self.engine.set_position("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+        move = self.engine.search(wtime=0, btime=60000)
+        self.assertIn(move, self.engine.board.get_legal_moves())
+        self.assertTrue(self.engine.search_report['emergency'])
+        self.assertLess(self.engine.search_report['hard_ms'], 100)
+        self.assertAlmostEqual(self.engine.uci._hard_limit({'wtime': 0, 'btime': 60000}), 0.02)
+
+    def test_options_configure_thresholds(self):
+        self.engine.uci.handle_command("setoption name Emergency Clock value 0")
+        self.engine.uci.handle_command("setoption name Emergency Move Time value 0")
+        self.assertEqual(self.engine.time_manager.emergency_clock_time, 0.0)
+        self.engine.set_position("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+        self.engine.search(wtime=400, btime=400)
+        self.assertFalse(self.engine.search_report['emergency'])
+
+
+if __name__ == '__main__':
+    unittest.main()
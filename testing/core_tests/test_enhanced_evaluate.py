@@ -0,0 +1,62 @@
+"""
+SlowMate Chess Engine - Enhanced Evaluation Tests
+Version: 1.0.0-BETA
+"""
+
+import unittest
+import chess
+from slowmate.core.attack_map import AttackMap, KING_ZONE_MASKS
+from slowmate.core.board import Board
+from slowmate.core.enhanced_evaluate import EnhancedEvaluator
+
+class TestEnhancedEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+        self.evaluator = EnhancedEvaluator()
+        
+    def test_lazy_evaluation_skips_outside_window(self):
+        """Test lazy evaluation returns material + PST far outside the window."""
+        # White is a queen up
+        self.board.set_fen("rnb1kbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+        full = self.evaluator.evaluate(self.board)
+        lazy = self.evaluator.evaluate(self.board, -50, 50)
+        self.assertEqual(self.evaluator.lazy_stats['skips'], 1)
+        self.assertGreaterEqual(lazy, 50 + self.evaluator.lazy_margin)
+        self.assertLess(abs(full - lazy), self.evaluator.lazy_margin)
+        
+    def test_lazy_evaluation_full_inside_window(self):
+        """Test positions near the window still get the full evaluation."""
+        full = self.evaluator.evaluate(self.board)
+        self.assertEqual(self.evaluator.evaluate(self.board, -50, 50), full)
+        self.assertEqual(self.evaluator.lazy_stats['calls'], 1)
+        self.assertEqual(self.evaluator.lazy_stats['skips'], 0)
+        
+    def test_attack_map_matches_attackers(self):
+        """Test the shared attack map against python-chess attacker queries."""
+        board = chess.Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+        attack_map = AttackMap(board)
+        for color in chess.COLORS:
+            for square in chess.SQUARES:
+                count = sum(1 for _, _, mask in attack_map.piece_attacks[color]
+                            if mask & chess.BB_SQUARES[square])
+                self.assertEqual(count, len(board.attackers(color, square)))
+            self.assertEqual(attack_map.attacks[color],
+                             sum(chess.BB_SQUARES[sq] for sq in chess.SQUARES
+                                 if board.is_attacked_by(color, sq)))
+            zone = KING_ZONE_MASKS[board.king(color)]
+            self.assertEqual(attack_map.king_zone_attacks[color],
+                             sum(len(board.attackers(not color, sq))
+                                 for sq in chess.scan_forward(zone)))
+
+    def test_king_safety_reads_king_zone_attacks(self):
+        """King-zone pressure from the attack map lowers that side's king safety."""
+        quiet = chess.Board("4k3/8/8/8/8/8/5PPP/6K1 w - - 0 1")
+        attacked = chess.Board("4k3/8/8/8/8/4q3/5PPP/6K1 w - - 0 1")
+        attack_map = AttackMap(attacked)
+        self.assertGreater(attack_map.king_zone_attacks[chess.WHITE], 0)
+        self.assertEqual(attack_map.king_attackers[chess.WHITE], 0)
+        self.assertLess(self.evaluator._evaluate_king_safety(attacked, attack_map),
+                        self.evaluator._evaluate_king_safety(quiet))
+                
+if __name__ == '__main__':
+    unittest.main()
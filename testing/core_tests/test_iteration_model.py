@@ -0,0 +1,44 @@
+"""
+SlowMate Chess Engine - Iteration Cost Model Tests
+Version: 1.0.0-BETA
+"""
+
+import unittest
+
+from slowmate.core.time_manager import IterationCostModel
+from slowmate.engine import SlowMateEngine
+
+
+class TestIterationCostModel(unittest.TestCase):
+
+    def test_branching_factor_and_prediction(self):
+        """EBF is the geometric mean of the last two node ratios, clamped."""
+        model = IterationCostModel()
+        model.add(1, 20, 0.01)
+        model.add(2, 80, 0.04)
+        self.assertIsNone(model.predict())
+        model.add(3, 720, 0.3)  # Ratios 4 and 9
+        self.assertAlmostEqual(model.branching_factor(), 6.0)
+        self.assertAlmostEqual(model.predict(), 1.8)
+        model.add(4, 720, 0.3)
+        model.add(5, 720, 0.3)
+        self.assertEqual(model.branching_factor(), model.min_ebf)
+        model.reset()
+        self.assertIsNone(model.branching_factor())
+
+    def test_search_banks_time_when_next_iteration_cannot_finish(self):
+        """A predicted overrun ends the search after the completed iteration."""
+        engine = SlowMateEngine()
+        lines = []
+        engine.uci._out = lines.append
+        engine.iteration_model.predict = lambda: 100.0
+        engine.iteration_model.branching_factor = lambda: 5.0
+        move = engine.search(time_limit_ms=5000)
+        self.assertIn(move, engine.board.get_legal_moves())
+        self.assertEqual(engine.search_report['depth'], 1)
+        self.assertTrue(engine.search_report['stopped_early'])
+        self.assertTrue(any("predicted" in line and "stopping" in line for line in lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+SlowMate Chess Engine - Move List Cache Tests
+Version: 1.0.0-BETA
+"""
+
+import unittest
+import chess
+import chess.polyglot
+
+from slowmate.engine import SlowMateEngine
+from slowmate.search.enhanced import MoveListCache
+
+
+class TestMoveListCache(unittest.TestCase):
+
+    def test_lru_eviction_and_stats(self):
+        """The least recently used entry is evicted; hits and memory are tracked."""
+        cache = MoveListCache(max_entries=2)
+        cache.store(1, ([1, 2, 3], None, False))
+        cache.store(2, ([4], None, False))
+        self.assertIsNotNone(cache.get(1))  # 1 is now the most recent
+        cache.store(3, ([5, 6], None, False))
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3)[0], [5, 6])
+        self.assertEqual((cache.hits, cache.lookups), (2, 3))
+        self.assertEqual(len(cache.entries), 2)
+        self.assertGreater(cache.memory, 0)
+        self.assertIn("hits 2/3", cache.summary())
+        cache.clear()
+        self.assertEqual((len(cache.entries), cache.memory, cache.lookups), (0, 0, 0))
+
+    def test_search_reuses_move_lists(self):
+        """Deeper iterations hit the cache without changing the result."""
+        engine = SlowMateEngine()
+        lines = []
+        engine.uci._out = lines.append
+        move = engine.search(time_limit_ms=60000, depth_override=4)
+        self.assertIn(move, engine.board.get_legal_moves())
+        self.assertGreater(engine.move_cache.hits, 0)
+        self.assertTrue(any("movecache hits" in line for line in lines))
+        self.assertEqual(engine.board.zobrist, chess.polyglot.zobrist_hash(engine.board.board))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+SlowMate Chess Engine - Move Overhead Tests
+Version: 1.0.0-BETA
+"""
+
+import time
+import unittest
+
+from slowmate.core.time_manager import MoveOverheadTracker
+from slowmate.engine import SlowMateEngine
+
+
+class TestMoveOverhead(unittest.TestCase):
+
+    def test_rolling_percentile(self):
+        """Only latency beyond the allocation counts, as a rolling percentile."""
+        tracker = MoveOverheadTracker(base_ms=10, window=4, percentile=75)
+        self.assertEqual(tracker.overhead_ms(), 10)
+        self.assertIsNone(tracker.finish(100))  # No go stamped
+        for _ in range(4):
+            tracker.start()
+            tracker.finish(allocated_ms=-20.0)  # Pretend 20ms beyond the budget
+        self.assertGreaterEqual(tracker.measured_ms(), 20.0)
+        tracker.start()
+        tracker.finish()  # Untimed: latency statistics only
+        self.assertEqual(len(tracker.overshoots), 4)
+        self.assertEqual(len(tracker.latencies), 4)
+        self.assertIn("over 4 moves", tracker.summary())
+
+    def test_option_and_allocation(self):
+        """``setoption name Move Overhead`` shrinks clock-based allocations."""
+        engine = SlowMateEngine()
+        engine.uci._out = lambda message: None
+        before = engine._calculate_time_allocation(60000, 60000, 0, 0, None, None)
+        engine.uci.handle_command("setoption name Move Overhead value 500")
+        self.assertEqual(engine.uci.move_overhead.base_ms, 500)
+        after = engine._calculate_time_allocation(60000, 60000, 0, 0, None, None)
+        self.assertAlmostEqual(before - after, 0.49, places=2)
+        # movetime is not reduced
+        self.assertEqual(engine._calculate_time_allocation(None, None, None, None, None, 300), 0.3)
+
+    def test_go_reports_latency(self):
+        """A clock-based ``go`` searches and reports its latency before bestmove."""
+        engine = SlowMateEngine()
+        lines = []
+        engine.uci._out = lines.append
+        engine.uci.handle_command("position startpos moves e2e4")
+        engine.uci.handle_command("go wtime 8000 btime 8000 winc 0 binc 0")
+        deadline = time.time() + 10
+        while not any(line.startswith("bestmove") for line in lines) and time.time() < deadline:
+            time.sleep(0.01)
+        bestmove = [line for line in lines if line.startswith("bestmove")]
+        self.assertEqual(len(bestmove), 1)
+        self.assertTrue(lines[lines.index(bestmove[0]) - 1].startswith("info string latency"))
+        self.assertTrue(any(line.startswith("info depth") for line in lines))
+        self.assertEqual(len(engine.uci.move_overhead.overshoots), 1)
+
+    def test_clock_runs_from_go(self):
+        """Time spent waiting for the previous search counts against the go."""
+        engine = SlowMateEngine()
+        lines = []
+        engine.uci._out = lines.append
+        engine.uci._wait_for_search = lambda: time.sleep(0.5)  # A search slow to leave
+        engine.uci.handle_command("position startpos moves e2e4")
+        start = time.perf_counter()
+        engine.uci.handle_command("go movetime 300")
+        deadline = time.time() + 10
+        while not any(line.startswith("bestmove") for line in lines) and time.time() < deadline:
+            time.sleep(0.005)
+        self.assertLess(time.perf_counter() - start, 0.65)
+        self.assertGreaterEqual(engine.uci.move_overhead.latencies[0], 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
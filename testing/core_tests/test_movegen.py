@@ -0,0 +1,119 @@
+"""
+SlowMate Chess Engine - Bitboard Move Generator Tests
+Version: 1.0.0-BETA
+"""
+
+import random
+import unittest
+import chess
+
+from slowmate.core.movegen import (BitboardMoveGenerator, MAX_MOVES, INFO_ATTACKER_SHIFT, INFO_CHECK_BIT,
+                                   INFO_MOVE_MASK, INFO_VICTIM_SHIFT, check_info, encode_chess_move,
+                                   gives_check, move_from, move_infos, move_is_capture, move_promotion,
+                                   move_to, to_chess_move)
+
+
+# Perft suite positions with published counts up to depth 3
+PERFT_POSITIONS = [
+    (chess.STARTING_FEN, [20, 400, 8902]),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", [48, 2039, 97862]),
+    ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", [14, 191, 2812]),
+    ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", [6, 264, 9467]),
+    ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", [44, 1486, 62379]),
+]
+
+
+class TestBitboardMoveGenerator(unittest.TestCase):
+    
+    def setUp(self):
+        self.generator = BitboardMoveGenerator()
+    
+    def assert_matches_python_chess(self, board):
+        moves = sorted(to_chess_move(move).uci() for move in self.generator.generate_list(board))
+        self.assertEqual(moves, sorted(move.uci() for move in board.legal_moves), board.fen())
+        
+        captures = sorted(to_chess_move(move).uci() for move in self.generator.generate_list(board, True))
+        self.assertEqual(captures, sorted(move.uci() for move in board.generate_legal_captures()), board.fen())
+        
+        buffer = [0] * MAX_MOVES
+        count = self.generator.generate(board, buffer, legal=False)
+        filtered = sorted(to_chess_move(move).uci() for move in buffer[:count]
+                          if self.generator.is_legal(board, move))
+        self.assertEqual(filtered, moves, board.fen())
+    
+    def test_perft_counts(self):
+        """Perft matches the published node counts."""
+        for fen, counts in PERFT_POSITIONS:
+            for depth, expected in enumerate(counts, 1):
+                self.assertEqual(self.generator.perft(chess.Board(fen), depth), expected, (fen, depth))
+    
+    def test_random_games_match_python_chess(self):
+        """Legal, capture and pseudo-legal + is_legal generation agree with python-chess."""
+        rng = random.Random(11)
+        for _ in range(40):
+            board = chess.Board()
+            while not board.is_game_over() and board.ply() < 160:
+                self.assert_matches_python_chess(board)
+                board.push(rng.choice(list(board.legal_moves)))
+    
+    def test_special_positions(self):
+        """Pins, en passant discovered checks, double check and castling through attack."""
+        for fen in [
+            "8/8/8/KPp4r/8/8/8/7k w - c6 0 2",          # en passant exposes the king on the rank
+            "4k3/8/8/8/1b6/8/3P4/4K3 w - - 0 1",         # pinned pawn
+            "4k3/8/8/8/8/1b6/8/R3K2R w KQ - 0 1",        # bishop covers d1: no queenside castling
+            "4k3/8/8/8/8/8/5r2/R3K2R w KQ - 0 1",        # rook covers f1: no kingside castling
+            "4k3/8/8/8/8/8/8/R3K2r w Q - 0 1",           # in check along the first rank
+            "4k3/8/8/8/4r3/8/3n4/4K3 w - - 0 1",         # double check
+            "r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 1",
+        ]:
+            self.assert_matches_python_chess(chess.Board(fen))
+    
+    def test_move_encoding(self):
+        """Encoded moves decode to the same move and carry their flags."""
+        board = chess.Board("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+        for move in self.generator.generate_list(board):
+            chess_move = to_chess_move(move)
+            self.assertEqual(encode_chess_move(board, chess_move), move)
+            self.assertEqual((move_from(move), move_to(move)), (chess_move.from_square, chess_move.to_square))
+            self.assertEqual(move_is_capture(move), board.is_capture(chess_move))
+            self.assertEqual(move_promotion(move), chess_move.promotion)
+        self.assertEqual(to_chess_move(0), chess.Move.null())
+    
+    def test_gives_check_matches_python_chess(self):
+        """Checking-square masks agree with board.gives_check, including discoveries."""
+        rng = random.Random(38)
+        boards = [chess.Board(fen) for fen in [
+            "4k3/4P3/8/8/8/8/8/4R1K1 w - - 0 1",         # promotion opens the file behind it
+            "k7/2P5/8/8/8/8/8/6BK w - - 0 1",            # promotion off the bishop's diagonal
+            "4k3/8/8/8/4N3/8/8/4R1K1 w - - 0 1",         # knight discovered checks
+            "8/8/8/KPp4r/8/8/8/7k w - c6 0 2",
+            "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1",
+        ]]
+        for _ in range(12):
+            board = chess.Board()
+            while not board.is_game_over() and board.ply() < 120:
+                boards.append(board.copy(stack=False))
+                board.push(rng.choice(list(board.legal_moves)))
+        for board in boards:
+            info = check_info(board)
+            for move in self.generator.generate_list(board):
+                self.assertEqual(gives_check(board, move, info), board.gives_check(to_chess_move(move)),
+                                 (board.fen(), to_chess_move(move).uci()))
+    
+    def test_move_infos(self):
+        """Move infos carry the move, mover, victim and check flag."""
+        board = chess.Board("4k3/8/8/3pP3/8/2n5/1Q6/4K3 w - d6 0 1")
+        moves = self.generator.generate_list(board)
+        for move, info in zip(moves, move_infos(board, moves, checks=True)):
+            chess_move = to_chess_move(move)
+            self.assertEqual(info & INFO_MOVE_MASK, move)
+            self.assertEqual((info >> INFO_ATTACKER_SHIFT) & 7, board.piece_type_at(chess_move.from_square))
+            victim = board.piece_type_at(chess_move.to_square) or 0
+            self.assertEqual((info >> INFO_VICTIM_SHIFT) & 7, victim)
+            self.assertEqual(bool(info & INFO_CHECK_BIT), board.gives_check(chess_move))
+        self.assertFalse(any(info & INFO_CHECK_BIT for info in move_infos(board, moves)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,10 +3,12 @@ SlowMate Chess Engine - Move Generation Tests
 Version: 1.0.0-BETA
 """
 
+import random
 import unittest
 import chess
 from slowmate.core.board import Board
 from slowmate.core.moves import MoveGenerator
+from slowmate.core.movegen import to_chess_move
 
 class TestMoveGenerator(unittest.TestCase):
     def setUp(self):
@@ -77,6 +79,23 @@ class TestMoveGenerator(unittest.TestCase):
         # Queen promotion should be first
         self.assertEqual(first_move.uci(), "e7e8q")
         
+    def test_pseudo_legal_moves_filter_to_legal(self):
+        """Test pseudo-legal moves checked with is_legal match the legal moves."""
+        rng = random.Random(36)
+        for _ in range(20):
+            self.board.set_fen(chess.STARTING_FEN)
+            for _ in range(80):
+                board = self.board.board
+                if board.is_game_over():
+                    break
+                moves, pins = self.move_generator.get_pseudo_legal_moves()
+                legal = {to_chess_move(move) for move in moves if self.move_generator.is_legal(move, pins)}
+                self.assertEqual(legal, set(board.legal_moves), board.fen())
+                captures, pins = self.move_generator.get_pseudo_legal_moves(captures_only=True)
+                legal = {to_chess_move(move) for move in captures if self.move_generator.is_legal(move, pins)}
+                self.assertEqual(legal, {m for m in board.legal_moves if board.is_capture(m)}, board.fen())
+                self.board.make_move(rng.choice(list(board.legal_moves)))
+        
     def is_check_move(self, move):
         """Helper to test if a move gives check."""
         self.board.make_move(move)
@@ -0,0 +1,108 @@
+"""
+SlowMate Chess Engine - NNUE Evaluator Tests
+Version: 1.0.0-BETA
+"""
+
+import os
+import tempfile
+import unittest
+import chess
+
+from slowmate.core.board import Board
+from slowmate.core.enhanced_evaluate import EnhancedEvaluator
+from slowmate.core.eval_tables import QUEEN_TABLE
+from slowmate.core.nnue import Accumulator, NNUEEvaluator, NNUENetwork, np
+from slowmate.engine import SlowMateEngine
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestNNUEEvaluator(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.network = NNUENetwork.bootstrap()
+    
+    def setUp(self):
+        self.evaluator = NNUEEvaluator(network=self.network)
+    
+    def assert_accumulator_fresh(self, board):
+        expected = Accumulator(self.network, board.board).values
+        self.assertTrue((board.nnue.current(board.board) == expected).all(), board.get_fen())
+    
+    def test_incremental_matches_refresh(self):
+        """Castling, en passant, promotion and captures keep the accumulator exact."""
+        board = Board()
+        board.set_fen("r3k2r/1P6/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+        self.evaluator.evaluate(board)
+        for uci in ["e5d6", "e8g8", "e1c1", "f8f7", "b7a8n", "g8h7", "a8b6"]:
+            board.make_move(chess.Move.from_uci(uci))
+            self.evaluator.evaluate(board)
+            self.assert_accumulator_fresh(board)
+        while board.board.move_stack:
+            board.unmake_move()
+            self.assert_accumulator_fresh(board)
+    
+    def test_null_move_and_direct_push(self):
+        """Null moves cost nothing; moves pushed around the wrapper trigger a refresh."""
+        board = Board()
+        score = self.evaluator.evaluate(board)
+        board.make_move(chess.Move.null())
+        self.assertEqual(self.evaluator.evaluate(board), score)
+        board.unmake_move()
+        board.board.push(chess.Move.from_uci("e2e4"))
+        self.evaluator.evaluate(board)
+        self.assert_accumulator_fresh(board)
+    
+    def test_bootstrap_tracks_material(self):
+        """The bootstrap network scores like material + PST (side to move)."""
+        board = Board()
+        self.assertEqual(self.evaluator.evaluate(board), 0)
+        queen = 900 + 0.8 * QUEEN_TABLE[chess.D1]
+        board.set_fen("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
+        self.assertAlmostEqual(self.evaluator.evaluate(board), queen, delta=8)
+        board.set_fen("4k3/8/8/8/8/8/8/3QK3 b - - 0 1")
+        self.assertAlmostEqual(self.evaluator.evaluate(board), -queen, delta=8)
+        self.assertEqual(self.evaluator.evaluate(chess.Board(board.get_fen())),
+                         self.evaluator.evaluate(board))
+    
+    def test_save_and_load(self):
+        """Weights survive a save/load round trip."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'net.npz')
+            self.network.save(path)
+            evaluator = NNUEEvaluator(path)
+            self.assertEqual(evaluator.backend, 'nnue')
+            board = Board()
+            board.set_fen("r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3")
+            self.assertEqual(evaluator.evaluate(board), self.evaluator.evaluate(board))
+    
+    def test_fallback_to_handcrafted(self):
+        """A missing or broken weights file falls back to the handcrafted eval."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            broken = os.path.join(temp_dir, 'broken.npz')
+            np.savez(broken, version=1, feature_bias=np.zeros(4, dtype=np.int16))
+            for path in (os.path.join(temp_dir, 'missing.npz'), broken):
+                evaluator = NNUEEvaluator(path)
+                self.assertEqual(evaluator.backend, 'handcrafted')
+                self.assertIsNotNone(evaluator.load_error)
+                board = Board()
+                self.assertEqual(evaluator.evaluate(board), EnhancedEvaluator().evaluate(board))
+    
+    def test_engine_eval_file_option(self):
+        """The EvalFile UCI option switches backends."""
+        engine = SlowMateEngine()
+        engine.uci._out = lambda message: None
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'net.npz')
+            self.network.save(path)
+            engine.uci.handle_command(f"setoption name EvalFile value {path}")
+            self.assertIsInstance(engine.evaluator, NNUEEvaluator)
+            self.assertEqual(engine.evaluator.backend, 'nnue')
+            engine.set_position("startpos")
+            self.assertIsNotNone(engine.search(time_limit_ms=60000, depth_override=2))
+        engine.uci.handle_command("setoption name EvalFile value <empty>")
+        self.assertIsInstance(engine.evaluator, EnhancedEvaluator)
+
+
+if __name__ == '__main__':
+    unittest.main()
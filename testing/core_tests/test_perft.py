@@ -0,0 +1,48 @@
+"""
+SlowMate Chess Engine - Perft Tool Tests
+Version: 1.0.0-BETA
+"""
+
+import unittest
+import chess
+
+from slowmate.core.board import Board
+from slowmate.tools.perft import GENERATORS, PERFT_POSITIONS, expected_count, perft, run_perft
+
+
+class TestPerftTool(unittest.TestCase):
+
+    def test_generators_match_published_counts(self):
+        """Every generator reproduces the published counts through Board.make_move."""
+        for name, (fen, counts) in PERFT_POSITIONS.items():
+            for generator in GENERATORS:
+                result = run_perft(fen, 2, generator)
+                self.assertEqual(result.nodes, counts[2], (name, generator))
+                self.assertTrue(result.ok)
+
+    def test_bulk_and_parallel_divide(self):
+        """Bulk counting and process-split root moves give the same divide."""
+        fen = PERFT_POSITIONS['kiwipete'][0]
+        serial = run_perft(fen, 2)
+        self.assertEqual(run_perft(fen, 2, bulk=True).divide, serial.divide)
+        self.assertEqual(run_perft(fen, 2, bulk=True, jobs=2).divide, serial.divide)
+        self.assertEqual(len(serial.divide), 48)
+
+    def test_board_restored(self):
+        """make_move/unmake_move leave the board and its accumulators as they were."""
+        board = Board()
+        board.set_fen(PERFT_POSITIONS['position5'][0])
+        before = (board.board.fen(), board.material[:], board.pst_mg[:], board.phase)
+        self.assertEqual(perft(board, 2), 1486)
+        self.assertEqual((board.board.fen(), board.material, board.pst_mg, board.phase), before)
+
+    def test_expected_count(self):
+        """Known counts are found by position, ignoring move counters."""
+        self.assertEqual(expected_count(chess.STARTING_FEN, 3), 8902)
+        self.assertEqual(expected_count(chess.STARTING_FEN.replace(" 0 1", " 4 9"), 2), 400)
+        self.assertIsNone(expected_count("4k3/8/8/8/8/8/8/4K3 w - - 0 1", 2))
+        self.assertIsNone(run_perft("4k3/8/8/8/8/8/8/4K3 w - - 0 1", 2).ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+SlowMate Chess Engine - Incremental Position Command Tests
+Version: 1.0.0-BETA
+"""
+
+import unittest
+from unittest import mock
+
+import chess
+import chess.polyglot
+
+from slowmate.engine import SlowMateEngine
+
+GAME = "e2e4 e7e5 g1f3 b8c6 f1b5 a7a6 b5a4 g8f6 e1g1 f8e7".split()
+
+
+class TestPositionUpdates(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.engine.uci._out = lambda message: None
+
+    def _position(self, base, moves):
+        command = f"position {base}" + (" moves " + " ".join(moves) if moves else "")
+        with mock.patch.object(self.engine, 'set_position', wraps=self.engine.set_position) as setup:
+            self.engine.uci.handle_command(command)
+        return setup.call_count
+
+    def _expected(self, base, moves):
+        board = chess.Board() if base == "startpos" else chess.Board(base[len("fen "):])
+        for move in moves:
+            board.push_uci(move)
+        return board
+
+    def test_extension_plays_only_new_moves(self):
+        """One or two more moves reuse the board; the result equals a full setup."""
+        self.assertEqual(self._position("startpos", GAME[:4]), 1)
+        for ply in (5, 7, 8, 8):
+            self.assertEqual(self._position("startpos", GAME[:ply]), 0)
+            board = self.engine.board
+            self.assertEqual(board.board.fen(), self._expected("startpos", GAME[:ply]).fen())
+            self.assertEqual(board.zobrist, chess.polyglot.zobrist_hash(board.board))
+
+    def test_divergence_rebuilds(self):
+        """A different line, base or a new game set the position up again."""
+        self._position("startpos", GAME[:6])
+        self.assertEqual(self._position("startpos", GAME[:3] + ["f8c5"]), 1)
+        self.assertEqual(self.engine.board.board.fen(),
+                         self._expected("startpos", GAME[:3] + ["f8c5"]).fen())
+        self.assertEqual(self._position("startpos", GAME[:2]), 1)  # Takeback
+        fen = "fen 4k3/8/8/8/8/8/4P3/4K3 w - - 0 1"
+        self.assertEqual(self._position(fen, ["e2e4"]), 1)
+        self.assertEqual(self._position(fen, ["e2e4", "e8d7"]), 0)
+        self.engine.uci.handle_command("ucinewgame")
+        self.assertEqual(self._position(fen, ["e2e4", "e8d7"]), 1)
+
+    def test_search_leaves_board_reusable(self):
+        """After a go the next position command still extends the game."""
+        self._position("startpos", GAME[:2])
+        self.engine.search(depth_override=2)
+        self.assertEqual(self._position("startpos", GAME[:4]), 0)
+        self.assertEqual(self.engine.board.board.fen(), self._expected("startpos", GAME[:4]).fen())
+
+    def test_illegal_move_stops_replay(self):
+        """Moves after an illegal one are ignored, as before."""
+        self._position("startpos", ["e2e4", "e2e4", "e7e5"])
+        self.assertEqual([m.uci() for m in self.engine.board.board.move_stack], ["e2e4"])
+        self.assertEqual(self._position("startpos", ["e2e4", "e7e5"]), 0)
+        self.assertEqual(len(self.engine.board.board.move_stack), 2)
+        with self.assertRaises(ValueError):
+            self.engine.make_move(chess.Move.from_uci("e1e3"))
+
+    def test_moves_are_checked_once(self):
+        """The protocol's is_legal check is the only one per replayed move."""
+        with mock.patch.object(self.engine, 'make_move') as engine_move, \
+                mock.patch.object(chess.Board, 'is_legal', autospec=True,
+                                  side_effect=chess.Board.is_legal) as is_legal:
+            self._position("startpos", GAME[:4])
+        engine_move.assert_not_called()
+        self.assertEqual(is_legal.call_count, 4)
+        self.assertEqual(len(self.engine.board.board.move_stack), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+SlowMate Chess Engine - Search Worker Process Tests
+Version: 1.0.0-BETA
+"""
+
+import threading
+import time
+import unittest
+
+from slowmate.engine import SlowMateEngine
+
+
+class TestSearchWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.lines = []
+        self.lock = threading.Lock()
+
+        def out(line):
+            with self.lock:
+                self.lines.append(line)
+
+        self.engine.uci._out = out
+        self.engine.uci.handle_command("setoption name SearchProcess value true")
+        self.addCleanup(self.engine.uci.handle_command, "quit")
+        self.assertTrue(self._wait_for("info string search process ready"))
+
+    def _wait_for(self, prefix, count=1, timeout=20.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self.lock:
+                if sum(line.startswith(prefix) for line in self.lines) >= count:
+                    return True
+            time.sleep(0.005)
+        return False
+
+    def _bestmoves(self):
+        with self.lock:
+            return [line for line in self.lines if line.startswith("bestmove")]
+
+    def test_worker_searches_position(self):
+        """A depth-limited go is searched in the child and answered once."""
+        self.engine.uci.handle_command("position startpos moves e2e4 e7e5")
+        self.engine.uci.handle_command("go depth 2")
+        self.assertTrue(self._wait_for("bestmove"))
+        time.sleep(0.1)
+        bestmove = self._bestmoves()
+        self.assertEqual(len(bestmove), 1)
+        self.assertNotEqual(bestmove[0], "bestmove 0000")
+        self.assertTrue(any(line.startswith("info depth") for line in self.lines))
+        self.assertGreater(self.engine.nodes, 0)
+
+    def test_stop_and_isready_while_searching(self):
+        """The I/O process answers isready and stop promptly during a search."""
+        self.engine.uci.handle_command("position startpos")
+        self.engine.uci.handle_command("go infinite")
+        time.sleep(0.3)
+        start = time.perf_counter()
+        self.engine.uci.handle_command("isready")
+        self.assertTrue(self._wait_for("readyok", timeout=1.0))
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+        start = time.perf_counter()
+        self.engine.uci.handle_command("stop")
+        self.assertTrue(self._wait_for("bestmove", timeout=1.0))
+        self.assertLess(time.perf_counter() - start, 0.5)
+        time.sleep(0.3)
+        self.assertEqual(len(self._bestmoves()), 1)
+
+        # The worker keeps serving later searches
+        self.engine.uci.handle_command("go depth 1")
+        self.assertTrue(self._wait_for("bestmove", count=2))
+
+    def test_child_allocates_with_the_parent_move_overhead(self):
+        """Move Overhead is set in the parent but spent by the child's search."""
+        self.engine.uci.handle_command("setoption name Move Overhead value 5000")
+        self.engine.uci.handle_command("position startpos")
+        self.engine.uci.handle_command("go wtime 60000 btime 60000")
+        self.assertTrue(self._wait_for("bestmove", timeout=5.0))
+        self.assertLessEqual(self.engine.search_report['hard_ms'], 10)
+
+    def test_overshoot_is_measured_against_the_child_budget(self):
+        """A timed answer from the child feeds the measured move overhead."""
+        self.engine.uci.handle_command("position startpos")
+        self.engine.uci.handle_command("go movetime 100")
+        self.assertTrue(self._wait_for("bestmove", timeout=5.0))
+        overhead = self.engine.uci.move_overhead
+        self.assertEqual(len(overhead.overshoots), 1)
+        self.assertAlmostEqual(overhead.overshoots[0],
+                               max(0.0, overhead.latencies[0] - 100), places=3)
+
+    def test_best_move_is_tagged_with_its_go(self):
+        """The shared best move is read for its own go only."""
+        self.engine.uci.handle_command("position startpos")
+        self.engine.uci.handle_command("go infinite")
+        self.assertTrue(self._wait_for("info depth", timeout=5.0))
+        worker, go_id = self.engine.uci.worker, self.engine.uci._go_id
+        self.assertNotEqual(worker.best_move_for(go_id), 0)
+        self.assertEqual(worker.best_move_for(go_id - 1), 0)
+        self.engine.uci.handle_command("stop")
+        self.assertTrue(self._wait_for("bestmove", timeout=1.0))
+
+    def test_stop_before_the_child_starts(self):
+        """A stop right after go is not lost: the child does not search on."""
+        self.engine.uci.handle_command("position startpos")
+        self.engine.uci.handle_command("go infinite")
+        self.engine.uci.handle_command("stop")
+        self.assertTrue(self._wait_for("bestmove", timeout=1.0))
+        time.sleep(0.5)
+        first = self._bestmoves()[0]
+        with self.lock:
+            after = self.lines[self.lines.index(first) + 1:]
+        self.assertFalse([line for line in after if line.startswith("info depth")])
+        self.assertEqual(len(self._bestmoves()), 1)
+
+        start = time.perf_counter()
+        self.engine.uci.handle_command("position startpos moves e2e4")
+        self.engine.uci.handle_command("go depth 1")
+        self.assertTrue(self._wait_for("bestmove", count=2, timeout=2.0))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIn(self._bestmoves()[1].split()[1],
+                      {move.uci() for move in self.engine.board.board.legal_moves})
+
+
+if __name__ == '__main__':
+    unittest.main()
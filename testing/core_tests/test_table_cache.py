@@ -0,0 +1,90 @@
+"""
+SlowMate Chess Engine - Table Cache Tests
+Version: 1.0.0-BETA
+"""
+
+import os
+import struct
+import tempfile
+import unittest
+from unittest import mock
+import chess
+
+from slowmate.core import table_cache
+from slowmate.core.eval_tables import KING_MIDDLE_TABLE, build_square_tables
+
+
+class TestTableCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.cache_dir.name, table_cache.CACHE_FILENAME)
+    
+    def tearDown(self):
+        self.cache_dir.cleanup()
+    
+    def test_cache_round_trip(self):
+        """Tables loaded from the cache file equal freshly built ones."""
+        tables = table_cache.get_tables(self.cache_dir.name)
+        self.assertEqual(tables.source, 'built')
+        self.assertTrue(os.path.exists(self.path))
+        
+        reloaded = table_cache.get_tables(self.cache_dir.name)
+        self.assertEqual(reloaded.source, 'cache')
+        for name, built in table_cache.build_tables().items():
+            self.assertEqual(list(table_cache.load_cache(self.path)[name]), list(built), name)
+    
+    def test_stale_cache_is_rebuilt(self):
+        """A cache with a different source digest is ignored and rewritten."""
+        table_cache.get_tables(self.cache_dir.name)
+        with open(self.path, 'r+b') as f:
+            f.seek(struct.calcsize('<4sII'))
+            f.write(b'\0' * 20)
+        self.assertIsNone(table_cache.load_cache(self.path))
+        self.assertEqual(table_cache.get_tables(self.cache_dir.name).source, 'built')
+        self.assertIsNotNone(table_cache.load_cache(self.path))
+    
+    def test_cache_is_opt_in(self):
+        """Without a cache directory the tables are built in memory, nothing is written."""
+        with mock.patch.dict(os.environ, {'SLOWMATE_CACHE_DIR': ''}):
+            self.assertIsNone(table_cache.default_cache_dir())
+            with mock.patch.object(table_cache, 'write_cache') as write, \
+                    mock.patch.object(table_cache, '_shared_tables', None):
+                tables = table_cache.get_tables()
+            write.assert_not_called()
+        self.assertEqual(tables.source, 'memory')
+    
+    def test_old_versions_are_removed(self):
+        """Writing the cache deletes other versions and leftover temporary files."""
+        for name in ("slowmate_tables_v1.bin", "slowmate_tables_v2.bin", f"{table_cache.CACHE_FILENAME}.99.tmp"):
+            with open(os.path.join(self.cache_dir.name, name), 'wb') as f:
+                f.write(b'SMTB')
+        table_cache.get_tables(self.cache_dir.name)
+        self.assertEqual(os.listdir(self.cache_dir.name), [table_cache.CACHE_FILENAME])
+    
+    def test_truncated_cache_is_rejected(self):
+        """A truncated file is treated as missing."""
+        with open(self.path, 'wb') as f:
+            f.write(b'SMTB')
+        self.assertIsNone(table_cache.load_cache(self.path))
+    
+    def test_table_contents(self):
+        """Spot-check PSTs, passed pawn masks and slider attacks."""
+        tables = table_cache.TABLES
+        expected = build_square_tables(KING_MIDDLE_TABLE)
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                self.assertEqual(list(tables.pst_mg[color][piece_type]), expected[color][piece_type])
+        
+        self.assertEqual(tables.passed_pawn_masks[chess.WHITE][chess.E4],
+                         (chess.BB_FILE_D | chess.BB_FILE_E | chess.BB_FILE_F) &
+                         (chess.BB_RANK_5 | chess.BB_RANK_6 | chess.BB_RANK_7 | chess.BB_RANK_8))
+        self.assertEqual(tables.passed_pawn_masks[chess.BLACK][chess.A2],
+                         (chess.BB_FILE_A | chess.BB_FILE_B) & chess.BB_RANK_1)
+        self.assertEqual(list(tables.rook_attacks[:2]),
+                         [(chess.BB_RANK_1 | chess.BB_FILE_A) & ~chess.BB_A1,
+                          (chess.BB_B1 | chess.BB_FILE_A) & ~chess.BB_A1])
+
+
+if __name__ == '__main__':
+    unittest.main()
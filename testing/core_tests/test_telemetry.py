@@ -0,0 +1,112 @@
+"""
+SlowMate Chess Engine - Time Telemetry Tests
+Version: 1.0.0-BETA
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+import chess
+
+from slowmate.engine import SlowMateEngine
+from slowmate.tools.telemetry import TelemetryLog, format_summary, load_records, summarize
+
+
+class TestTelemetry(unittest.TestCase):
+
+    def test_log_is_written_by_background_thread(self):
+        """Records queued from any thread all reach the file on close."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "time.jsonl")
+            log = TelemetryLog(path, flush_every=4)
+            for ply in range(10):
+                log.record({'game': 1, 'ply': ply})
+            log.close()
+            self.assertEqual([r['ply'] for r in load_records([path])], list(range(10)))
+            self.assertEqual(log.written, 10)
+
+    def test_unwritable_path_is_reported(self):
+        """An unwritable TelemetryFile fails at setoption, not in the writer thread."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "missing", "time.jsonl")
+            with self.assertRaises(OSError):
+                TelemetryLog(path)
+            engine = SlowMateEngine()
+            lines = []
+            engine.uci._out = lines.append
+            engine.uci.handle_command(f"setoption name TelemetryFile value {path}")
+        self.assertIsNone(engine.uci.telemetry)
+        self.assertTrue(lines[-1].startswith("info string telemetry not started"))
+
+    def test_go_records_search(self):
+        """A timed go writes one record with clocks, limits and iterations."""
+        engine = SlowMateEngine()
+        lines = []
+        engine.uci._out = lines.append
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "time.jsonl")
+            engine.uci.handle_command(f"setoption name TelemetryFile value {path}")
+            engine.uci.handle_command("ucinewgame")
+            engine.uci.handle_command("position startpos moves e2e4 e7e5")
+            engine.uci.handle_command("go wtime 3000 btime 3000 winc 100 binc 100")
+            deadline = time.time() + 10
+            while not any(line.startswith("bestmove") for line in lines) and time.time() < deadline:
+                time.sleep(0.01)
+            engine.uci.handle_command("setoption name TelemetryFile value <empty>")
+            records = load_records([path])
+
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertEqual((record['game'], record['ply'], record['side']), (1, 2, 'w'))
+        self.assertEqual(record['clocks']['wtime'], 3000)
+        self.assertLessEqual(record['soft_ms'], record['hard_ms'])
+        self.assertGreaterEqual(record['depth'], 1)
+        self.assertEqual(len(record['iterations']), record['depth'])
+        self.assertGreater(record['used_ms'], 0)
+        self.assertTrue(0.0 <= record['complexity'] <= 1.0)
+
+        summary = summarize(records + [dict(record, ply=70, used_ms=record['used_ms'] * 2)])
+        self.assertEqual(summary['timed'], 2)
+        self.assertEqual(set(summary['phases']), {'opening', 'endgame'})
+        self.assertIn("soft limit used", format_summary(summary))
+
+    def test_record_describes_its_go(self):
+        """Root and report come from the go, not from the board mid-search."""
+        engine = SlowMateEngine()
+        lines, records = [], []
+        engine.uci._out = lines.append
+        engine.uci.handle_command("position startpos moves e2e4")
+        engine.search_report = {'depth': 9}  # Left over from an earlier go
+
+        def search(**kwargs):
+            engine.board.board.push(chess.Move.from_uci("e7e5"))  # Deep in the tree
+            records.append(engine.uci._telemetry_record("e7e5", 1.0, {}))
+            engine.board.board.pop()
+            return chess.Move.from_uci("e7e5")
+
+        engine.search = search
+        engine.uci.handle_command("go depth 1")
+        deadline = time.time() + 5
+        while not any(line.startswith("bestmove") for line in lines) and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual((records[0]['ply'], records[0]['side']), (1, 'b'))
+        self.assertNotIn('depth', records[0])
+
+    def test_summary_skips_emergency_complexity(self):
+        """Emergency records (no complexity estimate) still summarize."""
+        record = {'game': 1, 'ply': 30, 'used_ms': 40.0, 'soft_ms': 30, 'hard_ms': 50,
+                  'depth': 2, 'iterations': [[1, 10, 20, 0], [2, 35, 90, 1]]}
+        records = [dict(record, complexity=0.4), dict(record, complexity=0.6, used_ms=45.0),
+                   dict(record, complexity=0.8, used_ms=60.0),
+                   dict(record, complexity=None, emergency=True, used_ms=5.0)]
+        summary = summarize(records)
+        self.assertEqual(summary['timed'], 4)
+        self.assertAlmostEqual(summary['phases']['middlegame']['complexity_mean'], 0.6)
+        self.assertGreater(summary['complexity_time_correlation'], 0.9)
+        self.assertIn("complexity 0.60", format_summary(summary))
+
+
+if __name__ == '__main__':
+    unittest.main()
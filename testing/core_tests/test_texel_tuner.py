@@ -0,0 +1,97 @@
+"""
+SlowMate Chess Engine - Texel Tuner Tests
+Version: 1.0.0-BETA
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import chess
+
+try:
+    import numpy as np
+    from slowmate.tuning import texel
+except ImportError:  # NumPy is optional
+    np = None
+
+from slowmate.core.board import Board
+from slowmate.core.enhanced_evaluate import EnhancedEvaluator
+
+
+GAMES_PGN = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                         'games', 'slowmate_tournament_20250720_1104.pgn')
+
+
+def white_score(evaluator, board):
+    score = evaluator.evaluate(board)
+    return score if board.board.turn == chess.WHITE else -score
+
+
+@unittest.skipIf(np is None, "NumPy not installed")
+class TestTexelTuner(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.positions = texel.extract_positions(GAMES_PGN)[:120]
+    
+    def test_quiet_position_filter(self):
+        """Checks and hanging pieces are not quiet."""
+        self.assertTrue(texel.is_quiet(chess.Board()))
+        self.assertFalse(texel.is_quiet(chess.Board("4k3/8/8/8/8/8/8/4R1K1 b - - 0 1")))
+        self.assertFalse(texel.is_quiet(chess.Board("4k3/8/8/3q4/4P3/8/8/6K1 w - - 0 1")))
+        self.assertGreater(len(self.positions), 0)
+        for fen, result in self.positions:
+            self.assertIn(result, (0.0, 0.5, 1.0))
+            self.assertFalse(chess.Board(fen).is_check())
+    
+    def test_weights_file_matches_linear_model(self):
+        """Loading written parameters changes the evaluation exactly as the model predicts."""
+        base = EnhancedEvaluator()
+        theta = texel.evaluator_parameters(base)
+        rng = np.random.default_rng(7)
+        tuned_theta = theta + rng.integers(-15, 16, size=theta.shape)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'weights.json')
+            texel.write_weights(path, tuned_theta, base.weights)
+            tuned = EnhancedEvaluator()
+            tuned.load_weights(path)
+        self.assertFalse(tuned.use_board_accumulators)
+        
+        base_tables, base_pawns = texel.effective_weights(theta, base.weights)
+        tuned_tables, tuned_pawns = texel.effective_weights(tuned_theta, base.weights)
+        board = Board()
+        for fen, _ in self.positions[:40]:
+            board.set_fen(fen)
+            tables, pawns = texel.position_features(base, board.board)
+            rest = white_score(base, board) - (tables @ base_tables + pawns @ base_pawns)
+            predicted = tables @ tuned_tables + pawns @ tuned_pawns + rest
+            self.assertAlmostEqual(white_score(tuned, board), predicted, places=2)
+    
+    def test_default_weights_keep_accumulators(self):
+        """A weights file holding the defaults leaves the fast path enabled."""
+        evaluator = EnhancedEvaluator()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'weights.json')
+            texel.write_weights(path, texel.evaluator_parameters(evaluator), evaluator.weights)
+            evaluator.load_weights(path)
+            self.assertTrue(evaluator.use_board_accumulators)
+            
+            with open(path, 'w') as f:
+                json.dump({'format': 'something-else', 'version': 1}, f)
+            with self.assertRaises(ValueError):
+                evaluator.load_weights(path)
+    
+    def test_tuning_reduces_loss(self):
+        """A few iterations on a small set lower the loss."""
+        with texel.TexelTuner(self.positions, workers=1) as tuner:
+            k = tuner.fit_scaling(iterations=10)
+            before = tuner.loss(tuner.theta, k)
+            theta = tuner.tune(k, iterations=10)
+            self.assertLess(tuner.loss(theta, k), before)
+            self.assertGreater(tuner.positions_per_second_per_core(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
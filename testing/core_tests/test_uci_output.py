@@ -0,0 +1,73 @@
+"""
+SlowMate Chess Engine - UCI Output Thread Tests
+Version: 1.0.0-BETA
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from slowmate.engine import SlowMateEngine
+from slowmate.search.enhanced import TranspositionTable
+
+
+class TestUCIOutput(unittest.TestCase):
+
+    def test_writer_thread_keeps_order_and_logs(self):
+        """Lines reach stdout in order; debug lines go to the buffered log."""
+        engine = SlowMateEngine()
+        uci = engine.uci
+        stdout = io.StringIO()
+        with tempfile.TemporaryDirectory() as directory, mock.patch.object(sys, 'stdout', stdout):
+            uci.debug_log_path = os.path.join(directory, "debug.log")
+            uci.handle_command("debug on")
+            uci.handle_command("isready")
+            for n in range(200):
+                uci._out(f"info string line {n}")
+            self.assertTrue(uci.flush_output())
+            with open(uci.debug_log_path) as f:
+                log = f.read().splitlines()
+            uci._debug_log.close()
+
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(lines[-200:], [f"info string line {n}" for n in range(200)])
+        self.assertIn("readyok", lines)
+        self.assertIn("IN: isready", log)
+        self.assertIn("OUT: readyok", log)
+        self.assertTrue(any(line.startswith("DEBUG: Debug mode: ON") for line in log))
+
+    def test_periodic_info_is_rate_limited(self):
+        """currmove/nodes lines carry nps and hashfull, at most ~10 per second."""
+        engine = SlowMateEngine()
+        lines = []
+        engine.uci._out = lambda line: lines.append((time.perf_counter(), line))
+        start = time.perf_counter()
+        engine.search(time_limit_ms=1200)
+        elapsed = time.perf_counter() - start
+        periodic = [(stamp, line) for stamp, line in lines
+                    if line.startswith("info") and " pv " not in line and "string" not in line]
+        self.assertTrue(periodic)
+        self.assertLessEqual(len(periodic), int(elapsed / engine.uci.info_interval) + 1)
+        for earlier, later in zip(periodic, periodic[1:]):
+            self.assertGreaterEqual(later[0] - earlier[0], engine.uci.info_interval * 0.9)
+        for _, line in periodic:
+            self.assertIn(" nps ", line)
+            self.assertIn(" hashfull ", line)
+        currmove = [line for _, line in periodic if "currmove" in line]
+        self.assertTrue(all(" currmovenumber " in line for line in currmove))
+        self.assertTrue(any(" hashfull " in line for _, line in lines if " pv " in line))
+
+    def test_hashfull_permille(self):
+        table = TranspositionTable(size_mb=1)
+        self.assertEqual(table.hashfull(), 0)
+        for key in range(table.size // 2):
+            table.store(key, 1, 0, None)
+        self.assertEqual(table.hashfull(), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
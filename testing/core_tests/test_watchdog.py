@@ -0,0 +1,85 @@
+"""
+SlowMate Chess Engine - Bestmove Watchdog Tests
+Version: 1.0.0-BETA
+"""
+
+import time
+import unittest
+
+from slowmate.core.movegen import encode_chess_move
+from slowmate.engine import SlowMateEngine
+
+
+class TestWatchdog(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = SlowMateEngine()
+        self.lines = []
+        self.engine.uci._out = self.lines.append
+        self.engine.uci.handle_command("position startpos")
+
+    def _stuck_search(self, seconds: float, shared: str):
+        """A search that publishes a best move, then ignores stop for ``seconds``."""
+        def search(time_limit_ms=None, depth_override=None, **clocks):
+            move = self.engine.board.board.parse_uci(shared)
+            self.engine.best_move_so_far = encode_chess_move(self.engine.board.board, move)
+            time.sleep(seconds)  # Slow eval / GC pause: no stop checks
+            return self.engine.board.board.parse_uci("a2a3")
+        self.engine.search = search
+
+    def _bestmoves(self):
+        return [line for line in self.lines if line.startswith("bestmove")]
+
+    def test_hard_limit_answers_from_shared_state(self):
+        """The watchdog answers at movetime + margin; the late result is dropped."""
+        self._stuck_search(0.6, "g1f3")
+        start = time.time()
+        self.engine.uci.handle_command("go movetime 100")
+        while not self._bestmoves() and time.time() - start < 2:
+            time.sleep(0.005)
+        self.assertLess(time.time() - start, 0.45)
+        self.assertEqual(self._bestmoves(), ["bestmove g1f3"])
+        self.assertTrue(self.engine.uci.stop_requested)
+        self.engine.uci.search_thread.join(2)
+        self.assertEqual(self._bestmoves(), ["bestmove g1f3"])  # Exactly one
+
+    def test_stop_answers_within_grace(self):
+        """``stop`` on an unresponsive infinite search still yields one bestmove."""
+        self._stuck_search(0.5, "e2e4")
+        self.engine.uci.handle_command("go infinite")
+        time.sleep(0.05)
+        start = time.time()
+        self.engine.uci.handle_command("stop")
+        self.assertLess(time.time() - start, 0.3)
+        self.assertEqual(self._bestmoves(), ["bestmove e2e4"])
+        self.engine.uci.search_thread.join(2)
+        self.assertEqual(self._bestmoves(), ["bestmove e2e4"])
+
+    def test_overrunning_search_keeps_its_stop(self):
+        """After an answered stop the board waits for the old search; its event stays set."""
+        self._stuck_search(0.4, "e2e4")
+        self.engine.uci.handle_command("go infinite")
+        time.sleep(0.05)
+        self.engine.uci.handle_command("stop")
+        old_thread, old_event = self.engine.uci.search_thread, self.engine.uci.stop_event
+        self.assertTrue(old_thread.is_alive())
+        self.engine.uci.handle_command("position startpos moves e2e4")
+        self.assertFalse(old_thread.is_alive())  # position waited for it
+        self.assertEqual(len(self.engine.board.board.move_stack), 1)
+        del self.engine.search  # The real search for the next go
+        self.engine.uci.handle_command("go depth 1")
+        self.assertIsNot(self.engine.uci.stop_event, old_event)
+        self.assertTrue(old_event.is_set())
+        self.engine.uci.search_thread.join(5)
+        self.assertEqual(len(self._bestmoves()), 2)
+
+    def test_normal_search_answers_once(self):
+        self.engine.uci.handle_command("go movetime 200")
+        self.engine.uci.search_thread.join(5)
+        time.sleep(0.35)  # Past the watchdog's limit
+        self.assertEqual(len(self._bestmoves()), 1)
+        self.assertNotIn("watchdog", " ".join(self.lines))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ import chess
 import unittest
 
 from slowmate.engine import SlowMateEngine
+from slowmate.core.movegen import to_chess_move
 
 class TestEngineSearchBasic(unittest.TestCase):
     def setUp(self):
@@ -20,6 +21,15 @@ class TestEngineSearchBasic(unittest.TestCase):
         self.assertIsNotNone(move, "Engine failed to produce a move from start position")
         self.assertTrue(move in self.engine.board.get_legal_moves(), "Returned move is not legal")
 
+    def test_moves_encoded_inside_search(self):
+        # Search works on encoded ints; only the returned move is a chess.Move
+        move = self.engine.search(time_limit_ms=10000, depth_override=2)
+        self.assertIsInstance(move, chess.Move)
+        self.assertTrue(all(isinstance(pv_move, int) for pv_move in self.engine.current_pv))
+        self.assertEqual(to_chess_move(self.engine.current_pv[0]), move)
+        entry = next(iter(self.engine.tt.table.values()))
+        self.assertIsInstance(entry.move, int)
+
     def test_negamax_int_return(self):
         score = self.engine._negamax(1, -30000, 30000)
         self.assertIsInstance(score, int, "Negamax should return int score")
@@ -27,5 +37,69 @@ class TestEngineSearchBasic(unittest.TestCase):
         self.assertGreater(score, -30000)
         self.assertLess(score, 30000)
 
+    def test_search_detects_checkmate(self):
+        # Black to move is checkmated: the search scores it from the empty move list
+        self.engine.board.set_fen("k7/1Q6/1K6/8/8/8/8/8 b - - 0 1")
+        self.assertLessEqual(self.engine._negamax(2, -30000, 30000), -19000)
+        self.assertLessEqual(self.engine._quiescence_search(-30000, 30000, 4), -19000)
+
+    def test_search_detects_stalemate(self):
+        self.engine.board.set_fen("k7/8/1Q6/8/8/8/8/K7 b - - 0 1")
+        self.assertEqual(self.engine._negamax(2, -30000, 30000), 0)
+        self.assertEqual(self.engine._quiescence_search(-30000, 30000, 4), 0)
+
+    def test_v2_2_quiescence_detects_terminals(self):
+        # The v2.2 engine's leaves score stalemate 0 and checkmate as mate
+        from slowmate.engine_v2_2 import SlowMateEngine as SlowMateEngineV22
+        engine = SlowMateEngineV22()
+        engine.board.set_fen("k7/8/1Q6/8/8/8/8/K7 b - - 0 1")
+        self.assertEqual(engine._quiescence_search(-30000, 30000, 0), 0)
+        engine.board.set_fen("k7/1Q6/1K6/8/8/8/8/8 b - - 0 1")
+        self.assertLessEqual(engine._quiescence_search(-30000, 30000, 0), -19000)
+
+    def test_stalemate_with_only_illegal_pseudo_moves(self):
+        # The pinned knight has pseudo-legal moves, but no legal move is ever tried
+        self.engine.board.set_fen("k7/1n6/NK6/3B4/8/8/8/8 b - - 0 1")
+        self.assertEqual(self.engine._negamax(2, -30000, 30000), 0)
+        score, pv = self.engine._negamax_with_pv(2, -30000, 30000)
+        self.assertEqual((score, pv), (0, []))
+
+    def test_interrupted_root_keeps_fully_searched_moves(self):
+        # The third root move is cut off by the deadline: only the first two count
+        calls = []
+        def fake_negamax(depth, alpha, beta):
+            calls.append(depth)
+            if len(calls) == 3:
+                self.engine.uci.stop_requested = True
+            return (-10, []) if len(calls) == 1 else (-50, [])
+        self.engine._negamax_with_pv = fake_negamax
+        self.engine.uci.stop_requested = False
+        moves = self.engine.move_generator.get_encoded_legal_moves()
+        best, score, pv = self.engine._search_depth_with_pv(2, -30000, 30000, moves)
+        self.assertEqual(len(self.engine.root_scores), 2)
+        self.assertEqual((score, pv), (50, [best]))
+        self.assertEqual(self.engine.best_move_changes, 1)
+        self.assertEqual(len(self.engine.tt.table), 0)  # Partial iteration not stored
+
+    def test_partial_iteration_improvement_is_played(self):
+        # Depth 2 is interrupted after another move beat the depth-1 best
+        real = self.engine._search_depth_with_pv
+        def fake_depth(depth, alpha, beta, moves):
+            best, score, pv = real(depth, alpha, beta, moves)
+            if depth < 2:
+                return best, score, pv
+            other = next(move for move in moves if move != self.engine.current_pv[0])
+            self.engine.root_scores = {self.engine.current_pv[0]: -100, other: 40}
+            self.engine.uci.stop_requested = True
+            return other, 40, [other]
+        self.engine._search_depth_with_pv = fake_depth
+        lines = []
+        self.engine.uci._out = lines.append
+        move = self.engine.search(time_limit_ms=60000, depth_override=3)
+        self.assertEqual(self.engine.search_report['depth'], 1)
+        self.assertEqual(self.engine.search_report['partial_depth'], 2)
+        self.assertEqual(to_chess_move(self.engine.current_pv[0]), move)
+        self.assertTrue(any(line.startswith("info string partial depth 2") for line in lines))
+
 if __name__ == '__main__':
     unittest.main()